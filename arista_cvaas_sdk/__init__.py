@@ -0,0 +1,98 @@
+"""
+Arista CloudVision as a Service (CVaaS) SDK.
+
+Public names are resolved from their submodules on first access, so `import arista_cvaas_sdk` is cheap
+and heavy dependencies (pandas, tqdm, pybatfish, pyarrow, numpy) are only imported by the functionality that needs them.
+"""
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+_LAZY_ATTRIBUTES = {
+    'AristaCVAAS': 'client',
+    'DependencyTracker': 'client',
+    'ParsedResponse': 'responses',
+    'iter_json_array': 'responses',
+    'ResponseCache': 'cache',
+    'MemoryCacheBackend': 'cache',
+    'DiskCacheBackend': 'cache',
+    'TransferStats': 'transport',
+    'LatencyStats': 'transport',
+    'Tracer': 'tracing',
+    'NoOpTracer': 'tracing',
+    'OpenTelemetryTracer': 'tracing',
+    'InMemorySpanExporter': 'tracing',
+    'Span': 'tracing',
+    'CostPlanner': 'planner',
+    'CostPlan': 'planner',
+    'BudgetExceeded': 'planner',
+    'ConfigletBulkWriter': 'bulk',
+    'ConfigletDirectorySync': 'sync',
+    'TaskWatcher': 'tasks',
+    'TaskEvent': 'tasks',
+    'ResourceSubscriber': 'subscriptions',
+    'ResourceChange': 'subscriptions',
+    'LocalResourceStream': 'testing',
+    'FleetJobRunner': 'jobs',
+    'JobAborted': 'jobs',
+    'TenantExporter': 'export',
+    'ConfigletCorpus': 'corpus',
+    'ConfigletSimilarity': 'similarity',
+    'ConfigletResolver': 'resolver',
+    'Change': 'diff',
+    'SubtreeHasher': 'diff',
+    'diff_models': 'diff',
+    'TempActionQueue': 'staging',
+    'TopologyImport': 'topology',
+    'read_tenant_export': 'export',
+    'ConfigBlock': 'eos_config',
+    'ConfigTree': 'eos_config',
+    'EOSConfigParser': 'eos_config',
+    'ConfigletHistoryStore': 'history',
+    'InventorySnapshot': 'inventory',
+    'Configlet': 'models',
+    'Device': 'models',
+    'Container': 'models',
+    'TempAction': 'models',
+    'DiffEntry': 'models',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .bulk import ConfigletBulkWriter
+    from .cache import DiskCacheBackend, MemoryCacheBackend, ResponseCache
+    from .client import AristaCVAAS, DependencyTracker
+    from .eos_config import ConfigBlock, ConfigTree, EOSConfigParser
+    from .corpus import ConfigletCorpus
+    from .diff import Change, SubtreeHasher, diff_models
+    from .export import TenantExporter, read_tenant_export
+    from .history import ConfigletHistoryStore
+    from .inventory import InventorySnapshot
+    from .jobs import FleetJobRunner, JobAborted
+    from .models import Configlet, Container, DiffEntry, Device, TempAction
+    from .planner import BudgetExceeded, CostPlan, CostPlanner
+    from .resolver import ConfigletResolver
+    from .responses import ParsedResponse, iter_json_array
+    from .similarity import ConfigletSimilarity
+    from .staging import TempActionQueue
+    from .subscriptions import ResourceChange, ResourceSubscriber
+    from .sync import ConfigletDirectorySync
+    from .tasks import TaskEvent, TaskWatcher
+    from .testing import LocalResourceStream
+    from .topology import TopologyImport
+    from .tracing import InMemorySpanExporter, NoOpTracer, OpenTelemetryTracer, Span, Tracer
+    from .transport import LatencyStats, TransferStats
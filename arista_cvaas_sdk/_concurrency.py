@@ -0,0 +1,106 @@
+import contextvars
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+def map_concurrently(func, items, max_workers: int = 8) -> List[Tuple[Any, Any, Optional[BaseException]]]:
+    """
+    Applies `func` to every item with a bounded thread pool.
+
+    Parameters:
+    - func (Callable): The function to call with each item.
+    - items (Iterable): The items to process.
+    - max_workers (int, optional): The maximum number of concurrent calls. Defaults to 8.
+
+    Returns:
+    - List[Tuple[Any, Any, Optional[BaseException]]]: One (item, result, error) tuple per item, in input order.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    items = list(items)
+    results: List[Tuple[Any, Any, Optional[BaseException]]] = [(item, None, None) for item in items]
+    if not items:
+        return results
+    if len(items) == 1 or max_workers <= 1:
+        # Not worth a thread pool; callers still get the same (item, result, error) contract.
+        for index, item in enumerate(items):
+            try:
+                results[index] = (item, func(item), None)
+            except Exception as exc:
+                results[index] = (item, None, exc)
+        return results
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        # Each call runs in a copy of the caller's context, so tracing spans keep their parent across threads.
+        futures = {executor.submit(contextvars.copy_context().run, func, item): index for index, item in enumerate(items)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = (items[index], future.result(), None)
+            except Exception as exc:
+                results[index] = (items[index], None, exc)
+    return results
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key: the first caller executes the function and every caller
+    that arrives while it is in flight waits for, and receives, the same result (or exception).
+    Nothing is cached once the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Runs `func` unless a call with the same key is already in flight, in which case its result is shared.
+
+        Parameters:
+        - key (Hashable): Identifies identical calls.
+        - func (Callable[[], Any]): The function to execute.
+
+        Returns:
+        - Any: The result of the (possibly shared) call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """Returns how many calls were executed and how many were served from an in-flight call."""
+        with self._lock:
+            return {'executed': self.executed, 'coalesced': self.coalesced, 'in_flight': len(self._calls)}
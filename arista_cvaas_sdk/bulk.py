@@ -0,0 +1,195 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ._concurrency import map_concurrently
+
+if TYPE_CHECKING:
+    from .client import AristaCVAAS
+
+OPERATIONS = ('create', 'update', 'copy', 'append')
+
+
+class ConfigletBulkWriter:
+    """
+    Applies many configlet create, update, copy and append operations in one pass.
+
+    Operations are dicts with an 'op' key:
+    - {'op': 'create', 'name': str, 'config': str}
+    - {'op': 'update', 'target': name or key, 'config': str, 'expected_version': int (optional)}
+    - {'op': 'copy', 'source': name or key, 'name': str (optional, defaults to '<source> copy')}
+    - {'op': 'append', 'source': name or key, 'target': name or key, 'expected_version': int (optional)}
+
+    The whole configlet listing is paged through once to resolve every name and key. Operations that collide
+    (a new name that already exists or is created twice, a configlet written by two operations),
+    reference unknown configlets, or whose target changed since `expected_version`
+    (its `dateTimeInLongFormat`) are rejected before anything is sent. Bodies needed for copies,
+    appends and version checks are fetched concurrently, then writes are submitted with bounded parallelism.
+    """
+
+    def __init__(self, sdk: 'AristaCVAAS', max_workers: int = 8) -> None:
+        self.sdk = sdk
+        self.max_workers = max_workers
+
+    def run(self, operations: List[Dict[str, Any]], dry_run: bool = False,
+            configlet_names_ids: Optional[List[Tuple[str, str]]] = None) -> List[Dict[str, Any]]:
+        """
+        Validates and applies the operations.
+
+        Parameters:
+        - operations (List[Dict[str, Any]]): The operations, see the class docstring.
+        - dry_run (bool, optional): Validate and build the requests without sending any write. Defaults to False.
+        - configlet_names_ids (Optional[List[Tuple[str, str]]], optional): (name, key) pairs the caller has just
+          listed; skips the listing. Defaults to None.
+
+        Returns:
+        - List[Dict[str, Any]]: One row per operation, in input order, with 'index', 'op', 'name', 'key',
+          'status' ('created', 'updated', 'planned', 'conflict', 'not_found', 'invalid', 'stale' or 'error'),
+          'error' and 'response'.
+        """
+        if configlet_names_ids is None:
+            configlet_names_ids = self.sdk.get_configlet_names_ids()
+        if isinstance(configlet_names_ids, dict):
+            raise RuntimeError(f"Unable to list configlets: {configlet_names_ids}")
+        by_identifier: Dict[str, Tuple[str, str]] = {}
+        for name, key in configlet_names_ids:
+            by_identifier[name] = (name, key)
+            by_identifier[key] = (name, key)
+
+        rows = [self._plan(index, operation, by_identifier) for index, operation in enumerate(operations)]
+        self._detect_collisions(rows, by_identifier)
+
+        bodies = self._fetch_bodies(rows)
+        for row in rows:
+            if row['status'] is None:
+                self._build_request(row, bodies)
+
+        pending = [row for row in rows if row['status'] is None]
+        if dry_run:
+            for row in pending:
+                row['status'] = 'planned'
+        else:
+            for row, result, error in map_concurrently(self._submit, pending, self.max_workers):
+                if error is not None:
+                    row['status'], row['error'] = 'error', str(error)
+                elif result.error:
+                    row['status'], row['error'] = 'error', result.error
+                else:
+                    row['status'] = 'created' if row['endpoint'] == '/configlet/addConfiglet.do' else 'updated'
+                    row['response'] = result.data
+                    if row['key'] is None and isinstance(result.data, dict) and isinstance(result.data.get('data'), str):
+                        row['key'] = result.data['data']
+
+        for row in rows:
+            row.pop('endpoint', None)
+            row.pop('body', None)
+            row.pop('_operation', None)
+            row.pop('_source', None)
+        return rows
+
+    @staticmethod
+    def _plan(index: int, operation: Dict[str, Any], by_identifier: Dict[str, Tuple[str, str]]) -> Dict[str, Any]:
+        """Resolves the configlets an operation refers to and records the configlet it will write."""
+        op = operation.get('op')
+        row = {'index': index, 'op': op, 'name': None, 'key': None, 'status': None, 'error': None,
+               'response': None, '_operation': operation, '_source': None}
+        if op not in OPERATIONS:
+            row['status'], row['error'] = 'invalid', f"Unknown operation {op!r}, expected one of {OPERATIONS}"
+            return row
+
+        if op in ('copy', 'append'):
+            source = by_identifier.get(operation.get('source'))
+            if source is None:
+                row['status'], row['error'] = 'not_found', f"Configlet {operation.get('source')} not found"
+                return row
+            row['_source'] = source
+
+        if op == 'create':
+            if not operation.get('name') or operation.get('config') is None:
+                row['status'], row['error'] = 'invalid', "create requires 'name' and 'config'"
+            row['name'] = operation.get('name')
+        elif op == 'copy':
+            row['name'] = operation.get('name') or f"{row['_source'][0]} copy"
+        else:
+            if op == 'update' and operation.get('config') is None:
+                row['status'], row['error'] = 'invalid', "update requires 'config'"
+                return row
+            target = by_identifier.get(operation.get('target'))
+            if target is None:
+                # A key that no longer resolves was deleted (or replaced) since the caller read it.
+                row['status'], row['error'] = 'not_found', f"Configlet {operation.get('target')} not found (stale key?)"
+                return row
+            row['name'], row['key'] = target
+        return row
+
+    @staticmethod
+    def _detect_collisions(rows: List[Dict[str, Any]], by_identifier: Dict[str, Tuple[str, str]]) -> None:
+        """Rejects new names that already exist or repeat, and configlets written by more than one operation."""
+        new_names: Dict[str, int] = {}
+        written_keys: Dict[str, int] = {}
+        for row in rows:
+            if row['status'] is not None:
+                continue
+            if row['op'] in ('create', 'copy'):
+                if row['name'] in by_identifier:
+                    row['status'], row['error'] = 'conflict', f"Configlet {row['name']} already exists"
+                elif row['name'] in new_names:
+                    row['status'], row['error'] = 'conflict', f"Configlet {row['name']} is also created by operation {new_names[row['name']]}"
+                else:
+                    new_names[row['name']] = row['index']
+            else:
+                if row['key'] in written_keys:
+                    row['status'], row['error'] = 'conflict', f"Configlet {row['name']} is also written by operation {written_keys[row['key']]}"
+                else:
+                    written_keys[row['key']] = row['index']
+
+    def _fetch_bodies(self, rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Fetches, concurrently, every configlet whose body or version the pending operations need."""
+        keys = set()
+        for row in rows:
+            if row['status'] is not None:
+                continue
+            if row['_source'] is not None:
+                keys.add(row['_source'][1])
+            if row['op'] == 'append' or (row['op'] == 'update' and row['_operation'].get('expected_version') is not None):
+                keys.add(row['key'])
+
+        bodies = {}
+        for key, configlet, error in map_concurrently(self.sdk.get_configlet_by_id, sorted(keys), self.max_workers):
+            if error is None and isinstance(configlet, dict) and 'config' in configlet:
+                bodies[key] = configlet
+        return bodies
+
+    @staticmethod
+    def _build_request(row: Dict[str, Any], bodies: Dict[str, Dict[str, Any]]) -> None:
+        """Builds the addConfiglet/updateConfiglet request for a validated operation."""
+        operation = row['_operation']
+        needed = [row['_source'][1]] if row['_source'] is not None else []
+        if row['op'] == 'append' or (row['op'] == 'update' and operation.get('expected_version') is not None):
+            needed.append(row['key'])
+        missing = [key for key in needed if key not in bodies]
+        if missing:
+            row['status'], row['error'] = 'error', f"Failed to retrieve configlet details for {', '.join(missing)}"
+            return
+
+        expected_version = operation.get('expected_version')
+        if expected_version is not None and bodies[row['key']].get('dateTimeInLongFormat') != expected_version:
+            row['status'] = 'stale'
+            row['error'] = (f"Configlet {row['name']} changed since version {expected_version} "
+                            f"(now {bodies[row['key']].get('dateTimeInLongFormat')})")
+            return
+
+        if row['op'] == 'create':
+            row['endpoint'], row['body'] = '/configlet/addConfiglet.do', {'config': operation['config'], 'name': row['name']}
+        elif row['op'] == 'copy':
+            row['endpoint'] = '/configlet/addConfiglet.do'
+            row['body'] = {'config': bodies[row['_source'][1]]['config'], 'name': row['name']}
+        elif row['op'] == 'update':
+            row['endpoint'] = '/configlet/updateConfiglet.do'
+            row['body'] = {'config': operation['config'], 'name': row['name'], 'key': row['key']}
+        else:
+            source_name, source_key = row['_source']
+            appended_config = f"{bodies[row['key']]['config']}\n! APPENDED FROM {source_name}\n{bodies[source_key]['config']}"
+            row['endpoint'] = '/configlet/updateConfiglet.do'
+            row['body'] = {'config': appended_config, 'name': row['name'], 'key': row['key']}
+
+    def _submit(self, row: Dict[str, Any]) -> Any:
+        return self.sdk._request_json('POST', row['endpoint'], json=row['body'], compress_body=True)
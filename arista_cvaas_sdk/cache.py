@@ -0,0 +1,273 @@
+import hashlib
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+
+class MemoryCacheBackend:
+    """
+    In-process LRU store of raw response bodies, bounded by the total size of the bodies in bytes.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[str, Tuple[float, bytes]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at < time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def set(self, key: str, body: bytes, ttl: float) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.time() + ttl, body)
+            self.current_bytes += len(body)
+            while self.current_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        _, body = self._entries.pop(key)
+        self.current_bytes -= len(body)
+
+
+class DiskCacheBackend:
+    """
+    On-disk LRU store of raw response bodies, bounded by total size in bytes. Each entry is one file
+    holding its expiry time, its key and the body; recency is tracked through the file modification time,
+    so the cache survives restarts and can be shared by several processes on one host.
+    """
+    _HEADER = struct.Struct('<dI')
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._sizes: Dict[str, int] = {}
+        for name in os.listdir(directory):
+            if name.endswith('.entry'):
+                self._sizes[name] = os.path.getsize(os.path.join(directory, name))
+        self.current_bytes = sum(self._sizes.values())
+
+    def _filename(self, key: str) -> str:
+        return hashlib.sha1(key.encode('utf-8')).hexdigest() + '.entry'
+
+    def _read(self, filename: str) -> Optional[Tuple[float, str, bytes]]:
+        try:
+            with open(os.path.join(self.directory, filename), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        expires_at, key_length = self._HEADER.unpack_from(data)
+        offset = self._HEADER.size
+        key = data[offset:offset + key_length].decode('utf-8')
+        return expires_at, key, data[offset + key_length:]
+
+    def get(self, key: str) -> Optional[bytes]:
+        filename = self._filename(key)
+        entry = self._read(filename)
+        if entry is None or entry[1] != key:
+            return None
+        expires_at, _, body = entry
+        if expires_at < time.time():
+            with self._lock:
+                self._unlink(filename)
+            return None
+        try:
+            os.utime(os.path.join(self.directory, filename))
+        except OSError:
+            pass
+        return body
+
+    def set(self, key: str, body: bytes, ttl: float) -> None:
+        encoded_key = key.encode('utf-8')
+        data = self._HEADER.pack(time.time() + ttl, len(encoded_key)) + encoded_key + body
+        if len(data) > self.max_bytes:
+            return
+        filename = self._filename(key)
+        path = os.path.join(self.directory, filename)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        with self._lock:
+            self.current_bytes += len(data) - self._sizes.get(filename, 0)
+            self._sizes[filename] = len(data)
+            if self.current_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        by_age = sorted(self._sizes, key=lambda name: self._mtime(name))
+        for filename in by_age:
+            if self.current_bytes <= self.max_bytes:
+                break
+            self._unlink(filename)
+            self.evictions += 1
+
+    def _mtime(self, filename: str) -> float:
+        try:
+            return os.path.getmtime(os.path.join(self.directory, filename))
+        except OSError:
+            return 0.0
+
+    def _unlink(self, filename: str) -> None:
+        try:
+            os.remove(os.path.join(self.directory, filename))
+        except OSError:
+            pass
+        self.current_bytes -= self._sizes.pop(filename, 0)
+
+    def delete_prefix(self, prefix: str) -> int:
+        removed = 0
+        with self._lock:
+            for filename in list(self._sizes):
+                entry = self._read(filename)
+                if entry is None or entry[1].startswith(prefix):
+                    self._unlink(filename)
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            for filename in list(self._sizes):
+                self._unlink(filename)
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+
+class ResponseCache:
+    """
+    Cache of raw GET response bodies with per-endpoint TTLs and write invalidation.
+
+    `policies` maps endpoint prefixes (without the service path or query string) to a TTL in seconds; the
+    longest matching prefix wins and endpoints without a policy are never cached. `invalidations` maps
+    write endpoint prefixes to the cached endpoint prefixes they make stale; the client calls `on_write()`
+    for every non-GET request it sends, except read-only lookups sent as POSTs. Bodies are stored undecoded, so every hit returns a fresh object.
+
+    Every lookup, store and invalidation takes a `namespace` that is prepended to the stored key; the client
+    passes its host URL and service path, so clients for different tenants can share one backend without
+    serving each other's bodies or invalidating each other's entries.
+    """
+
+    DEFAULT_POLICIES: Dict[str, float] = {
+        '/cvpInfo/getCvpInfo.do': 3600,
+        '/role/getRoles.do': 900,
+        '/image/getImageBundles.do': 900,
+        '/inventory/containers': 300,
+        '/provisioning/v3/filterTopology.do': 300,
+        '/configlet/getConfiglets.do': 120,
+        '/configlet/getConfigletById.do': 120,
+        '/configlet/getAppliedContainers.do': 120,
+        '/configlet/getAppliedDevices.do': 120,
+        '/inventory/devices': 60,
+    }
+
+    DEFAULT_INVALIDATIONS: Dict[str, List[str]] = {
+        '/configlet/addConfiglet.do': ['/configlet/getConfiglets.do'],
+        '/configlet/updateConfiglet.do': ['/configlet/getConfiglets.do', '/configlet/getConfigletById.do'],
+        '/configlet/deleteConfiglet.do': ['/configlet/'],
+        '/ztp/addTempAction.do': ['/provisioning/v3/filterTopology.do'],
+        '/provisioning/deleteAllTempAction.do': ['/provisioning/v3/filterTopology.do'],
+        '/ztp/saveTopology.do': ['/provisioning/', '/inventory/', '/configlet/getApplied'],
+    }
+
+    def __init__(self, backend: Optional[object] = None, policies: Optional[Dict[str, float]] = None,
+                 invalidations: Optional[Dict[str, List[str]]] = None) -> None:
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.policies = dict(self.DEFAULT_POLICIES if policies is None else policies)
+        self.invalidations = dict(self.DEFAULT_INVALIDATIONS if invalidations is None else invalidations)
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _prefix_lookup(table: Dict[str, object], endpoint: str) -> Optional[object]:
+        path = endpoint.split('?', 1)[0]
+        best = None
+        for prefix in table:
+            if path.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return None if best is None else table[best]
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """Returns the TTL configured for an endpoint, or None if it is not cacheable."""
+        ttl = self._prefix_lookup(self.policies, endpoint)
+        return ttl if ttl else None
+
+    def get(self, endpoint: str, namespace: str = '') -> Optional[bytes]:
+        """Returns the cached body for an endpoint, counting the hit or miss."""
+        body = self.backend.get(namespace + endpoint)
+        with self._lock:
+            if body is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return body
+
+    def set(self, endpoint: str, body: bytes, namespace: str = '') -> None:
+        """Stores a body if the endpoint has a caching policy."""
+        ttl = self.ttl_for(endpoint)
+        if ttl:
+            self.backend.set(namespace + endpoint, body, ttl)
+
+    def invalidate(self, prefix: str = '', namespace: str = '') -> int:
+        """Drops every cached endpoint of `namespace` starting with `prefix` (everything by default)."""
+        removed = self.backend.delete_prefix(namespace + prefix)
+        with self._lock:
+            self.invalidated += removed
+        return removed
+
+    def on_write(self, endpoint: str, namespace: str = '') -> int:
+        """Invalidates the cached endpoints of `namespace` that a write to `endpoint` makes stale."""
+        prefixes = self._prefix_lookup(self.invalidations, endpoint) or []
+        return sum(self.invalidate(prefix, namespace) for prefix in prefixes)
+
+    def stats(self) -> Dict[str, float]:
+        """Returns hit/miss counters, the hit ratio and the backend's size and eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'invalidated': self.invalidated,
+                'evictions': getattr(self.backend, 'evictions', 0),
+                'entries': len(self.backend),
+                'bytes': getattr(self.backend, 'current_bytes', 0),
+            }
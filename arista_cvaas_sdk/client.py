@@ -1,20 +1,44 @@
-import requests
 import re
 import json
 import uuid
 import sys
 import copy
-import pprint as pp
-import tempfile
+import functools
+import inspect
 import os
-import pandas as pd
 import logging
-from json.decoder import JSONDecodeError
-from tqdm import tqdm
-from typing import Any, Dict, List, Tuple, Optional, Union
-from collections import deque
-from requests import Response
+import ipaddress
+import time
 from datetime import datetime
+from urllib.parse import quote
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Optional, Union, Iterable, Iterator
+
+import requests
+from requests import Response
+
+from .eos_config import ConfigTree, EOSConfigParser
+from ._concurrency import SingleFlight, map_concurrently
+from .bulk import ConfigletBulkWriter
+from .corpus import ConfigletCorpus
+from .diff import Change, SubtreeHasher, diff_models, iter_leaves
+from .cache import ResponseCache
+from .history import ConfigletHistoryStore
+from .jobs import FleetJobRunner, is_error_result
+from .models import Configlet, Device
+from .staging import TempActionQueue, configlet_assignment_action, container_add_action, image_assignment_action
+from .sync import ConfigletDirectorySync
+from .tasks import TaskWatcher
+from .responses import ParsedResponse, _json_loads, iter_json_array
+from .tracing import NoOpTracer
+from .transport import LatencyStats, TransferStats, _body_length, compress_json_body
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from .inventory import InventorySnapshot
+    from .planner import CostPlan, CostPlanner
+    from .resolver import ConfigletResolver
+    from .similarity import ConfigletSimilarity
+    from .subscriptions import ResourceSubscriber
 
 
 class DependencyTracker:
@@ -36,7 +60,9 @@ class DependencyTracker:
             print(f'    Dependencies: {", ".join(info["dependencies"]) if info["dependencies"] else "None"}')
             print(f'    Python Version: {info["python_version"]}')
 class AristaCVAAS(DependencyTracker):
-    def __init__(self, host_url: str, token: str, path: str = "/cvpservice", *args) -> None:
+    def __init__(self, host_url: str, token: str, path: str = "/cvpservice", *args, coalesce_requests: bool = True,
+                 cache: Union[bool, ResponseCache, None] = None, compress_request_bodies: bool = False,
+                 tracer: Optional[Any] = None) -> None:
         super().track_dependencies(*args)  # call to track dependencies
         self.host_url = host_url
         self.path = path
@@ -45,19 +71,193 @@ class AristaCVAAS(DependencyTracker):
         self.headers = {
             'Authorization': f'Bearer {self.token}'
         }
-        
-    def _check_response(self, response):
+        self.config_parser = EOSConfigParser()
+        self._inventory_snapshot: Optional['InventorySnapshot'] = None
+        # Identical concurrent GETs share one in-flight request and its decoded result.
+        self.coalesce_requests = coalesce_requests
+        self.single_flight = SingleFlight()
+        # Optional response cache for slowly changing GET endpoints; `cache=True` uses the default policies.
+        self.cache: Optional[ResponseCache] = ResponseCache() if cache is True else (cache or None)
+        # Large configlet bodies are gzipped on upload only when the deployment is known to accept it.
+        self.compress_request_bodies = compress_request_bodies
+        self.transfer_stats = TransferStats()
+        # Observed latency per endpoint family; feeds the dry-run cost planner.
+        self.latency_stats = LatencyStats()
+        # Public helpers and every HTTP request open spans on this tracer; see tracing.Tracer.
+        self.tracer = tracer if tracer is not None else NoOpTracer()
+        self._task_watcher: Optional[TaskWatcher] = None
+        self._similarity: Optional['ConfigletSimilarity'] = None
+        self._configlet_resolver: Optional['ConfigletResolver'] = None
+        # Bumped on every write; derived maps built at an older generation are rebuilt on next use.
+        self._write_generation = 0
+        self._cost_planner: Optional['CostPlanner'] = None
+        self._applied_containers: Optional[Tuple[int, Dict[str, List[str]], Dict[str, List[str]]]] = None
+
+    def _send(self, method: str, endpoint: str, use_path: bool = True, compress_body: bool = False,
+              mutates: Optional[bool] = None, **kwargs: Any) -> Response:
+        """
+        Sends a request to CVaaS with the client's session and authorization headers.
+
+        Parameters:
+        - method (str): The HTTP method.
+        - endpoint (str): The endpoint, appended to host_url (and to path when use_path is True).
+        - use_path (bool, optional): Whether to prefix the endpoint with the service path. Defaults to True.
+        - compress_body (bool, optional): Whether the `json` body may be sent gzip-compressed; only honoured when
+          `compress_request_bodies` is enabled and the body is large enough. Defaults to False.
+        - mutates (Optional[bool], optional): Whether the request changes tenant state, which invalidates cached
+          responses and derived maps. Defaults to True for every method but GET; pass False for read-only POSTs.
+        - **kwargs: Passed through to `requests.Session.request`.
+
+        Returns:
+        - Response: The raw response.
+        """
+        url = self.host_url + (self.path if use_path else '') + endpoint
+        headers = self.headers
+        uncompressed_sent = None
+        if compress_body and self.compress_request_bodies and 'json' in kwargs:
+            compressed = compress_json_body(kwargs['json'])
+            if compressed is not None:
+                del kwargs['json']
+                kwargs['data'], uncompressed_sent = compressed
+                headers = dict(headers, **{'Content-Encoding': 'gzip', 'Content-Type': 'application/json'})
+
+        started = time.perf_counter()
+        if self.tracer.enabled:
+            attributes = {'http.request.method': method, 'url.path': endpoint.split('?', 1)[0], 'url.full': url}
+            with self.tracer.span(f'HTTP {method}', attributes, kind='client') as span:
+                response = self.session.request(method, url, headers=headers, **kwargs)
+                retries = getattr(response.raw, 'retries', None)
+                span.set_attributes({
+                    'http.response.status_code': response.status_code,
+                    'http.request.body.size': _body_length(getattr(getattr(response, 'request', None), 'body', None)),
+                    'http.request.resend_count': len(getattr(retries, 'history', None) or ()),
+                })
+                if not kwargs.get('stream'):
+                    span.set_attribute('http.response.body.size', len(response.content or b''))
+                if response.status_code >= 400:
+                    span.set_status('error')
+        else:
+            response = self.session.request(method, url, headers=headers, **kwargs)
+        self.latency_stats.record(endpoint, time.perf_counter() - started)
+        if not kwargs.get('stream'):
+            self.transfer_stats.record(response, uncompressed_sent=uncompressed_sent)
+        if mutates is None:
+            mutates = method != 'GET'
+        if mutates and use_path:
+            self._write_generation += 1
+            if self.cache is not None:
+                self.cache.on_write(endpoint, self.host_url + self.path)
+        return response
+
+    def _parse_response(self, response: Response) -> ParsedResponse:
+        """
+        Decodes a response body exactly once and classifies it.
+
+        A response is an error when the body is not valid JSON, when CVaaS reports the token as
+        unauthenticated, when the body carries an 'errorCode', or when the status is 4xx/5xx.
+
+        Parameters:
+        - response (Response): The response to decode.
+
+        Returns:
+        - ParsedResponse: The status code, the decoded body and the error payload (None on success).
+        """
+        content = response.content
+        if not content:
+            error = {'error': f'HTTP {response.status_code}', 'original_response': ''} if response.status_code >= 400 else None
+            return ParsedResponse(response.status_code, None, error)
+
         try:
-            json_data = response.json()
-            if isinstance(json_data, dict):
-                if json_data.get('code') == 24 and json_data.get('message') == 'Status unauthenticated':
-                    return json_data
-            elif isinstance(json_data, list):
-                # Handle list response if necessary
-                pass  # or replace with actual handling code
-        except JSONDecodeError:
-            return {'error': 'Invalid JSON response', 'original_response': response.text}
-        return None
+            json_data = _json_loads(content)
+        except ValueError:
+            return ParsedResponse(response.status_code, None, {'error': 'Invalid JSON response', 'original_response': response.text})
+
+        error = None
+        if isinstance(json_data, dict):
+            if json_data.get('code') == 24 and json_data.get('message') == 'Status unauthenticated':
+                error = json_data
+            elif 'errorCode' in json_data:
+                error = json_data
+        if error is None and response.status_code >= 400:
+            error = json_data if isinstance(json_data, dict) else {'error': f'HTTP {response.status_code}', 'original_response': json_data}
+        return ParsedResponse(response.status_code, json_data, error)
+
+    def _request_json(self, method: str, endpoint: str, use_path: bool = True, **kwargs: Any) -> ParsedResponse:
+        """
+        Sends a request and decodes the response once. See `_send` and `_parse_response`.
+
+        When `coalesce_requests` is enabled, identical plain GETs issued concurrently from several threads
+        share a single request; every caller receives the same decoded object, which must be treated as read-only.
+        Plain GETs are also served from `cache` when it has a policy for the endpoint.
+
+        Returns:
+        - ParsedResponse: The status code, the decoded body and the error payload (None on success).
+        """
+        if method == 'GET' and not kwargs:
+            if self.coalesce_requests:
+                key = (method, use_path, endpoint)
+                return self.single_flight.do(key, lambda: self._get_json(endpoint, use_path))
+            return self._get_json(endpoint, use_path)
+        return self._parse_response(self._send(method, endpoint, use_path=use_path, **kwargs))
+
+    def _get_json(self, endpoint: str, use_path: bool = True) -> ParsedResponse:
+        """
+        Performs a plain GET through the response cache, if one is configured.
+
+        Only successful responses are stored, as raw bytes, under the client's host URL and service path; a hit
+        is decoded again, so callers never share a mutable object with the cache. A response is not stored when
+        the SDK sent a write while it was in flight.
+
+        Returns:
+        - ParsedResponse: The status code, the decoded body and the error payload (None on success).
+        """
+        cacheable = self.cache is not None and use_path and self.cache.ttl_for(endpoint) is not None
+        namespace = self.host_url + self.path
+        if cacheable:
+            body = self.cache.get(endpoint, namespace)
+            if body is not None:
+                return ParsedResponse(200, _json_loads(body), None)
+
+        generation = self._write_generation
+        response = self._send('GET', endpoint, use_path=use_path)
+        result = self._parse_response(response)
+        # A write sent while this GET was in flight may have made the body stale; storing it would undo the
+        # write's invalidation.
+        if cacheable and result.error is None and response.status_code == 200 and generation == self._write_generation:
+            self.cache.set(endpoint, response.content, namespace)
+        return result
+
+    def _stream_json_items(self, endpoint: str, key: Optional[str] = 'data', chunk_size: int = 65536) -> Iterator[Any]:
+        """
+        Streams a list response and yields its items as they are decoded, without holding the body in memory.
+
+        Parameters:
+        - endpoint (str): The endpoint to request.
+        - key (Optional[str], optional): The top-level key holding the list, or None if the body is the list. Defaults to 'data'.
+        - chunk_size (int, optional): The number of bytes read from the socket at a time. Defaults to 65536.
+
+        Returns:
+        - Iterator[Any]: The list items.
+
+        Raises:
+        - requests.HTTPError: If the response status is 4xx or 5xx.
+        - ValueError: If the body is not the expected JSON shape (e.g. an error message instead of a list).
+        """
+        response = self._send('GET', endpoint, stream=True)
+        decoded_bytes = 0
+
+        def counted_chunks() -> Iterator[bytes]:
+            nonlocal decoded_bytes
+            for chunk in response.iter_content(chunk_size):
+                decoded_bytes += len(chunk)
+                yield chunk
+
+        try:
+            response.raise_for_status()
+            yield from iter_json_array(counted_chunks(), key=key)
+        finally:
+            self.transfer_stats.record(response, decoded_bytes=decoded_bytes)
+            response.close()
 
     def _find_matching_dicts(self, dic: Dict[str, Any], value_pattern: str) -> List[Dict[str, Any]]:
         regex = re.compile(value_pattern, re.IGNORECASE)
@@ -116,14 +316,37 @@ class AristaCVAAS(DependencyTracker):
 
     @staticmethod
     def compare_models(model_a: Any, model_b: Any) -> List[str]:
-        """Compare two models and return items that exist in model_a but not in model_b."""
-        model_a
-        diff_list = []
-        for item in model_a:
-            if item not in model_b:
-                diff_list.append(item)
-        return diff_list
-            
+        """
+        Compare two models and return items that exist in model_a but not in model_b.
+
+        Items are compared with == semantics, as `item not in model_b` would (1, 1.0 and True are equal,
+        dict key order is ignored), but through content digests, so large models are compared in linear time.
+        """
+        if isinstance(model_b, (dict, set, frozenset)):
+            return [item for item in model_a if item not in model_b]
+        # Items may be unhashable dicts and lists, so membership is tested on their content digests.
+        hasher = SubtreeHasher()
+        present = {hasher.key(item) for item in model_b}
+        return [item for item in model_a if hasher.key(item) not in present]
+
+    @staticmethod
+    def diff_models(model_a: Any, model_b: Any, identity_keys: Optional[Iterable[str]] = None) -> List[Change]:
+        """
+        Structural diff of two nested dict/list models, such as two topology, configlet or temp action snapshots.
+
+        Parameters:
+        - model_a (Any): The old model.
+        - model_b (Any): The new model.
+        - identity_keys (Optional[Iterable[str]], optional): Fields that identify list items across both models.
+          Defaults to diff.DEFAULT_IDENTITY_KEYS.
+
+        Returns:
+        - List[Change]: (op, path, old, new) entries; op is 'add', 'remove' or 'change'. See diff.diff_models.
+        """
+        if identity_keys is None:
+            return list(diff_models(model_a, model_b))
+        return list(diff_models(model_a, model_b, identity_keys))
+
     @staticmethod
     def generate_topology_hierarchy_post_data(
         input_dict: Dict[str, Union[str, List[Union[str, Dict[str, Any]]]]],
@@ -154,21 +377,8 @@ class AristaCVAAS(DependencyTracker):
             """Recursively traverses the hierarchy and populates hierarchy_dicts and ascii_tree."""
             for parent, children in input_dict.items():
                 parent_node_id = f"New_Container_{str(uuid.uuid4().int)[:uuid_length]}"
-                parent_dict = {
-                    "data": [{
-                        "info": f"Container {parent} created",
-                        "infoPreview": f"Container {parent} created",
-                        "action": "add",
-                        "nodeType": "container",
-                        "nodeId": parent_node_id,
-                        "toId": parent_id,
-                        "fromId": "",
-                        "nodeName": parent,
-                        "fromName": "",
-                        "toName": "" if parent_id == 'root' else parent_id,
-                        "toIdType": "container"
-                    }]
-                }
+                parent_dict = {"data": [container_add_action(parent, parent_node_id, parent_id,
+                                                             "" if parent_id == 'root' else parent_id)]}
                 hierarchy_dicts.append(parent_dict)
                 if print_ascii:
                     ascii_tree.append(f"{prefix}+-{parent}")
@@ -179,21 +389,7 @@ class AristaCVAAS(DependencyTracker):
                             traverse_hierarchy(child, parent_node_id, new_prefix)
                         else:
                             child_node_id = f"New_Container_{str(uuid.uuid4().int)[:uuid_length]}"
-                            child_dict = {
-                                "data": [{
-                                    "info": f"Container {child} created",
-                                    "infoPreview": f"Container {child} created",
-                                    "action": "add",
-                                    "nodeType": "container",
-                                    "nodeId": child_node_id,
-                                    "toId": parent_node_id,
-                                    "fromId": "",
-                                    "nodeName": child,
-                                    "fromName": "",
-                                    "toName": parent,
-                                    "toIdType": "container"
-                                }]
-                            }
+                            child_dict = {"data": [container_add_action(child, child_node_id, parent_node_id, parent)]}
                             hierarchy_dicts.append(child_dict)
                             if print_ascii:
                                 ascii_tree.append(f"{new_prefix}+-{child}")
@@ -322,7 +518,7 @@ class AristaCVAAS(DependencyTracker):
         return pruned_array
 
     @staticmethod
-    def find_longer_prefixes(df: pd.DataFrame, network: str, le: Optional[int] = None, ge: Optional[int] = None, eq: Optional[int] = None) -> pd.DataFrame:
+    def find_longer_prefixes(df: 'pd.DataFrame', network: str, le: Optional[int] = None, ge: Optional[int] = None, eq: Optional[int] = None) -> 'pd.DataFrame':
         """
         Filter a DataFrame to find networks that are supernets of a given network and meet optional prefix length criteria.
     
@@ -337,6 +533,8 @@ class AristaCVAAS(DependencyTracker):
         pd.DataFrame: A DataFrame containing the prefixes that are supernets of the given network and meet the specified criteria.
         """
     
+        import pandas as pd
+
         # Type checks
         if not isinstance(df, pd.DataFrame):
             raise TypeError("df must be a pandas DataFrame")
@@ -436,7 +634,7 @@ class AristaCVAAS(DependencyTracker):
     
     def flatten_array(self, arr):
         """
-        Recursively flattens a nested list.
+        Flattens a nested list.
         
         Parameters:
         - arr (list): A potentially nested list to be flattened.
@@ -444,13 +642,7 @@ class AristaCVAAS(DependencyTracker):
         Returns:
         - list: A flattened version of the input list.
         """
-        flattened_list = []
-        for item in arr:
-            if isinstance(item, list):
-                flattened_list.extend(self.flatten_array(item))
-            else:
-                flattened_list.append(item)
-        return flattened_list
+        return list(iter_leaves(arr if isinstance(arr, list) else list(arr), into_dicts=False))
     
     def search_configlets(self, system_name: str, filter_substring: str, regex_pattern: str, context_lines: int = 0):
         """
@@ -547,11 +739,78 @@ class AristaCVAAS(DependencyTracker):
                     applied_systems = self.flatten_array([[y["hostName"] for y in x['data']] for x in self.get_configlet_applied_devices([config_name])])
                     print(f'Issue found in Configlet applied to Device(s): {", ".join(applied_systems)}, Configlet: {config_name}\n')
                     print(f"Missing expected string. Expected to find: '{expected_string}' in configuration, but it was not found.\n")
+
+    def parse_config(self, config: str) -> ConfigTree:
+        """
+        Parses configuration text into a section-aware ConfigTree. Trees are cached by content hash,
+        so repeated calls for an unchanged configlet or running config do not re-parse.
+
+        Parameters:
+        - config (str): The configuration text of a configlet or device.
+
+        Returns:
+        - ConfigTree: The parsed block tree.
+        """
+        return self.config_parser.parse(config)
+
+    def get_inventory_device_config_tree(self, mac_address: str) -> Union[ConfigTree, Dict[str, Any]]:
+        """
+        Retrieves the running configuration of a device and returns it as a ConfigTree.
+
+        Parameters:
+        - mac_address (str): The MAC address of the device.
+
+        Returns:
+        - Union[ConfigTree, Dict[str, Any]]: The parsed running configuration, or the error response.
+        """
+        device_config = self.get_inventory_device_config(mac_address)
+        if 'output' not in device_config:
+            return device_config
+        return self.parse_config(device_config['output'])
+
+    def search_sections_missing_line(self, system_name: str, filter_substring: str, section: str, expected_line: str,
+                                     section_regex: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Searches the configlets of matching systems for sections that lack an expected line, e.g. every
+        'interface Ethernet' block without 'spanning-tree portfast'. Each configlet is parsed once and the
+        section lookups are served from its block index.
+
+        Parameters:
+        - system_name (str): The name pattern to match systems from which to retrieve configlets.
+        - filter_substring (str): A regex to filter configlets by their name.
+        - section (str): The section prefix to inspect, e.g. 'interface' or 'router bgp'.
+        - expected_line (str): The line each section is expected to contain.
+        - section_regex (Optional[str], optional): A regex to further narrow the section headers. Defaults to None.
+
+        Returns:
+        - List[Dict[str, Any]]: One entry per configlet with at least one offending section, holding the
+                                configlet name and the headers of the sections missing the line.
+        """
+        device_macs = self.get_system_mac_address_by_name(system_name)
+        configlets = self.filter_configlets_with_list([self.get_device_configlets(x[1]) for x in device_macs])
+        filter_pattern = re.compile(filter_substring, re.IGNORECASE)
+
+        results = []
+        seen_configlets = set()
+        for configlet in configlets:
+            for item in configlet['configletList']:
+                config_name = item['name']
+                if config_name in seen_configlets or not filter_pattern.search(config_name):
+                    continue
+                seen_configlets.add(config_name)
+                missing = self.parse_config(item['config']).sections_missing(section, expected_line, regex=section_regex)
+                if missing:
+                    results.append({
+                        'configlet': config_name,
+                        'sections': [block.header for block in missing]
+                    })
+        return results
     
 
 
     
-    def batfish_analyze_network_configs(self, device_list: list, bf_host: str = "172.16.100.1", snapshot_name: str = "snapshot") -> object:
+    def batfish_analyze_network_configs(self, device_list: list, bf_host: str = "172.16.100.1", snapshot_name: str = "snapshot",
+                                        journal_path: Optional[str] = None, max_workers: int = 8) -> object:
         """
         Analyze a list of network device configurations to identify unused and undefined structures using the Batfish service. 
         BATFISH server should be running on a local or remote host running Docker:
@@ -561,6 +820,8 @@ class AristaCVAAS(DependencyTracker):
             device_list (list): List of dictionaries, each containing device information with keys 'hostname' and 'systemMacAddress'.
             bf_host (str, optional): The IP address of the Batfish service. Defaults to "172.16.100.1".
             snapshot_name (str, optional): The name to be used for the snapshot in Batfish. Defaults to "snapshot".
+            journal_path (str, optional): A journal file that makes config collection resumable. Defaults to None.
+            max_workers (int, optional): The number of configs fetched concurrently. Defaults to 8.
 
         Returns:
             pybatfish.client.session.Session: A Batfish Session object initialized with the provided configurations.
@@ -577,6 +838,8 @@ class AristaCVAAS(DependencyTracker):
         import pybatfish
         from pybatfish.client.session import Session
 
+        import tempfile
+
         # Suppress log messages from Batfish
         logging.getLogger('pybatfish').setLevel(logging.CRITICAL)
 
@@ -585,19 +848,23 @@ class AristaCVAAS(DependencyTracker):
             config_subdir = os.path.join(temp_dir, 'configs')
             os.mkdir(config_subdir)
 
+            # Fetch all configurations concurrently; with a journal, configs fetched by an earlier run are reused
+            runner = FleetJobRunner(lambda device: self.get_inventory_device_config(device['systemMacAddress'])["output"],
+                                    journal_path, key=lambda device: device['systemMacAddress'], max_workers=max_workers)
+            outcomes = runner.run(device_list)
+
             # Write all configurations to files in the sub-directory
             for device in device_list:
                 hostname = device['hostname']
-                systemMacAddress = device['systemMacAddress']
-
-                # Fetch config text (replace with your actual API call)
-                config_text = self.get_inventory_device_config(systemMacAddress)["output"]
+                outcome = outcomes[device['systemMacAddress']]
+                if outcome['status'] != 'ok':
+                    raise RuntimeError(f"Failed to fetch the configuration of {hostname}: {outcome['error']}")
 
                 # Create and write the configuration file
                 config_filename = hostname
                 config_path = os.path.join(config_subdir, config_filename)
                 with open(config_path, 'w') as f:
-                    f.write(config_text)
+                    f.write(outcome['result'])
 
             # Initialize Batfish session and snapshot
             bf = pybatfish.client.session.Session(host=bf_host)
@@ -609,6 +876,7 @@ class AristaCVAAS(DependencyTracker):
         return bf
 
     def batfish_load_network_config(self, config_text:str, config_name: str = "config_1", snapshot_name: str = "C1" , bf_host: str = "172.16.100.1"):
+        import tempfile
 
         with tempfile.TemporaryDirectory() as temp_dir:
             config_subdir = os.path.join(temp_dir, 'configs')
@@ -664,20 +932,7 @@ class AristaCVAAS(DependencyTracker):
 
     def flatten_model_recursive(self, model: Union[dict, list]) -> List[Union[str, int]]:
         """Flattens the model into a one-dimensional list."""
-        flat_list = []
-
-        if isinstance(model, dict):
-            for key, value in model.items():
-                flat_list.extend(self.flatten_model_recursive(value))
-
-        elif isinstance(model, list):
-            for item in model:
-                flat_list.extend(self.flatten_model_recursive(item))
-
-        else:
-            return [model]
-
-        return flat_list
+        return list(iter_leaves(model))
 
     def generate_topology_hierarchy_ascii_tree(
         self,
@@ -717,12 +972,14 @@ class AristaCVAAS(DependencyTracker):
 
         return hierarchy_structure  # Returns None if return_structure is False
     
-    def group_devices(self, grouping_key: str) -> Dict[str, List[Dict[str, str]]]:
+    def group_devices(self, grouping_key: str, devices: Optional[Iterable[Union[Dict[str, Any], Device]]] = None) -> Dict[str, List[Dict[str, str]]]:
         """
         Groups devices based on a specified key.
 
         Parameters:
         - grouping_key (str): The key to group the devices by. Must be 'complianceCode' or 'internalVersion'.
+        - devices (Optional[Iterable[Union[Dict[str, Any], Device]]], optional): Inventory dicts or Device models to group.
+                                                                                 Defaults to the shared snapshot or a fresh inventory fetch.
 
         Returns:
         - Dict[str, List[Dict[str, str]]]: The grouped devices. Each key in the dictionary corresponds to a value of the grouping_key, 
@@ -731,8 +988,13 @@ class AristaCVAAS(DependencyTracker):
         if grouping_key not in ['complianceCode', 'internalVersion']:
             raise ValueError("Invalid grouping_key. Must be 'complianceCode' or 'internalVersion'.")
 
-        # Get the inventory devices
-        inventory_devices = self.get_inventory_devices()
+        # Get the inventory devices, reusing the shared snapshot when one has been taken
+        if devices is not None:
+            inventory_devices = devices
+        elif self._inventory_snapshot is not None:
+            inventory_devices = self._inventory_snapshot.records()
+        else:
+            inventory_devices = self.get_inventory_devices()
         
         grouped_devices = {}
         
@@ -789,7 +1051,40 @@ class AristaCVAAS(DependencyTracker):
 
         return filtered_configlets
 
-    def get_configlets_by_regex_match(self, configlet_search_strings: List[str], readable_only: bool = False, terse: bool = False) -> Union[Dict[str, Any], None]:
+    def find_similar_configlets(self, threshold: float = 0.8, configlets: Optional[Iterable[Dict[str, Any]]] = None,
+                                num_perm: int = 128, bands: Optional[int] = None, page_size: int = 2000) -> Dict[str, Any]:
+        """
+        Finds clusters of near-identical configlets across the tenant with MinHash/LSH (see ConfigletSimilarity).
+        Signatures are cached on the client by content hash, so repeated calls only hash changed configlets.
+
+        Parameters:
+        - threshold (float, optional): The minimum estimated Jaccard similarity of line shingles. Defaults to 0.8.
+        - configlets (Optional[Iterable[Dict[str, Any]]], optional): Configlet dicts to compare. Defaults to all configlets.
+        - num_perm (int, optional): The MinHash signature length. Defaults to 128.
+        - bands (Optional[int], optional): The number of LSH bands. Defaults to a value tuned for `threshold`.
+        - page_size (int, optional): The number of configlets requested per listing page. Defaults to 2000.
+
+        Returns:
+        - Dict[str, Any]: 'pairs', a list of (name_a, name_b, similarity) tuples, and 'clusters', lists of configlet names.
+        """
+        from .similarity import ConfigletSimilarity
+
+        if self._similarity is None or self._similarity.num_perm != num_perm:
+            self._similarity = ConfigletSimilarity(num_perm=num_perm)
+        engine = self._similarity
+        for key in list(engine.names):
+            engine.remove(key)
+        engine.add_many(self._iter_all_configlets(page_size) if configlets is None else configlets)
+
+        names = engine.names
+        pairs = engine.pairs(threshold, bands)
+        return {
+            'pairs': [(names[a], names[b], similarity) for a, b, similarity in pairs],
+            'clusters': [[names[key] for key in cluster] for cluster in engine.clusters(pairs=pairs)],
+        }
+
+    def get_configlets_by_regex_match(self, configlet_search_strings: List[str], readable_only: bool = False, terse: bool = False,
+                                      corpus: Optional[Union[str, ConfigletCorpus]] = None) -> Union[Dict[str, Any], None]:
         """
         Searches for configlets whose contents match any of the specified regex patterns.
 
@@ -797,27 +1092,47 @@ class AristaCVAAS(DependencyTracker):
         - configlet_search_strings (List[str]): The regex patterns to search for within the configlets.
         - readable_only (bool): If True, prints the matched configlets in a readable format instead of returning the data.
         - terse (bool): If True, returns terse details about the matched configlets.
+        - corpus (Optional[Union[str, ConfigletCorpus]]): A configlet corpus (or its directory) built with
+          `build_configlet_corpus`; bodies are then read from it instead of being fetched, with the same matches. Defaults to None.
 
         Returns:
         - The data of matched configlets, or None if `readable_only` is True or no configlets are found.
         """
-
-        configlet_ids = [item[1] for item in self.get_configlet_names_ids()]
-        configlet_data = [self.get_configlet_by_id(configlet_id) for configlet_id in configlet_ids]
+        # Matches are collected first and assignments fetched afterwards, so the scan is one compute span.
+        matches = []
+        if corpus is not None:
+            if isinstance(corpus, str):
+                corpus = ConfigletCorpus(corpus)
+            with self.tracer.span('regex_scan', {'cvaas.patterns': len(configlet_search_strings)}):
+                for configlet_search_string in configlet_search_strings:
+                    regex = re.compile(configlet_search_string)
+                    for key, name, _ in corpus.search(regex):
+                        matches.append((name, corpus.text(key), corpus.findall(regex, key)))
+        else:
+            configlet_names_ids = self.get_configlet_names_ids()
+            if isinstance(configlet_names_ids, dict):  # Check if the response is an error message
+                return configlet_names_ids
+            configlet_ids = [item[1] for item in configlet_names_ids]
+            configlet_data = [self.get_configlet_by_id(configlet_id) for configlet_id in configlet_ids]
+
+            with self.tracer.span('regex_scan', {'cvaas.patterns': len(configlet_search_strings),
+                                                 'cvaas.configlets': len(configlet_data)}):
+                for configlet_search_string in configlet_search_strings:
+                    regex = re.compile(configlet_search_string)
+                    matches.extend((configlet["name"], configlet["config"], re.findall(regex, configlet["config"]))
+                                   for configlet in configlet_data if re.search(regex, configlet["config"]))
 
         results = {}
-        for configlet_search_string in configlet_search_strings:
-            regex = re.compile(configlet_search_string)
-            matches = {
-                configlet["name"]: {
-                    "config": configlet["config"],
-                    "assignment": self.get_configlet_applied_devices([configlet["name"]]),
-                    "matched": re.findall(regex, configlet["config"])
-                }
-                for configlet in configlet_data if re.search(regex, configlet["config"])
+        for name, config, matched in matches:
+            results[name] = {
+                "config": config,
+                "assignment": self.get_configlet_applied_devices([name]),
+                "matched": matched
             }
-            results.update(matches)
+        return self._format_regex_matches(results, readable_only, terse)
 
+    def _format_regex_matches(self, results: Dict[str, Any], readable_only: bool, terse: bool) -> Union[Dict[str, Any], List[Dict[str, Any]], None]:
+        """Shapes `get_configlets_by_regex_match` results for the terse and readable_only modes."""
         if terse:
             accum_list = [
                 {
@@ -838,6 +1153,8 @@ class AristaCVAAS(DependencyTracker):
         return results
 
     def print_readable(self, results: Dict[str, Any]) -> None:
+        import pprint
+
         pp = pprint.PrettyPrinter(indent=4)
         for configlet_name, configlet_info in results.items():
             print(f"Configlet Name: {configlet_name}")
@@ -856,13 +1173,12 @@ class AristaCVAAS(DependencyTracker):
         - Dict[str, Any]: The JSON response containing the configlet data.
         """
         endpoint = f'/image/getImageBundles.do?startIndex={start}&endIndex={end}'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
+        result = self._request_json('GET', endpoint)
 
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        if result.error:
+            return result.error
 
-        return response.json()
+        return result.data
 
     def get_system_mac_address_by_name(self, regex: Optional[str] = None) -> List[Tuple[str, str]]:
         """
@@ -874,6 +1190,9 @@ class AristaCVAAS(DependencyTracker):
         Returns:
         - List[Tuple[str, str]]: A list of tuples, each containing a hostname and system MAC address of a device that matches the regex pattern.
         """
+        if self._inventory_snapshot is not None:
+            return self._inventory_snapshot.hostname_mac_pairs(regex)
+
         devices = self.get_inventory_devices()
         result = []
 
@@ -935,13 +1254,12 @@ class AristaCVAAS(DependencyTracker):
         """
 
         endpoint = f'/configlet/getConfigletHistory.do?configletId={configlet_id}&startIndex={start_index}&endIndex={end_index}'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
+        result = self._request_json('GET', endpoint)
 
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        if result.error:
+            return result.error
 
-        for x in response.json().get("configletHistory", []):
+        for x in result.data.get("configletHistory", []):
             # Convert and display date-time fields
             old_date = self.convert_date_time_from_long_format(x["oldDateTimeInLongFormat"])
             updated_date = self.convert_date_time_from_long_format(x["updatedDateTimeInLongFormat"])
@@ -954,7 +1272,40 @@ class AristaCVAAS(DependencyTracker):
                 print(f"{'*' * 10} Old Config: {'*' * 10}\n", x.get("oldConfig"))
                 print(f"{'*' * 10} New Config: {'*' * 10}\n", x.get("newConfig"))
 
-        return response.status_code, response.json()
+        return result.status_code, result.data
+
+    def get_configlet_history_page(self, configlet_id: str, start_index: int = 0, end_index: int = 50) -> Dict[str, Any]:
+        """
+        Retrieves one page of a configlet's history without printing or post-processing it.
+
+        Parameters:
+        - configlet_id (str): The unique identifier of the configlet.
+        - start_index (int, optional): The starting index of history entries to retrieve. Defaults to 0.
+        - end_index (int, optional): The ending index of history entries to retrieve. Defaults to 50.
+
+        Returns:
+        - Dict[str, Any]: The JSON response containing 'total' and 'configletHistory', or an error message.
+        """
+        endpoint = f'/configlet/getConfigletHistory.do?configletId={configlet_id}&startIndex={start_index}&endIndex={end_index}'
+        result = self._request_json('GET', endpoint)
+
+        if result.error:
+            return result.error
+
+        return result.data
+
+    def configlet_history_store(self, path: Optional[str] = None, **kwargs) -> ConfigletHistoryStore:
+        """
+        Creates a ConfigletHistoryStore bound to this client. Call `sync()` on it to fetch new history.
+
+        Parameters:
+        - path (Optional[str], optional): A JSON file used to persist the store between runs. Defaults to None.
+        - **kwargs: Passed through to ConfigletHistoryStore (page_size, max_workers).
+
+        Returns:
+        - ConfigletHistoryStore: The history store.
+        """
+        return ConfigletHistoryStore(self, path=path, **kwargs)
 
     def get_configlets(self, start_index: int = 0, end_index: int = 2000) -> Tuple[int, Dict[str, Any]]:
         """
@@ -968,15 +1319,95 @@ class AristaCVAAS(DependencyTracker):
         - Tuple[int, Dict[str, Any]]: A tuple containing the status code and the response JSON.
         """
         endpoint = f'/configlet/getConfiglets.do?startIndex={start_index}&endIndex={end_index}'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
+        result = self._request_json('GET', endpoint)
 
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        if result.error:
+            return result.error
 
-        return response.status_code, response.json()
+        return result.status_code, result.data
     
 
+    def iter_configlets(self, start_index: int = 0, end_index: int = 2000, chunk_size: int = 65536) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming variant of `get_configlets`: yields configlets (including their bodies) one at a time.
+
+        Parameters:
+        - start_index (int, optional): The starting index of configlets to retrieve. Defaults to 0.
+        - end_index (int, optional): The ending index of configlets to retrieve. Defaults to 2000.
+        - chunk_size (int, optional): The number of bytes read from the socket at a time. Defaults to 65536.
+
+        Returns:
+        - Iterator[Dict[str, Any]]: The configlets.
+        """
+        endpoint = f'/configlet/getConfiglets.do?startIndex={start_index}&endIndex={end_index}'
+        return self._stream_json_items(endpoint, key='data', chunk_size=chunk_size)
+
+    def _iter_all_configlets(self, page_size: int = 2000) -> Iterator[Dict[str, Any]]:
+        """
+        Streams the whole configlet listing, one `iter_configlets` page after another until a page comes back short.
+
+        Parameters:
+        - page_size (int, optional): The number of configlets requested per listing page. Defaults to 2000.
+
+        Returns:
+        - Iterator[Dict[str, Any]]: The configlets.
+        """
+        start_index = 0
+        while True:
+            count = 0
+            for configlet in self.iter_configlets(start_index, start_index + page_size):
+                count += 1
+                yield configlet
+            if count < page_size:
+                return
+            start_index += page_size
+
+    def get_configlet_models(self, start_index: int = 0, end_index: int = 2000) -> List[Configlet]:
+        """
+        Retrieves configlets as compact Configlet models, decoding the listing as a stream so the
+        full dict list is never materialized.
+
+        Parameters:
+        - start_index (int, optional): The starting index of configlets to retrieve. Defaults to 0.
+        - end_index (int, optional): The ending index of configlets to retrieve. Defaults to 2000.
+
+        Returns:
+        - List[Configlet]: The configlets.
+        """
+        return Configlet.from_dicts(self.iter_configlets(start_index, end_index))
+
+    def export_tenant(self, directory: str, tables: Optional[List[str]] = None, format: str = 'parquet', **kwargs: Any) -> Dict[str, str]:
+        """
+        Writes configlets, configlet assignments, devices, containers and temp actions as typed, dictionary-encoded
+        Parquet (or Arrow) tables, filled straight from the streamed listings. Requires pyarrow. See TenantExporter.
+
+        Parameters:
+        - directory (str): The output directory.
+        - tables (Optional[List[str]], optional): The tables to export. Defaults to all of them.
+        - format (str, optional): 'parquet' or 'arrow'. Defaults to 'parquet'.
+        - **kwargs: Passed through to TenantExporter (page_size, batch_rows, max_workers).
+
+        Returns:
+        - Dict[str, str]: Table name -> file path. Load them back with `read_tenant_export(directory)`.
+        """
+        from .export import TenantExporter
+
+        return TenantExporter(self, **kwargs).export(directory, tables=tables, format=format)
+
+    def build_configlet_corpus(self, directory: str, page_size: int = 2000) -> ConfigletCorpus:
+        """
+        Streams every configlet body into a memory-mapped corpus on disk (see ConfigletCorpus), replacing any
+        previous corpus in the directory. Search helpers accept the corpus to scan bodies without fetching them.
+
+        Parameters:
+        - directory (str): The corpus directory.
+        - page_size (int, optional): The number of configlets requested per listing page. Defaults to 2000.
+
+        Returns:
+        - ConfigletCorpus: The opened corpus.
+        """
+        return ConfigletCorpus.build(directory, self._iter_all_configlets(page_size))
+
     def get_configlet_by_name(self, configlet_name: str) -> Union[Dict[str, Any], None]:
         """
         Retrieves a configlet by its name.
@@ -1002,25 +1433,20 @@ class AristaCVAAS(DependencyTracker):
 
     def get_configlet_names_ids(self, regex: Optional[str] = None) -> Union[Dict[str, Any], List[Tuple[str, str]]]:
         """
-        Retrieves a list of configlet names and IDs, optionally filtered by a regex pattern.
+        Retrieves a list of configlet names and IDs, optionally filtered by a regex pattern. The whole
+        listing is paged through, so tenants with more configlets than one listing page are covered.
 
         Parameters:
         - regex (Optional[str], optional): The regex pattern to filter configlet names. Defaults to None.
 
         Returns:
-        - Union[Dict[str, Any], List[Tuple[str, str]]]: The list of tuples containing configlet names and IDs, 
-                                                        or an error message dictionary if the response is an error message.
+        - Union[Dict[str, Any], List[Tuple[str, str]]]: The list of tuples containing configlet names and IDs,
+                                                        or an error message dictionary if the listing failed.
         """
-        response = self.get_configlets()
-        if isinstance(response, dict):  # Check if the response is an error message
-            return response
-
-        status_code, response_text = response
-        if status_code != 200:
-            return []
-
-        configlets = response_text.get('data', [])
-        result = [(configlet['name'], configlet['key']) for configlet in configlets]
+        try:
+            result = [(configlet['name'], configlet['key']) for configlet in self._iter_all_configlets()]
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return {"error": f"Unable to list configlets: {e}"}
 
         if regex:
             pattern = re.compile(regex, re.IGNORECASE)
@@ -1039,58 +1465,110 @@ class AristaCVAAS(DependencyTracker):
         - Dict[str, Any]: The JSON response containing the configlet data.
         """
         endpoint = f'/configlet/getConfigletById.do?id={configlet_id}'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
+        result = self._request_json('GET', endpoint)
 
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        if result.error:
+            return result.error
 
-        return response.json()
+        return result.data
 
-    def get_configlet_applied_containers(self, configlet_names: List[str]) -> List[Dict[str, Any]]:
+    def get_configlet_applied_containers(self, configlet_names: List[str], page_size: int = 1000,
+                                         max_workers: int = 8) -> List[Dict[str, Any]]:
         """
         Retrieves the containers to which specified configlets are applied.
 
         Parameters:
         - configlet_names (List[str]): The names of the configlets to look up.
+        - page_size (int, optional): The number of containers requested per page. Defaults to 1000.
+        - max_workers (int, optional): The number of configlets looked up concurrently. Defaults to 8.
 
         Returns:
         - List[Dict[str, Any]]: A list of dictionaries, each representing the containers a configlet is applied to, along with the configlet name.
         """
-        results = []
-        for name in configlet_names:
-            endpoint = f'/configlet/getAppliedContainers.do?configletName={name}&startIndex=0&endIndex=1000'
-            response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
-            error_response = self._check_response(response)
-            if error_response:
-                return error_response
-            response = response.json()
-            response["configletName"] = name
-            results.append(response)        
-        return results
+        return self._get_configlet_applied('getAppliedContainers', configlet_names, page_size, max_workers)
 
-    def get_configlet_applied_devices(self, configlet_names: List[str]) -> List[Dict[str, Any]]:
+    def get_configlet_applied_devices(self, configlet_names: List[str], page_size: int = 1000,
+                                      max_workers: int = 8) -> List[Dict[str, Any]]:
         """
         Retrieves the devices to which specified configlets are applied.
 
         Parameters:
         - configlet_names (List[str]): The names of the configlets to look up.
+        - page_size (int, optional): The number of devices requested per page. Defaults to 1000.
+        - max_workers (int, optional): The number of configlets looked up concurrently. Defaults to 8.
 
         Returns:
         - List[Dict[str, Any]]: A list of dictionaries, each representing the devices a configlet is applied to, along with the configlet name.
         """
+        return self._get_configlet_applied('getAppliedDevices', configlet_names, page_size, max_workers)
+
+    def _get_configlet_applied(self, action: str, configlet_names: List[str], page_size: int,
+                               max_workers: int) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Fetches every page of an applied-containers/applied-devices lookup for each configlet, with bounded
+        concurrency. Results keep the order of `configlet_names`; the first error is returned instead.
+        """
+        def fetch(name: str) -> Dict[str, Any]:
+            applied: Dict[str, Any] = {}
+            data: List[Dict[str, Any]] = []
+            while True:
+                endpoint = (f'/configlet/{action}.do?configletName={quote(name, safe="")}'
+                            f'&startIndex={len(data)}&endIndex={len(data) + page_size}')
+                result = self._request_json('GET', endpoint)
+                if result.error:
+                    return {'error': result.error}
+                applied.update(result.data)
+                page = result.data.get('data') or []
+                data.extend(page)
+                total = result.data.get('total')
+                if len(page) < page_size or (isinstance(total, int) and len(data) >= total):
+                    break
+            applied['data'] = data
+            applied['configletName'] = name
+            return applied
+
         results = []
-        for name in configlet_names:
-            endpoint = f'/configlet/getAppliedDevices.do?configletName={name}&startIndex=0&endIndex=1000'
-            response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
-            error_response = self._check_response(response)
-            if error_response:
-                return error_response
-            response = response.json()
-            response["configletName"] = name
-            results.append(response)        
+        for _, applied, error in map_concurrently(fetch, configlet_names, max_workers):
+            if error is not None:
+                raise error
+            if 'error' in applied:
+                return applied['error']
+            results.append(applied)
         return results
 
+    def _applied_container_maps(self, refresh: bool = False, max_workers: int = 8,
+                                page_size: int = 2000) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """
+        Returns the container -> configlet names and configlet -> container names maps.
+
+        Only configlets whose listing reports a container assignment are looked up. The maps are kept until
+        the SDK sends a write or a subscription reports a configlet change, or until `refresh` is set;
+        concurrent callers share one rebuild.
+        """
+        cached = self._applied_containers
+        if cached is not None and not refresh and cached[0] == self._write_generation:
+            return cached[1], cached[2]
+
+        def build() -> Tuple[int, Dict[str, List[str]], Dict[str, List[str]]]:
+            generation = self._write_generation
+            names = [configlet['name'] for configlet in self._iter_all_configlets(page_size)
+                     if configlet.get('containerCount', 1)]
+
+            applied = self.get_configlet_applied_containers(names, max_workers=max_workers)
+            if isinstance(applied, dict):
+                raise RuntimeError(f"Unable to fetch applied containers: {applied}")
+            per_container: Dict[str, List[str]] = {}
+            per_configlet: Dict[str, List[str]] = {}
+            for container_info in applied:
+                configlet_name = container_info['configletName']
+                for data_entry in container_info['data']:
+                    per_container.setdefault(data_entry['containerName'], []).append(configlet_name)
+                    per_configlet.setdefault(configlet_name, []).append(data_entry['containerName'])
+            return generation, per_container, per_configlet
+
+        self._applied_containers = self.single_flight.do(('applied_container_maps',), build)
+        return self._applied_containers[1], self._applied_containers[2]
+
 
     def get_tasks(self) -> Dict[str, Any]:
         """
@@ -1100,13 +1578,73 @@ class AristaCVAAS(DependencyTracker):
         - Dict[str, Any]: The JSON response containing the configlet data.
         """
         endpoint = f'/task/getTasks.do?startIndex=0&endIndex=0'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
+        result = self._request_json('GET', endpoint)
+
+        if result.error:
+            return result.error
 
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        return result.data
 
-        return response.json()
+    def get_task_by_id(self, task_id: str) -> Dict[str, Any]:
+        """
+        Retrieves one task.
+
+        Parameters:
+        - task_id (str): The task (work order) ID.
+
+        Returns:
+        - Dict[str, Any]: The task, or the error message (with an 'errorCode' when the task does not exist).
+        """
+        endpoint = f'/task/getTaskById.do?taskId={quote(str(task_id), safe="")}'
+        result = self._request_json('GET', endpoint)
+
+        if result.error:
+            return result.error
+
+        return result.data
+
+    def iter_tasks(self, chunk_size: int = 65536) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming variant of `get_tasks`: yields tasks one at a time.
+
+        Parameters:
+        - chunk_size (int, optional): The number of bytes read from the socket at a time. Defaults to 65536.
+
+        Returns:
+        - Iterator[Dict[str, Any]]: The tasks.
+        """
+        endpoint = '/task/getTasks.do?startIndex=0&endIndex=0'
+        return self._stream_json_items(endpoint, key='data', chunk_size=chunk_size)
+
+    def task_watcher(self, **kwargs: Any) -> TaskWatcher:
+        """
+        Returns the client's TaskWatcher, creating it on first use.
+
+        Parameters:
+        - **kwargs: Passed through to TaskWatcher on creation (min_interval, max_interval, backoff, timeout,
+          max_individual, missing_polls).
+
+        Returns:
+        - TaskWatcher: The task watcher.
+        """
+        if self._task_watcher is None:
+            self._task_watcher = TaskWatcher(self, **kwargs)
+        return self._task_watcher
+
+    def wait_for_tasks(self, task_ids: Union[List[str], Dict[str, Any]], timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Blocks until tasks are Completed, Failed or Cancelled, polling them together with adaptive intervals.
+
+        Parameters:
+        - task_ids (Union[List[str], Dict[str, Any]]): Task IDs, or a `post_provisioning_save_temp_actions` response.
+        - timeout (Optional[float], optional): The maximum number of seconds to wait. Defaults to None (no limit).
+
+        Returns:
+        - Dict[str, Dict[str, Any]]: Task ID -> final task dict; check 'workOrderUserDefinedStatus' for the outcome.
+        """
+        watcher = self.task_watcher()
+        futures = watcher.watch(task_ids)
+        return watcher.wait(list(futures), timeout=timeout)
 
     def get_inventory_devices(self, provisioned: bool = False, system_mac_addresses: Optional[List[str]] = None, system_serial_number: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
@@ -1121,47 +1659,204 @@ class AristaCVAAS(DependencyTracker):
         - List[Dict[str, Any]]: A list of dictionaries, each representing a device.
         """
         endpoint = f'/inventory/devices?provisioned={provisioned}'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
+        result = self._request_json('GET', endpoint)
 
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        if result.error:
+            return result.error
 
-        devices = response.json()
+        devices = result.data
 
         if system_mac_addresses:
+            system_mac_addresses = set(system_mac_addresses)
             devices = [device for device in devices if device.get('systemMacAddress') in system_mac_addresses]
             
         if system_serial_number:
+            system_serial_number = set(system_serial_number)
             devices = [device for device in devices if device.get('serialNumber') in system_serial_number]
 
         return devices
 
-    def get_device_configlets(self, mac_address: Optional[str] = None, process_all: bool = False) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    def iter_inventory_devices(self, provisioned: bool = False, chunk_size: int = 65536) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming variant of `get_inventory_devices`: yields devices one at a time as they are decoded
+        from the response, so memory use does not grow with the size of the inventory.
+
+        Parameters:
+        - provisioned (bool, optional): Whether to filter devices by their provisioning status. Defaults to False.
+        - chunk_size (int, optional): The number of bytes read from the socket at a time. Defaults to 65536.
+
+        Returns:
+        - Iterator[Dict[str, Any]]: The inventory devices.
+        """
+        endpoint = f'/inventory/devices?provisioned={provisioned}'
+        return self._stream_json_items(endpoint, key=None, chunk_size=chunk_size)
+
+    def get_inventory_device_models(self, provisioned: bool = False) -> List[Device]:
+        """
+        Retrieves the inventory as compact Device models, decoding the response as a stream.
+
+        Parameters:
+        - provisioned (bool, optional): Whether to filter devices by their provisioning status. Defaults to False.
+
+        Returns:
+        - List[Device]: The inventory devices.
+        """
+        return Device.from_dicts(self.iter_inventory_devices(provisioned))
+
+    def inventory_snapshot(self, refresh: bool = False, provisioned: bool = False, stream: bool = False) -> 'InventorySnapshot':
+        """
+        Returns the shared columnar inventory snapshot, fetching it on first use.
+
+        While a snapshot exists, `group_devices` and `get_system_mac_address_by_name` answer from it
+        instead of refetching the inventory. Call with `refresh=True` to pick up inventory changes.
+
+        Parameters:
+        - refresh (bool, optional): Whether to re-fetch the inventory. Defaults to False.
+        - provisioned (bool, optional): Passed to `get_inventory_devices` when fetching. Defaults to False.
+        - stream (bool, optional): Whether to build the snapshot from the streaming decoder. Defaults to False.
+
+        Returns:
+        - InventorySnapshot: The shared snapshot.
+        """
+        from .inventory import InventorySnapshot
+
+        if self._inventory_snapshot is None or self._inventory_snapshot.provisioned != provisioned:
+            self._inventory_snapshot = InventorySnapshot(self, provisioned=provisioned, stream=stream)
+        elif refresh:
+            self._inventory_snapshot.refresh()
+        return self._inventory_snapshot
+
+    def cost_planner(self, refresh: bool = False, **kwargs: Any) -> 'CostPlanner':
+        """
+        Returns the shared dry-run cost planner, which keeps the listings it reads between plans.
+
+        Parameters:
+        - refresh (bool, optional): Whether to drop the planner's cached listings. Defaults to False.
+        - **kwargs: Passed through to CostPlanner (default_latency) when it is first built.
+
+        Returns:
+        - CostPlanner: The shared planner.
+        """
+        from .planner import CostPlanner
+
+        if self._cost_planner is None:
+            self._cost_planner = CostPlanner(self, **kwargs)
+        elif refresh:
+            self._cost_planner.refresh()
+        return self._cost_planner
+
+    def plan_cost(self, operation: str, *args: Any, **kwargs: Any) -> 'CostPlan':
+        """
+        Dry run of a high-level helper: predicts its requests per endpoint family and its wall time
+        from observed latencies, without running it.
+
+        Parameters:
+        - operation (str): The helper name, one of CostPlanner.PLANNED (e.g. 'search_configlets').
+        - *args, **kwargs: The arguments the helper would be called with.
+
+        Returns:
+        - CostPlan: The prediction; see `requests`, `total_requests` and `estimated_seconds`.
+        """
+        return self.cost_planner().plan(operation, *args, **kwargs)
+
+    def run_within_budget(self, operation: str, *args: Any, max_requests: Optional[int] = None,
+                          max_seconds: Optional[float] = None, **kwargs: Any) -> Any:
+        """
+        Plans a high-level helper and runs it only if the plan is within budget.
+
+        Parameters:
+        - operation (str): The helper name, one of CostPlanner.PLANNED.
+        - *args, **kwargs: The arguments for the helper.
+        - max_requests (Optional[int], optional): The maximum number of requests. Defaults to None (no limit).
+        - max_seconds (Optional[float], optional): The maximum estimated wall time. Defaults to None (no limit).
+
+        Returns:
+        - Any: The helper's result. Raises BudgetExceeded (carrying the plan) instead of running it when over budget.
+        """
+        self.plan_cost(operation, *args, **kwargs).check(max_requests, max_seconds)
+        return getattr(self, operation)(*args, **kwargs)
+
+    def configlet_resolver(self, refresh: bool = False, **kwargs: Any) -> 'ConfigletResolver':
+        """
+        Returns the shared effective-configlet resolver, building it on first use.
+
+        The resolver answers which configlets apply to a device (through container inheritance) and which
+        devices a configlet affects without further requests. Call with `refresh=True` after assignments change;
+        a resolver marked stale by a subscription is refreshed automatically.
+
+        Parameters:
+        - refresh (bool, optional): Whether to re-fetch assignments and rebuild the index. Defaults to False.
+        - **kwargs: Passed through to ConfigletResolver (max_workers, page_size) when it is first built.
+
+        Returns:
+        - ConfigletResolver: The shared resolver.
+        """
+        from .resolver import ConfigletResolver
+
+        if self._configlet_resolver is None:
+            self._configlet_resolver = ConfigletResolver(self, **kwargs)
+        elif refresh or self._configlet_resolver.stale:
+            self._configlet_resolver.refresh()
+        return self._configlet_resolver
+
+    def subscribe(self, streams: Optional[Union[List[str], Dict[str, str]]] = None, start: bool = True, **kwargs: Any) -> 'ResourceSubscriber':
+        """
+        Keeps the inventory snapshot and response cache fresh from Resource API subscribe streams
+        instead of polling listings. See ResourceSubscriber.
+
+        Parameters:
+        - streams (Optional[Union[List[str], Dict[str, str]]], optional): Stream names from
+          ResourceSubscriber.DEFAULT_STREAMS, or a name -> path mapping. Defaults to inventory and configlet.
+        - start (bool, optional): Whether to start the background stream threads. Defaults to True.
+        - **kwargs: Passed through to ResourceSubscriber (reconnect_delay, max_reconnect_delay, read_timeout).
+
+        Returns:
+        - ResourceSubscriber: The subscriber; call `stop()` to close the streams.
+        """
+        from .subscriptions import ResourceSubscriber
+
+        subscriber = ResourceSubscriber(self, streams=streams, **kwargs)
+        return subscriber.start() if start else subscriber
+
+    def get_device_configlets(self, mac_address: Optional[str] = None, process_all: bool = False,
+                              journal_path: Optional[str] = None, max_workers: int = 8) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Retrieves configlets associated with a device or all devices.
 
         Parameters:
         - mac_address (Optional[str], optional): The MAC address of the device to retrieve configlets for. Defaults to None.
         - process_all (bool, optional): Whether to retrieve configlets for all devices. Defaults to False.
+        - journal_path (Optional[str], optional): With process_all, a journal file that makes the run resumable;
+                                                  devices already journaled are not fetched again. Defaults to None.
+        - max_workers (int, optional): With process_all, the number of devices fetched concurrently. Defaults to 8.
 
         Returns:
         - Union[Dict[str, Any], List[Dict[str, Any]]]: If process_all is True, returns a dictionary containing devices with and without configlets.
                                                        If process_all is False, returns a list of configlets associated with the specified device.
         """
         if process_all:
+            from tqdm import tqdm
+
             switches = [x for x in self.get_inventory_devices()]
+
+            def configlet_names(switch: Dict[str, Any]) -> Any:
+                data = self.get_device_configlets(switch["systemMacAddress"])
+                if is_error_result(data) or 'configletList' not in data:
+                    return data
+                return [x["name"] for x in data["configletList"]]
+
+            with tqdm(total=len(switches), desc="Processing switches", unit="switch") as progress:
+                runner = FleetJobRunner(configlet_names, journal_path, key=lambda switch: switch["systemMacAddress"],
+                                        max_workers=max_workers, on_result=lambda *_: progress.update())
+                outcomes = runner.run(switches)
+
             devices_with_configlets = []
             devices_without_configlets = []
-            for switch in tqdm(switches, desc="Processing switches", unit="switch"):
-                temp_data = {switch['hostname']: self.get_device_configlets(switch["systemMacAddress"])}
-                if 'configletList' in temp_data[switch["hostname"]]:
-                    configlet_names = [x["name"] for x in temp_data[switch['hostname']]["configletList"]]
-                    if len(configlet_names) > 0:
-                        temp_data[switch['hostname']] = configlet_names
-                        devices_with_configlets.append(temp_data)
-                    else:
-                        devices_without_configlets.append(switch['hostname'])
+            for switch in switches:
+                outcome = outcomes[switch["systemMacAddress"]]
+                names = outcome.get('result')
+                if outcome['status'] == 'ok' and isinstance(names, list) and len(names) > 0:
+                    devices_with_configlets.append({switch['hostname']: names})
                 else:
                     devices_without_configlets.append(switch['hostname'])
 
@@ -1181,11 +1876,10 @@ class AristaCVAAS(DependencyTracker):
             if mac_address is None:
                 raise ValueError("mac_address is required when process_all is False")
             endpoint = f'/ztp/getConfigletsByNetElementId.do?netElementId={mac_address}&queryParam=null&startIndex=0&endIndex=0'
-            response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
-            error_response = self._check_response(response)
-            if error_response:
-                return error_response
-            return response.json()
+            result = self._request_json('GET', endpoint)
+            if result.error:
+                return result.error
+            return result.data
 
     def post_retrieve_device_management_ip(self, device_netelement_id: str) -> Dict[str, Any]:
         """
@@ -1203,13 +1897,13 @@ class AristaCVAAS(DependencyTracker):
             "pageType": "changeIP"
         }
         endpoint = f'/configlet/getManagementIp.do?startIndex=0&endIndex=999'
-        response = self.session.post(self.host_url + self.path + endpoint, headers=self.headers, data=json.dumps(request_body))
+        # getManagementIp.do is a lookup sent as a POST; it must not invalidate caches like a write.
+        result = self._request_json('POST', endpoint, data=json.dumps(request_body), mutates=False)
 
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        if result.error:
+            return result.error
 
-        return response.json()
+        return result.data
 
     def get_inventory_device_config(self, mac_address: str) -> Dict[str, Any]:
         """
@@ -1222,14 +1916,13 @@ class AristaCVAAS(DependencyTracker):
         - Dict[str, Any]: The JSON response containing the device configuration.
         """
         endpoint = f'/inventory/device/config?netElementId={mac_address}'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
+        result = self._request_json('GET', endpoint)
 
-        # No error checking on this method. Would need to debug the response and update check_response method.
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        # No error checking on this method. Would need to debug the response and update _parse_response method.
+        if result.error:
+            return result.error
         
-        return response.json()
+        return result.data
     
     def get_inventory_containers(self) -> Dict[str, Any]:
         """
@@ -1239,14 +1932,13 @@ class AristaCVAAS(DependencyTracker):
         - Dict[str, Any]: The JSON response containing the list of inventory containers.
         """
         endpoint = f'/inventory/containers'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
+        result = self._request_json('GET', endpoint)
         
-        # No error checking on this method. Would need to debug the response and update check_response method.
-        # error_response = self._check_response(response)
-        # if error_response:
-        #     return error_response
+        # No error checking on this method. Would need to debug the response and update _parse_response method.
+        # if result.error:
+        #     return result.error
         
-        return response.json()
+        return result.data
 
     def get_users_and_groups(self, filter_status: str = "Any") -> Dict[str, Any]:
         """
@@ -1259,18 +1951,18 @@ class AristaCVAAS(DependencyTracker):
         - Dict[str, Any]: The JSON response containing users and groups.
         """
         endpoint = f'/user/getUsers.do?startIndex=0&endIndex=1000'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
+        result = self._request_json('GET', endpoint)
 
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        if result.error:
+            return result.error
 
-        json_data = response.json()
+        json_data = result.data
 
-        # Filter users based on the 'currentStatus' if specified
+        # Filter users based on the 'currentStatus' if specified. The decoded body may be shared with
+        # concurrent callers, so the filtered result is a shallow copy.
         if filter_status != "Any":
             filtered_users = [user for user in json_data.get('users', []) if user.get('currentStatus') == filter_status]
-            json_data['users'] = filtered_users
+            json_data = dict(json_data, users=filtered_users)
         
         return json_data
 
@@ -1282,13 +1974,12 @@ class AristaCVAAS(DependencyTracker):
         - Dict[str, Any]: The JSON response containing roles.
         """
         endpoint = f'/role/getRoles.do?startIndex=0&endIndex=1000'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
+        result = self._request_json('GET', endpoint)
 
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        if result.error:
+            return result.error
 
-        json_data = response.json()
+        json_data = result.data
 
         return json_data
     
@@ -1300,13 +1991,12 @@ class AristaCVAAS(DependencyTracker):
         - Dict[str, Any]: The JSON response containing CVP information.
         """
         endpoint = f'/cvpInfo/getCvpInfo.do'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
+        result = self._request_json('GET', endpoint)
         
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        if result.error:
+            return result.error
         
-        return response.json()
+        return result.data
 
     def get_copy_configlet(self, source_configlet_identifiers: List[str], new_names: Optional[List[str]] = None) -> Union[Dict[str, str], List[Dict[str, Any]]]:
         """
@@ -1325,12 +2015,12 @@ class AristaCVAAS(DependencyTracker):
 
         copied_configlets = []
 
-        for index, identifier in enumerate(source_configlet_identifiers):
-            # Retrieve all configlets
-            configlets = self.get_configlet_names_ids()
-            if isinstance(configlets, dict):  # Check if the response is an error message
-                return configlets
+        # Retrieve all configlets once; names and IDs do not change between copies
+        configlets = self.get_configlet_names_ids()
+        if isinstance(configlets, dict):  # Check if the response is an error message
+            return configlets
 
+        for index, identifier in enumerate(source_configlet_identifiers):
             # Find the source configlet by name or ID
             matched_configlet = next((configlet for configlet in configlets if identifier in configlet), None)
             if not matched_configlet:
@@ -1348,40 +2038,45 @@ class AristaCVAAS(DependencyTracker):
                 "config": configlet_details['config'],
                 "name": new_name
             }
-            response = self.session.post(self.host_url + self.path + endpoint, headers=self.headers, json=body)
+            result = self._request_json('POST', endpoint, json=body, compress_body=True)
 
-            error_response = self._check_response(response)
-            if error_response:
-                return error_response
+            if result.error:
+                return result.error
 
-            copied_configlets.append(response.json())
+            copied_configlets.append(result.data)
 
         return copied_configlets
 
-    def get_applied_configlets_per_container(self) -> List[List[str]]:
+    def get_applied_configlets_per_container(self, refresh: bool = False, max_workers: int = 8) -> List[List[str]]:
         """
         Retrieves a list of applied configlets for each container.
 
+        Lookups run concurrently and are paginated; the result is cached until the SDK sends a write.
+
+        Parameters:
+        - refresh (bool, optional): Whether to rebuild the cached map. Defaults to False.
+        - max_workers (int, optional): The number of configlets looked up concurrently. Defaults to 8.
+
         Returns:
         - List[List[str]]: A list where each element is a list containing a container name and its applied configlets.
         """
-        all_configlet_names = [x[0] for x in self.get_configlet_names_ids()]
-        all_applied_containers = self.get_configlet_applied_containers(all_configlet_names)
+        per_container, _ = self._applied_container_maps(refresh, max_workers)
+        return [[key, list(value)] for key, value in per_container.items()]
 
-        result_dict = {}
-        for container_info in all_applied_containers:
-            if 'data' not in container_info or not container_info['data']:
-                continue
-            for data_entry in container_info['data']:
-                container_name = data_entry['containerName']
-                configlet_name = container_info['configletName']
-                if container_name in result_dict:
-                    result_dict[container_name].append(configlet_name)
-                else:
-                    result_dict[container_name] = [configlet_name]
+    def get_applied_containers_per_configlet(self, refresh: bool = False, max_workers: int = 8) -> List[List[str]]:
+        """
+        Retrieves the containers each configlet is applied to; the inverse of `get_applied_configlets_per_container`,
+        built from the same cached data.
 
-        result = [[key, value] for key, value in result_dict.items()]
-        return result
+        Parameters:
+        - refresh (bool, optional): Whether to rebuild the cached map. Defaults to False.
+        - max_workers (int, optional): The number of configlets looked up concurrently. Defaults to 8.
+
+        Returns:
+        - List[List[str]]: A list where each element is a list containing a configlet name and the containers it is applied to.
+        """
+        _, per_configlet = self._applied_container_maps(refresh, max_workers)
+        return [[key, list(value)] for key, value in per_configlet.items()]
 
     def post_create_config_diff(self, device_id: str, output_diff: bool = False, output_config: bool = False) -> dict:
         """
@@ -1407,15 +2102,14 @@ class AristaCVAAS(DependencyTracker):
         }
 
         try:
-            response = self.session.post(self.host_url + endpoint, headers=self.headers, json=body)
+            response = self._send('POST', endpoint, use_path=False, json=body)
             response.raise_for_status()  # Raises an HTTPError if the response status is 4xx or 5xx
 
-            # Assuming `_check_response` is a custom method to parse and raise appropriate errors
-            error_response = self._check_response(response)
-            if error_response:
-                return error_response
+            result = self._parse_response(response)
+            if result.error:
+                return result.error
 
-            response_data = response.json()
+            response_data = result.data
 
             # Corrected: Access the diff entries using the response data structure you've shared
             if len(response_data) > 1 and 'diff' in response_data[1]:
@@ -1492,14 +2186,12 @@ class AristaCVAAS(DependencyTracker):
             'name': cvaas_configlet_name
         }
 
-        response = self.session.post(self.host_url + self.path + endpoint, headers=self.headers, json=body)
+        result = self._request_json('POST', endpoint, json=body, compress_body=True)
 
-        # Assuming `_check_response` is a method that checks the response for errors
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        if result.error:
+            return result.error
 
-        return response.json()
+        return result.data
 
     def post_append_configlet(self, source_configlet_identifier: str, target_configlet_identifier: str) -> Union[Dict[str, str], Dict[str, Any]]:
         """
@@ -1541,14 +2233,109 @@ class AristaCVAAS(DependencyTracker):
             "name": target_configlet[0],
             "key": target_configlet[1]
         }
-        response = self.session.post(self.host_url + self.path + endpoint, headers=self.headers, json=body)
+        result = self._request_json('POST', endpoint, json=body, compress_body=True)
 
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        if result.error:
+            return result.error
 
-        return response.json()
+        return result.data
     
+    def post_update_configlet(self, configlet_key: str, cvaas_configlet_name: str, cvaas_config: str) -> dict:
+        """
+        Replaces the configuration of an existing configlet.
+
+        Parameters:
+        - configlet_key (str): The key (ID) of the configlet to update.
+        - cvaas_configlet_name (str): The configlet name.
+        - cvaas_config (str): The new configuration.
+
+        Returns:
+        - dict: The JSON response from the server, or an error message dictionary.
+        """
+        endpoint = '/configlet/updateConfiglet.do'
+        body = {
+            'config': cvaas_config,
+            'name': cvaas_configlet_name,
+            'key': configlet_key
+        }
+
+        result = self._request_json('POST', endpoint, json=body, compress_body=True)
+
+        if result.error:
+            return result.error
+
+        return result.data
+
+    def delete_configlets(self, configlets: List[Tuple[str, str]]) -> Union[Dict[str, str], Dict[str, Any]]:
+        """
+        Deletes configlets in a single request.
+
+        Parameters:
+        - configlets (List[Tuple[str, str]]): The (name, key) pairs of the configlets to delete.
+
+        Returns:
+        - Union[Dict[str, str], Dict[str, Any]]: The JSON response from the server, or an error message dictionary.
+        """
+        endpoint = '/configlet/deleteConfiglet.do'
+        body = [{'name': name, 'key': key} for name, key in configlets]
+
+        result = self._request_json('POST', endpoint, json=body)
+
+        if result.error:
+            return result.error
+
+        return result.data
+
+    def run_fleet_job(self, func: Callable[[Any], Any], items: Iterable[Any], journal_path: Optional[str] = None,
+                      key: Callable[[Any], str] = str, max_workers: int = 8, **kwargs: Any) -> Dict[str, Dict[str, Any]]:
+        """
+        Maps an operation over many devices or configlets with a worker pool, journaling finished items to
+        an append-only file so that a rerun after a crash or token expiry skips them. See FleetJobRunner.
+
+        Parameters:
+        - func (Callable[[Any], Any]): The operation, called with one item; SDK error dicts count as failures.
+        - items (Iterable[Any]): The items.
+        - journal_path (Optional[str], optional): The journal file; without one nothing is resumable. Defaults to None.
+        - key (Callable[[Any], str], optional): Returns the stable key of an item. Defaults to str.
+        - max_workers (int, optional): The number of concurrent calls. Defaults to 8.
+        - **kwargs: Passed through to FleetJobRunner (retry_errors, is_error, fsync, on_result).
+
+        Returns:
+        - Dict[str, Dict[str, Any]]: Item key -> {'status', 'result' or 'error', 'resumed'}.
+        """
+        return FleetJobRunner(func, journal_path, key=key, max_workers=max_workers, **kwargs).run(items)
+
+    def bulk_write_configlets(self, operations: List[Dict[str, Any]], max_workers: int = 8, dry_run: bool = False) -> List[Dict[str, Any]]:
+        """
+        Applies many configlet create, update, copy and append operations with a single name lookup,
+        concurrent body fetches, up-front conflict detection and bounded parallel writes.
+        See ConfigletBulkWriter for the operation format.
+
+        Parameters:
+        - operations (List[Dict[str, Any]]): The operations, e.g. {'op': 'copy', 'source': 'name', 'name': 'new name'}.
+        - max_workers (int, optional): The maximum number of concurrent requests. Defaults to 8.
+        - dry_run (bool, optional): Validate and plan without writing. Defaults to False.
+
+        Returns:
+        - List[Dict[str, Any]]: One result row per operation, in input order.
+        """
+        return ConfigletBulkWriter(self, max_workers=max_workers).run(operations, dry_run=dry_run)
+
+    def sync_configlet_directory(self, directory: str, dry_run: bool = False, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Pushes a directory of configlet files to the tenant, writing only the configlets whose normalized
+        content differs. See ConfigletDirectorySync.
+
+        Parameters:
+        - directory (str): The directory holding one file per configlet.
+        - dry_run (bool, optional): Report the create/update/delete sets without writing. Defaults to False.
+        - **kwargs: Passed through to ConfigletDirectorySync (suffix, index_path, name_regex, delete, max_workers, page_size).
+
+        Returns:
+        - Dict[str, Any]: The 'create', 'update' and 'delete' names, the 'unchanged' count and the per-operation 'results'.
+        """
+        return ConfigletDirectorySync(self, directory, **kwargs).sync(dry_run=dry_run)
+
     def post_get_device_managment_ip_addresses(self, device_id: str,configlets: List[Dict[str, Any]]) -> Union[Dict[str, str], Dict[str, Any]]:
         """
         This API is used to get a list of management IPs from Designed config
@@ -1569,13 +2356,12 @@ class AristaCVAAS(DependencyTracker):
           "netElementId": device_id,
           "pageType": "validatePage"
         }
-        response = self.session.post(self.host_url + self.path + endpoint, headers=self.headers, json=body)
+        result = self._request_json('POST', endpoint, json=body, mutates=False)
 
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
+        if result.error:
+            return result.error
 
-        return response.json()
+        return result.data
 
     def post_assign_image_to_device(self, device_id: str, node_ip_address: str, image= dict, id_type= 'netelement')  -> Union[Dict[str, str], Dict[str, Any]]:
         """
@@ -1588,24 +2374,7 @@ class AristaCVAAS(DependencyTracker):
         Returns:
         - Union[Dict[str, str], Dict[str, Any]]: The JSON response or an error message.
         """
-        # remove ignore_list from configlets
-        info = f"Apply image: {image['name']} to {id_type} {device_id}"
-        node_id = image['key']
-        post_data = [{'data': [{'info': info,
-                        'infoPreview': info,
-                        'note': '',
-                        'action': 'associate',
-                        'nodeType': 'imagebundle',
-                        'nodeId': node_id,
-                        'toId': device_id,
-                        'toIdType': id_type,
-                        'fromId': '',
-                        'nodeName': image['name'],
-                        'fromName': '',
-                        'toName': '',
-                        'childTasks': [],
-                        'parentTask': ''}]}
-]
+        post_data = [{'data': [image_assignment_action(device_id, image, id_type)]}]
         return self.post_provisioning_add_temp_actions(data_list=post_data)
 
     def post_assign_configlets_to_container(self, container_id: str, configlets: List[Dict[str, Any]], ignore_list: List[Dict[str, Any]] = []) -> Union[Dict[str, str], Dict[str, Any]]:
@@ -1620,23 +2389,7 @@ class AristaCVAAS(DependencyTracker):
         Returns:
         - Union[Dict[str, str], Dict[str, Any]]: The JSON response or an error message.
         """
-        # remove ignore_list from configlets
-        configlets = [x for x in configlets if x not in ignore_list]
-        post_data = [{'data': [{'action': 'associate',
-           'configletBuilderList': [],
-           'configletBuilderNamesList': [],
-           'configletList': configlets,
-           'fromId': '',
-           'fromName': '',
-           'ignoreConfigletBuilderList': [],
-           'ignoreConfigletBuilderNamesList': [],
-           'ignoreConfigletList': ignore_list,
-           'ignoreConfigletNamesList': [],
-           'nodeId': '',
-           'nodeName': '',
-           'nodeType': 'configlet',
-           'toId': container_id,
-           'toIdType': 'container'}]}]
+        post_data = [{'data': [configlet_assignment_action(container_id, 'container', configlets, ignore_list)]}]
         return self.post_provisioning_add_temp_actions(data_list=post_data)
     
     def post_assign_configlets_to_device(self, device_id: str, node_ip_address: str, configlets: List[Dict[str, Any]], ignore_list: List[Dict[str, Any]] = [])  -> Union[Dict[str, str], Dict[str, Any]]:
@@ -1652,29 +2405,12 @@ class AristaCVAAS(DependencyTracker):
         Returns:
         - Union[Dict[str, str], Dict[str, Any]]: The JSON response or an error message.
         """
-        # remove ignore_list from configlets
-        configlets = [x for x in configlets if x not in ignore_list]
-        post_data = [{'data': [{'action': 'associate',
-           'configletBuilderList': [],
-           'configletBuilderNamesList': [],
-           'configletList': configlets,
-           'fromId': '',
-           'fromName': '',
-           'ignoreConfigletBuilderList': [],
-           'ignoreConfigletBuilderNamesList': [],
-           'ignoreConfigletList': ignore_list,
-           'ignoreConfigletNamesList': [],
-           'nodeId': '',
-           'nodeName': '',
-           'nodeTargetIpAddress': node_ip_address,                     
-           'nodeType': 'configlet',
-           'toId': device_id,
-           'toIdType': 'netelement'}]}]
+        post_data = [{'data': [configlet_assignment_action(device_id, 'netelement', configlets, ignore_list, node_ip_address)]}]
         return self.post_provisioning_add_temp_actions(data_list=post_data)
 
     def assign_configlets_to_devices(
         self,
-        assignments: Union[pd.DataFrame, List[Dict[str, Any]]],
+        assignments: Union['pd.DataFrame', List[Dict[str, Any]]],
         *,
         configlets_are_names: bool = False,
         device_id_key: str = "device_id",
@@ -1691,6 +2427,8 @@ class AristaCVAAS(DependencyTracker):
         assignments: Union[pd.DataFrame, List[Dict[str, Any]]]
             Iterable describing each assignment.  Every entry must contain
             ``device_id_key``, ``node_ip_key`` and ``configlets_key``.
+            Configlets may be given as :class:`Configlet` models, in which
+            case their keys are used directly.
         configlets_are_names: bool, optional
             When ``True`` the values listed under ``configlets_key`` (and any
             ignore lists) are treated as configlet *names*.  They are resolved to
@@ -1728,7 +2466,9 @@ class AristaCVAAS(DependencyTracker):
         if batch_size <= 0:
             raise ValueError("batch_size must be greater than zero")
 
-        if isinstance(assignments, pd.DataFrame):
+        # A DataFrame can only be passed in if pandas is already imported.
+        pd = sys.modules.get('pandas')
+        if pd is not None and isinstance(assignments, pd.DataFrame):
             assignments = assignments.to_dict("records")
         else:
             assignments = list(assignments)
@@ -1744,6 +2484,8 @@ class AristaCVAAS(DependencyTracker):
 
         def canonical(value: Any) -> Any:
             """Return a hashable representation of ``value`` for set membership."""
+            if isinstance(value, Configlet):
+                return value.key
             if isinstance(value, dict):
                 # ``json.dumps(..., sort_keys=True)`` provides deterministic
                 # output that can safely be used as a unique identifier for the
@@ -1777,7 +2519,9 @@ class AristaCVAAS(DependencyTracker):
             return lookup
 
         def resolve_configlet(value: Any) -> Any:
-            """Convert a configlet name into an ID when required."""
+            """Convert a configlet name (or Configlet model) into an ID when required."""
+            if isinstance(value, Configlet):
+                return value.key
             if not configlets_are_names:
                 return value
             if not isinstance(value, str):
@@ -1866,6 +2610,63 @@ class AristaCVAAS(DependencyTracker):
 
         return results
 
+    def temp_action_queue(self, batch_size: int = 100) -> TempActionQueue:
+        """
+        Returns a new client-side temp action queue. Staged actions are coalesced (one configlet action per
+        target, cancelling actions dropped) and sent together by `flush()`, which also skips actions CVaaS
+        already holds. See TempActionQueue.
+
+        Parameters:
+        - batch_size (int, optional): The number of actions sent per addTempAction.do request. Defaults to 100.
+
+        Returns:
+        - TempActionQueue: The queue.
+        """
+        return TempActionQueue(self, batch_size=batch_size)
+
+    def import_topology(self, source: Union['pd.DataFrame', str], columns: Optional[List[str]] = None,
+                        sep: Optional[str] = None, parent_id: str = 'root', parent_name: str = '',
+                        batch_size: int = 100, skip_existing: bool = True, dry_run: bool = False,
+                        print_ascii: bool = False) -> Dict[str, Any]:
+        """
+        Creates a container tree from a table of hierarchy paths (a DataFrame or a CSV file) with batched
+        addTempAction.do requests. Shared path prefixes become one container each and parents are always
+        added before their children. See TopologyImport.
+
+        Parameters:
+        - source (Union[pd.DataFrame, str]): A DataFrame, or the path of a CSV file with a header row.
+        - columns (Optional[List[str]], optional): The level columns, top level first. Defaults to every column.
+        - sep (Optional[str], optional): Splits a single path column into levels, e.g. '/'. Defaults to None.
+        - parent_id (str, optional): The container key the top level is created under. Defaults to 'root'.
+        - parent_name (str, optional): The name of that container; empty for the root. Defaults to ''.
+        - batch_size (int, optional): The number of actions per request. Defaults to 100.
+        - skip_existing (bool, optional): Whether containers that already exist (by name) are reused instead
+          of added. Defaults to True.
+        - dry_run (bool, optional): Whether to only return the payloads that would be sent. Defaults to False.
+        - print_ascii (bool, optional): Whether to print the ASCII tree. Defaults to False.
+
+        Returns:
+        - Dict[str, Any]: 'containers', 'existing', 'requests', 'results' and 'node_ids' (see
+          TopologyImport.submit), or for a dry run 'containers', 'existing', 'payloads' and 'node_ids'.
+        """
+        from .topology import TopologyImport
+
+        existing = {}
+        if skip_existing:
+            containers = self.get_inventory_containers()
+            if not isinstance(containers, list):
+                raise RuntimeError(f"Unable to fetch containers: {containers}")
+            existing = {container.get('Name', container.get('name')): container.get('Key', container.get('key'))
+                        for container in containers}
+        topology = TopologyImport(source, columns=columns, sep=sep, parent_id=parent_id, parent_name=parent_name,
+                                  existing=existing)
+        if print_ascii:
+            print(topology.ascii_tree())
+        if dry_run:
+            return {'containers': len(topology), 'existing': int(topology.nodes['exists'].sum()),
+                    'payloads': list(topology.iter_batches(batch_size)), 'node_ids': topology.node_ids()}
+        return topology.submit(self, batch_size=batch_size)
+
     def post_provisioning_save_temp_actions(self, data: Dict[str, Any]) -> Union[Dict[str, str], Dict[str, Any]]:
         """
         Sends a POST request to save temporary provisioning actions.
@@ -1877,11 +2678,10 @@ class AristaCVAAS(DependencyTracker):
         - Union[Dict[str, str], Dict[str, Any]]: Error message or JSON response from the server.
         """
         endpoint = f'/ztp/saveTopology.do'
-        response = self.session.post(self.host_url + self.path + endpoint, headers=self.headers, data=json.dumps(data))
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
-        return response.json()
+        result = self._request_json('POST', endpoint, data=json.dumps(data))
+        if result.error:
+            return result.error
+        return result.data
     
     def post_provisioning_add_temp_actions(self, data_list: List[Dict[str, Any]], nodeId: str = "root") -> List[Union[Dict[str, str], Dict[str, Any]]]:
         """
@@ -1897,12 +2697,11 @@ class AristaCVAAS(DependencyTracker):
         results = []
         for data in data_list:
             endpoint = f'/ztp/addTempAction.do?format=list&queryParam=&nodeId={nodeId}'
-            response = self.session.post(self.host_url + self.path + endpoint, headers=self.headers, data=json.dumps(data))
-            error_response = self._check_response(response)
-            if error_response:
-                results.append({'error': error_response})
+            result = self._request_json('POST', endpoint, data=json.dumps(data))
+            if result.error:
+                results.append({'error': result.error})
             else:
-                results.append(response.json())
+                results.append(result.data)
         return results
     
     def get_provisioning_temp_actions(self) -> Union[Dict[str, str], Dict[str, Any]]:
@@ -1913,11 +2712,23 @@ class AristaCVAAS(DependencyTracker):
         - Union[Dict[str, str], Dict[str, Any]]: Error message or JSON response from the server.
         """
         endpoint = f'/ztp/getAllTempActions.do?startIndex=0&endIndex=1000'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
-        return response.json()
+        result = self._request_json('GET', endpoint)
+        if result.error:
+            return result.error
+        return result.data
+    
+    def iter_provisioning_temp_actions(self, chunk_size: int = 65536) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming variant of `get_provisioning_temp_actions`: yields temporary actions one at a time.
+
+        Parameters:
+        - chunk_size (int, optional): The number of bytes read from the socket at a time. Defaults to 65536.
+
+        Returns:
+        - Iterator[Dict[str, Any]]: The temporary provisioning actions.
+        """
+        endpoint = f'/ztp/getAllTempActions.do?startIndex=0&endIndex=1000'
+        return self._stream_json_items(endpoint, key='data', chunk_size=chunk_size)
     
     def get_provisioning_filter_topology(self, value_pattern: Optional[str] = None) -> Union[Dict[str, str], Dict[str, Any]]:
         """
@@ -1930,11 +2741,10 @@ class AristaCVAAS(DependencyTracker):
         - Union[Dict[str, str], Dict[str, Any]]: Error message or JSON response from the server.
         """
         endpoint = f'/provisioning/v3/filterTopology.do?queryParam=a&format=list&startIndex=0&endIndex=1000'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
-        response_data = response.json()
+        result = self._request_json('GET', endpoint)
+        if result.error:
+            return result.error
+        response_data = result.data
         if value_pattern:
             return self._find_matching_dicts(response_data, value_pattern)
         else:
@@ -1951,11 +2761,10 @@ class AristaCVAAS(DependencyTracker):
         - Union[Dict[str, str], Dict[str, Any]]: Error message or JSON response from the server.
         """
         endpoint = f'/provisioning/deleteAllTempAction.do'
-        response = self.session.delete(self.host_url + self.path + endpoint, headers=self.headers)
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
-        response_data = response.json()
+        result = self._request_json('DELETE', endpoint)
+        if result.error:
+            return result.error
+        response_data = result.data
         if value_pattern:
             return self._find_matching_dicts(response_data, value_pattern)
         else:
@@ -1969,11 +2778,10 @@ class AristaCVAAS(DependencyTracker):
         - Union[Dict[str, str], Dict[str, Any]]: Error message or JSON response from the server.
         """
         endpoint = f'/arista.serviceaccount.v1.TokenService/GetAll'
-        response = self.session.get(self.host_url + self.path + endpoint, headers=self.headers)
-        error_response = self._check_response(response)
-        if error_response:
-            return error_response
-        return response.json()
+        result = self._request_json('GET', endpoint)
+        if result.error:
+            return result.error
+        return result.data
     
     def get_container_ids_by_name(self, container_names: Union[str, List[str]]) -> List[Optional[str]]:
         """
@@ -2011,3 +2819,27 @@ class AristaCVAAS(DependencyTracker):
                 container_ids_list.append(container_id)
         
         return container_ids_list
+
+
+def _traced(method: Callable) -> Callable:
+    """Wraps a public helper so that, with tracing enabled, each call runs in a span named after it."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: 'AristaCVAAS', *args: Any, **kwargs: Any) -> Any:
+        if not self.tracer.enabled:
+            return method(self, *args, **kwargs)
+        with self.tracer.span(name, {'code.function': name}) as span:
+            result = method(self, *args, **kwargs)
+            if is_error_result(result):
+                span.set_status('error')
+            return result
+    return wrapper
+
+
+# Streaming helpers (iter_*) return generators whose requests run while the caller iterates; their HTTP
+# spans attach to whatever span is current at that point, so only the other public methods are wrapped.
+for _name, _member in list(vars(AristaCVAAS).items()):
+    if not _name.startswith(('_', 'iter_')) and inspect.isfunction(_member) and not inspect.isgeneratorfunction(_member):
+        setattr(AristaCVAAS, _name, _traced(_member))
+del _name, _member
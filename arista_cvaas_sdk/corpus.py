@@ -0,0 +1,137 @@
+import json
+import mmap
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+BODIES_FILE = 'bodies.bin'
+INDEX_FILE = 'index.json'
+
+
+class ConfigletCorpus:
+    """
+    Read-only, memory-mapped store of configlet bodies.
+
+    A corpus directory holds `bodies.bin`, every body encoded as UTF-8 and preceded by a newline, and
+    `index.json`, the key, name, version, offset and length of each body. Opening a corpus maps
+    `bodies.bin` read-only, so searches read bodies from the operating system's page cache, shared by
+    every process that opens the same corpus, instead of fetching them. Each body is decoded and searched
+    on its own with a str regex, so patterns behave exactly as `re.search` on the configlet text.
+    Rebuilding replaces the files atomically; readers keep the version they opened until they reopen.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        with open(os.path.join(directory, INDEX_FILE)) as f:
+            index = json.load(f)
+        self.keys: List[str] = index['keys']
+        self.names: List[str] = index['names']
+        self.versions: List[Any] = index['versions']
+        self.offsets: List[int] = index['offsets']
+        self.lengths: List[int] = index['lengths']
+        self._positions = {key: position for position, key in enumerate(self.keys)}
+        self._file = open(os.path.join(directory, BODIES_FILE), 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+    @classmethod
+    def build(cls, directory: str, configlets: Iterable[Dict[str, Any]]) -> 'ConfigletCorpus':
+        """
+        Writes a corpus from configlet dicts (for example `sdk.iter_configlets()`), one body at a time.
+
+        Parameters:
+        - directory (str): The corpus directory, created if needed.
+        - configlets (Iterable[Dict[str, Any]]): Configlets with 'key', 'name', 'config' and 'dateTimeInLongFormat'.
+
+        Returns:
+        - ConfigletCorpus: The opened corpus.
+        """
+        os.makedirs(directory, exist_ok=True)
+        index: Dict[str, List[Any]] = {'keys': [], 'names': [], 'versions': [], 'offsets': [], 'lengths': []}
+        bodies_path = os.path.join(directory, BODIES_FILE)
+        offset = 0
+        with open(f'{bodies_path}.tmp', 'wb') as f:
+            for configlet in configlets:
+                body = (configlet.get('config') or '').encode('utf-8')
+                # The newline separator lets MULTILINE '^' match at the start of every body.
+                f.write(b'\n')
+                f.write(body)
+                offset += 1
+                index['keys'].append(configlet.get('key'))
+                index['names'].append(configlet.get('name'))
+                index['versions'].append(configlet.get('dateTimeInLongFormat'))
+                index['offsets'].append(offset)
+                index['lengths'].append(len(body))
+                offset += len(body)
+        with open(os.path.join(directory, f'{INDEX_FILE}.tmp'), 'w') as f:
+            json.dump(index, f)
+        os.replace(f'{bodies_path}.tmp', bodies_path)
+        os.replace(os.path.join(directory, f'{INDEX_FILE}.tmp'), os.path.join(directory, INDEX_FILE))
+        return cls(directory)
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'ConfigletCorpus':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._positions
+
+    def _span(self, position: int) -> Tuple[int, int]:
+        return self.offsets[position], self.offsets[position] + self.lengths[position]
+
+    def body(self, key: str) -> memoryview:
+        """Returns a zero-copy view of a configlet body."""
+        start, end = self._span(self._positions[key])
+        return memoryview(self._map)[start:end]
+
+    def text(self, key: str) -> str:
+        """Returns a configlet body decoded to str."""
+        return self._body_text(self._positions[key])
+
+    @staticmethod
+    def _compile(pattern: Union[str, bytes, 're.Pattern'], flags: int = 0) -> 're.Pattern':
+        if isinstance(pattern, re.Pattern):
+            if isinstance(pattern.pattern, bytes):
+                return re.compile(pattern.pattern.decode('utf-8'), pattern.flags)
+            return pattern
+        if isinstance(pattern, bytes):
+            pattern = pattern.decode('utf-8')
+        return re.compile(pattern, flags)
+
+    def _body_text(self, position: int) -> str:
+        start, end = self._span(position)
+        return self._map[start:end].decode('utf-8')
+
+    def search(self, pattern: Union[str, bytes, 're.Pattern'], flags: int = 0) -> Iterator[Tuple[str, str, 're.Match']]:
+        """
+        Finds the configlets whose body matches a regex.
+
+        Every body is searched separately, so '^', '$' and '\\Z' anchor to the body as they do in
+        `re.search(pattern, configlet['config'])`, and matches never span two configlets.
+
+        Parameters:
+        - pattern (Union[str, bytes, re.Pattern]): The regex; bytes patterns are decoded from UTF-8.
+        - flags (int, optional): re flags for uncompiled patterns. Defaults to 0.
+
+        Returns:
+        - Iterator[Tuple[str, str, re.Match]]: (key, name, first match) per matching configlet, in corpus order.
+        """
+        regex = self._compile(pattern, flags)
+        for position, key in enumerate(self.keys):
+            match = regex.search(self._body_text(position))
+            if match is not None:
+                yield key, self.names[position], match
+
+    def findall(self, pattern: Union[str, bytes, 're.Pattern'], key: str, flags: int = 0) -> List[Any]:
+        """Returns `re.findall` over one body."""
+        return self._compile(pattern, flags).findall(self._body_text(self._positions[key]))
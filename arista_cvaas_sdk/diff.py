@@ -0,0 +1,232 @@
+import hashlib
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# List items that are dicts carrying one of these fields (with unique values) are matched by it rather than
+# by position, so an inserted device or container does not show up as a change of every later item.
+DEFAULT_IDENTITY_KEYS = ('key', 'id', 'systemMacAddress', 'serialNumber', 'workOrderId', 'name', 'Key', 'Name')
+
+_CONTAINERS = (dict, list, tuple)
+
+
+class Change(NamedTuple):
+    """
+    One difference between two models.
+
+    `op` is 'add', 'remove' or 'change'. `path` addresses the value from the model root as a tuple of dict
+    keys and list indexes; list indexes refer to model_b, except for removes, which refer to model_a.
+    """
+    op: str
+    path: Tuple[Any, ...]
+    old: Any
+    new: Any
+
+    @property
+    def path_str(self) -> str:
+        return format_path(self.path)
+
+
+def format_path(path: Iterable[Any]) -> str:
+    """Formats a change path, e.g. ('list', 'childContainerList', 3, 'name') -> 'list.childContainerList[3].name'."""
+    parts = []
+    for element in path:
+        if isinstance(element, int):
+            parts.append(f'[{element}]')
+        else:
+            parts.append(('.' if parts else '') + str(element))
+    return ''.join(parts)
+
+
+def _canonical(value: Any) -> str:
+    # Numbers that compare equal (True == 1 == 1.0) get one encoding, so digests agree with ==.
+    if value.__class__ is str:
+        return repr(value)
+    if isinstance(value, bool) or (isinstance(value, float) and value.is_integer()):
+        return repr(int(value))
+    return repr(value)
+
+
+def _leaf(value: Any) -> bytes:
+    # repr() escapes control characters, so neither the \x00 terminator nor the \x01/\x03 tags can occur in it.
+    return b'\x02' + _canonical(value).encode('utf-8', 'backslashreplace') + b'\x00'
+
+
+def _sorted_keys(node: Dict[Any, Any]) -> List[Any]:
+    try:
+        return sorted(node)
+    except TypeError:
+        return sorted(node, key=repr)
+
+
+class SubtreeHasher:
+    """
+    Computes a 128-bit digest for every dict and list of one or more models, bottom-up and without recursion.
+
+    Equal digests mean subtrees that compare equal with == (dict key order is ignored, and 1, 1.0 and
+    True hash alike), so a diff can skip a shared subtree with one comparison. Digests are memoized by object identity for as long as the hasher lives, which
+    is only valid while the hashed models are neither mutated nor freed.
+    """
+
+    def __init__(self) -> None:
+        self._digests: Dict[int, bytes] = {}
+
+    def key(self, value: Any) -> bytes:
+        """Returns a byte string that is equal for equal values: the digest of a container, or a leaf encoding."""
+        if isinstance(value, _CONTAINERS):
+            digest = self._digests.get(id(value))
+            return digest if digest is not None else self.digest(value)
+        return _leaf(value)
+
+    def digest(self, root: Any) -> bytes:
+        """Returns the digest of a model, hashing every subtree not hashed before."""
+        digests = self._digests
+        if not isinstance(root, _CONTAINERS):
+            return hashlib.blake2b(_leaf(root), digest_size=16).digest()
+        stack: List[Tuple[Any, bool]] = [(root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if id(node) in digests:
+                continue
+            is_dict = isinstance(node, dict)
+            if not children_done:
+                stack.append((node, True))
+                children = node.values() if is_dict else node
+                stack.extend((child, False) for child in children
+                             if isinstance(child, _CONTAINERS) and id(child) not in digests)
+                continue
+            parts = [b'{' if is_dict else b'[']
+            if is_dict:
+                for key in _sorted_keys(node):
+                    child = node[key]
+                    parts.append(b'\x03' + _canonical(key).encode('utf-8', 'backslashreplace') + b'\x00')
+                    parts.append(b'\x01' + digests[id(child)] if isinstance(child, _CONTAINERS) else _leaf(child))
+            else:
+                for child in node:
+                    parts.append(b'\x01' + digests[id(child)] if isinstance(child, _CONTAINERS) else _leaf(child))
+            digests[id(node)] = hashlib.blake2b(b''.join(parts), digest_size=16).digest()
+        return digests[id(root)]
+
+
+def _identity_key(items_a: List[Any], items_b: List[Any], identity_keys: Iterable[str]) -> Optional[str]:
+    """Returns the first identity field that every item on both sides has, with unique values per side."""
+    if not items_a or not items_b or not all(isinstance(x, dict) for x in items_a) \
+            or not all(isinstance(x, dict) for x in items_b):
+        return None
+    for field in identity_keys:
+        for items in (items_a, items_b):
+            values = [item.get(field) for item in items]
+            if None in values or not all(isinstance(v, (str, int)) for v in values) or len(set(values)) != len(values):
+                break
+        else:
+            return field
+    return None
+
+
+def diff_models(model_a: Any, model_b: Any, identity_keys: Iterable[str] = DEFAULT_IDENTITY_KEYS,
+                hasher: Optional[SubtreeHasher] = None) -> Iterator[Change]:
+    """
+    Yields the structural differences between two nested dict/list models, depth first.
+
+    Subtrees are compared by digest first, so identical parts of large models cost one comparison each.
+    Leaves are compared with ==, so 1, 1.0 and True are not reported as changes of one another.
+    Dicts are compared key by key. List items are first matched by content, which makes reordering free;
+    the remaining items are matched by an identity field (see DEFAULT_IDENTITY_KEYS) when they all have
+    one, and by position otherwise.
+
+    Parameters:
+    - model_a (Any): The old model.
+    - model_b (Any): The new model.
+    - identity_keys (Iterable[str], optional): The fields that identify list items. Defaults to DEFAULT_IDENTITY_KEYS.
+    - hasher (Optional[SubtreeHasher], optional): A hasher to reuse digests across diffs of unchanged models.
+
+    Returns:
+    - Iterator[Change]: The 'add', 'remove' and 'change' entries.
+    """
+    hasher = hasher or SubtreeHasher()
+    identity_keys = tuple(identity_keys)
+    key = hasher.key
+    stack: List[Tuple[Tuple[Any, ...], Any, Any]] = [((), model_a, model_b)]
+    while stack:
+        path, a, b = stack.pop()
+        if isinstance(a, dict) and isinstance(b, dict):
+            if key(a) == key(b):
+                continue
+            pending = []
+            for name in a:
+                if name not in b:
+                    yield Change('remove', path + (name,), a[name], None)
+                elif key(a[name]) != key(b[name]):
+                    pending.append((path + (name,), a[name], b[name]))
+            for name in b:
+                if name not in a:
+                    yield Change('add', path + (name,), None, b[name])
+            stack.extend(reversed(pending))
+        elif isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+            if key(a) == key(b):
+                continue
+            changes, pending = _diff_lists(path, a, b, key, identity_keys)
+            yield from changes
+            stack.extend(reversed(pending))
+        elif a != b:
+            yield Change('change', path, a, b)
+
+
+def _diff_lists(path: Tuple[Any, ...], a: List[Any], b: List[Any], key: Any,
+                identity_keys: Tuple[str, ...]) -> Tuple[List[Change], List[Tuple[Tuple[Any, ...], Any, Any]]]:
+    positions = defaultdict(deque)
+    for index, item in enumerate(b):
+        positions[key(item)].append(index)
+    unmatched_a = []
+    for index, item in enumerate(a):
+        candidates = positions.get(key(item))
+        if candidates:
+            candidates.popleft()
+        else:
+            unmatched_a.append(index)
+    unmatched_b = sorted(index for candidates in positions.values() for index in candidates)
+
+    changes: List[Change] = []
+    pending: List[Tuple[Tuple[Any, ...], Any, Any]] = []
+    field = _identity_key([a[i] for i in unmatched_a], [b[j] for j in unmatched_b], identity_keys)
+    if field is not None:
+        by_identity = {b[j][field]: j for j in unmatched_b}
+        for i in unmatched_a:
+            j = by_identity.pop(a[i][field], None)
+            if j is None:
+                changes.append(Change('remove', path + (i,), a[i], None))
+            else:
+                pending.append((path + (j,), a[i], b[j]))
+        changes.extend(Change('add', path + (j,), None, b[j]) for j in sorted(by_identity.values()))
+    else:
+        for i, j in zip(unmatched_a, unmatched_b):
+            pending.append((path + (j,), a[i], b[j]))
+        changes.extend(Change('remove', path + (i,), a[i], None) for i in unmatched_a[len(unmatched_b):])
+        changes.extend(Change('add', path + (j,), None, b[j]) for j in unmatched_b[len(unmatched_a):])
+    return changes, pending
+
+
+def iter_leaves(model: Any, into_dicts: bool = True) -> Iterator[Any]:
+    """
+    Yields the leaves of a nested model in document order, without recursion.
+
+    Parameters:
+    - model (Any): The model.
+    - into_dicts (bool, optional): Whether dict values are descended into; when False only lists are
+      flattened and dicts are yielded as leaves. Defaults to True.
+
+    Returns:
+    - Iterator[Any]: The leaves.
+    """
+    containers = (dict, list) if into_dicts else (list,)
+    if not isinstance(model, containers):
+        yield model
+        return
+    stack = [iter(model.values() if isinstance(model, dict) else model)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, containers):
+                stack.append(iter(item.values() if isinstance(item, dict) else item))
+                break
+            yield item
+        else:
+            stack.pop()
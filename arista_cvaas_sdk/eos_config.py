@@ -0,0 +1,237 @@
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+
+class ConfigBlock:
+    """
+    A single configuration line together with the lines nested beneath it.
+
+    Blocks are produced by EOSConfigParser and are kept deliberately small: the original
+    line, its line number and the list of child blocks. The set of stripped child lines
+    is computed on first use so membership checks are O(1) afterwards.
+    """
+    __slots__ = ('line', 'lineno', 'children', '_child_lines')
+
+    def __init__(self, line: str, lineno: int) -> None:
+        self.line = line
+        self.lineno = lineno
+        self.children: List['ConfigBlock'] = []
+        self._child_lines: Optional[frozenset] = None
+
+    def __repr__(self) -> str:
+        return f"ConfigBlock({self.line.strip()!r}, children={len(self.children)})"
+
+    @property
+    def header(self) -> str:
+        """The line without surrounding whitespace."""
+        return self.line.strip()
+
+    @property
+    def child_lines(self) -> frozenset:
+        """The stripped text of the immediate child lines."""
+        if self._child_lines is None:
+            self._child_lines = frozenset(child.line.strip() for child in self.children)
+        return self._child_lines
+
+    def contains(self, line: str, deep: bool = False) -> bool:
+        """
+        Checks whether the block holds a line.
+
+        Parameters:
+        - line (str): The line to look for. Leading and trailing whitespace is ignored.
+        - deep (bool, optional): Whether to look at every descendant instead of only the immediate children. Defaults to False.
+
+        Returns:
+        - bool: True if the line is present in the block.
+        """
+        line = line.strip()
+        if line in self.child_lines:
+            return True
+        if deep:
+            return any(child.contains(line, deep=True) for child in self.children if child.children)
+        return False
+
+    def iter_lines(self):
+        """Yields the block line followed by every descendant line, in configuration order."""
+        stack = [self]
+        while stack:
+            block = stack.pop()
+            yield block.line
+            stack.extend(reversed(block.children))
+
+    def text(self) -> str:
+        """Returns the block and its descendants as configuration text."""
+        return '\n'.join(self.iter_lines())
+
+
+class ConfigTree:
+    """
+    The parsed form of an EOS configuration: a list of top-level blocks plus an index of
+    those blocks by their first keyword (e.g. 'interface', 'router', 'vlan').
+    """
+    __slots__ = ('blocks', 'digest', '_keyword_index', '_header_index')
+
+    def __init__(self, blocks: List[ConfigBlock], digest: str) -> None:
+        self.blocks = blocks
+        self.digest = digest
+        self._keyword_index: Dict[str, List[ConfigBlock]] = {}
+        self._header_index: Dict[str, ConfigBlock] = {}
+        for block in blocks:
+            header = block.header
+            self._keyword_index.setdefault(header.split(' ', 1)[0], []).append(block)
+            self._header_index.setdefault(header, block)
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def get(self, header: str) -> Optional[ConfigBlock]:
+        """Returns the top-level block whose line is exactly `header`, or None."""
+        return self._header_index.get(header.strip())
+
+    def sections(self, section: Optional[str] = None, regex: Optional[str] = None) -> List[ConfigBlock]:
+        """
+        Returns top-level blocks, optionally narrowed to a section type and/or a header regex.
+
+        Parameters:
+        - section (Optional[str], optional): A section prefix such as 'interface' or 'router bgp'. The first word is
+                                             resolved through the keyword index, the remainder is matched as a prefix.
+        - regex (Optional[str], optional): A regex pattern matched against the stripped block header.
+
+        Returns:
+        - List[ConfigBlock]: The matching blocks in configuration order.
+        """
+        if section:
+            section = section.strip()
+            blocks = self._keyword_index.get(section.split(' ', 1)[0], [])
+            if ' ' in section:
+                blocks = [block for block in blocks if block.header.startswith(section)]
+        else:
+            blocks = self.blocks
+        if regex:
+            pattern = re.compile(regex)
+            blocks = [block for block in blocks if pattern.search(block.header)]
+        return blocks
+
+    def sections_missing(self, section: str, line: str, regex: Optional[str] = None, deep: bool = False) -> List[ConfigBlock]:
+        """
+        Returns the blocks of a section type that do not contain a line,
+        e.g. `sections_missing('interface Ethernet', 'no shutdown')`.
+        """
+        return [block for block in self.sections(section, regex) if not block.contains(line, deep=deep)]
+
+    def sections_containing(self, section: str, line: str, regex: Optional[str] = None, deep: bool = False) -> List[ConfigBlock]:
+        """Returns the blocks of a section type that contain a line."""
+        return [block for block in self.sections(section, regex) if block.contains(line, deep=deep)]
+
+    def find(self, pattern: str) -> List[Tuple[Tuple[str, ...], str]]:
+        """
+        Searches every line of the tree with a regex pattern.
+
+        Parameters:
+        - pattern (str): The regex pattern to search for.
+
+        Returns:
+        - List[Tuple[Tuple[str, ...], str]]: One entry per matching line, holding the stripped headers of its
+                                             parent blocks and the matching line itself.
+        """
+        regex = re.compile(pattern)
+        results = []
+        stack = [((), block) for block in reversed(self.blocks)]
+        while stack:
+            parents, block = stack.pop()
+            if regex.search(block.line):
+                results.append((parents, block.line))
+            if block.children:
+                child_parents = parents + (block.header,)
+                stack.extend((child_parents, child) for child in reversed(block.children))
+        return results
+
+
+class EOSConfigParser:
+    """
+    Indentation-aware parser for EOS configuration text.
+
+    Parsed trees are cached by the SHA-1 digest of the configuration, so parsing the same
+    configlet or running config again is a dictionary lookup.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._cache: 'OrderedDict[str, ConfigTree]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(config: str) -> str:
+        """Returns the content hash used as the cache key for `config`."""
+        return hashlib.sha1(config.encode('utf-8')).hexdigest()
+
+    def parse(self, config: str) -> ConfigTree:
+        """
+        Parses a configuration into a ConfigTree, reusing the cached tree for identical content.
+
+        Parameters:
+        - config (str): The configuration text.
+
+        Returns:
+        - ConfigTree: The parsed configuration.
+        """
+        digest = self.digest(config)
+        tree = self._cache.get(digest)
+        if tree is not None:
+            self.hits += 1
+            self._cache.move_to_end(digest)
+            return tree
+
+        self.misses += 1
+        tree = ConfigTree(self._build_blocks(config), digest)
+        self._cache[digest] = tree
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return tree
+
+    def cache_info(self) -> Dict[str, int]:
+        """Returns hit, miss and size counters for the tree cache."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._cache)}
+
+    def clear(self) -> None:
+        """Drops every cached tree."""
+        self._cache.clear()
+
+    @staticmethod
+    def _build_blocks(config: str) -> List[ConfigBlock]:
+        """Builds the list of top-level blocks with a single pass over the lines."""
+        roots: List[ConfigBlock] = []
+        stack: List[Tuple[int, ConfigBlock]] = []
+        banner: Optional[ConfigBlock] = None
+
+        for lineno, raw_line in enumerate(config.splitlines(), start=1):
+            line = raw_line.rstrip()
+
+            # Banner bodies are not indented, everything up to EOF belongs to the banner.
+            if banner is not None:
+                banner.children.append(ConfigBlock(line, lineno))
+                if line.strip() == 'EOF':
+                    banner = None
+                continue
+
+            stripped = line.lstrip(' ')
+            if not stripped or stripped.startswith('!') or stripped == 'end':
+                continue
+
+            indent = len(line) - len(stripped)
+            block = ConfigBlock(line, lineno)
+            while stack and stack[-1][0] >= indent:
+                stack.pop()
+            if stack:
+                stack[-1][1].children.append(block)
+            else:
+                roots.append(block)
+            stack.append((indent, block))
+
+            if indent == 0 and stripped.startswith('banner '):
+                banner = block
+
+        return roots
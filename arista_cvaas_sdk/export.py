@@ -0,0 +1,305 @@
+import os
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pyarrow as pa
+
+from ._concurrency import map_concurrently
+
+if TYPE_CHECKING:
+    from .client import AristaCVAAS
+
+# (column, source dict key or callable, type, dictionary encoded)
+ColumnSpec = Tuple[str, Union[str, Callable[[Dict[str, Any]], Any]], str, bool]
+
+TABLES: Dict[str, List[ColumnSpec]] = {
+    'configlets': [
+        ('key', 'key', 'string', False),
+        ('name', 'name', 'string', False),
+        ('type', 'type', 'string', True),
+        ('user', 'user', 'string', True),
+        ('note', 'note', 'string', False),
+        ('config', 'config', 'large_string', False),
+        ('updated', 'dateTimeInLongFormat', 'timestamp_ms', False),
+        ('container_count', 'containerCount', 'int32', False),
+        ('net_element_count', 'netElementCount', 'int32', False),
+        ('reconciled', 'reconciled', 'bool', False),
+        ('is_auto_builder', 'isAutoBuilder', 'string', True),
+        ('type_studio_configlet', 'typeStudioConfiglet', 'bool', False),
+    ],
+    'devices': [
+        ('serial_number', 'serialNumber', 'string', False),
+        ('system_mac_address', 'systemMacAddress', 'string', False),
+        ('hostname', 'hostname', 'string', False),
+        ('fqdn', 'fqdn', 'string', False),
+        ('ip_address', 'ipAddress', 'string', False),
+        ('model_name', 'modelName', 'string', True),
+        ('version', 'version', 'string', True),
+        ('internal_version', 'internalVersion', 'string', True),
+        ('architecture', 'architecture', 'string', True),
+        ('domain_name', 'domainName', 'string', True),
+        ('device_type', 'deviceType', 'string', True),
+        ('streaming_status', 'streamingStatus', 'string', True),
+        ('status', 'status', 'string', True),
+        ('compliance_code', 'complianceCode', 'string', True),
+        ('compliance_indication', 'complianceIndication', 'string', True),
+        ('parent_container_key', 'parentContainerKey', 'string', True),
+        ('ztp_mode', 'ztpMode', 'bool', False),
+        ('mlag_enabled', 'mlagEnabled', 'bool', False),
+        ('bootup_timestamp', 'bootupTimestamp', 'float64', False),
+    ],
+    'containers': [
+        ('key', 'Key', 'string', False),
+        ('name', 'Name', 'string', False),
+        ('mode', 'Mode', 'string', True),
+        ('created_by', 'CreatedBy', 'string', True),
+        ('created_on', 'CreatedOn', 'timestamp_ms', False),
+    ],
+    'temp_actions': [
+        ('action', 'action', 'string', True),
+        ('node_type', 'nodeType', 'string', True),
+        ('node_id', 'nodeId', 'string', False),
+        ('node_name', 'nodeName', 'string', False),
+        ('to_id', 'toId', 'string', True),
+        ('to_id_type', 'toIdType', 'string', True),
+        ('to_name', 'toName', 'string', True),
+        ('from_id', 'fromId', 'string', True),
+        ('from_name', 'fromName', 'string', True),
+        ('info', 'info', 'string', False),
+        ('configlet_list', 'configletList', 'list_string', False),
+        ('configlet_names_list', 'configletNamesList', 'list_string', False),
+        ('ignore_configlet_list', 'ignoreConfigletList', 'list_string', False),
+    ],
+    'assignments': [
+        ('configlet_key', 'configletKey', 'string', True),
+        ('configlet_name', 'configletName', 'string', True),
+        ('target_type', 'targetType', 'string', True),
+        ('target_id', lambda x: x.get('containerKey') or x.get('key') or x.get('macAddress') or x.get('systemMacAddress'), 'string', True),
+        ('target_name', lambda x: x.get('containerName') if x.get('targetType') == 'container' else x.get('hostName'), 'string', True),
+        ('ip_address', 'ipAddress', 'string', False),
+        ('applied_by', 'appliedBy', 'string', True),
+        ('applied_date', 'appliedDate', 'timestamp_ms', False),
+    ],
+}
+
+_ARROW_TYPES = {
+    'string': pa.string(),
+    'large_string': pa.large_string(),
+    'int32': pa.int32(),
+    'int64': pa.int64(),
+    'float64': pa.float64(),
+    'bool': pa.bool_(),
+    'timestamp_ms': pa.timestamp('ms'),
+    'list_string': pa.list_(pa.string()),
+}
+
+_PYTHON_TYPES = {
+    'string': str, 'large_string': str, 'int32': int, 'int64': int, 'float64': (int, float), 'bool': bool,
+    'timestamp_ms': int, 'list_string': list,
+}
+
+
+class ColumnBuilder:
+    """
+    Accumulates rows straight into per-column value lists and emits typed Arrow record batches,
+    so no intermediate list of row dicts is ever built. Values of the wrong type become nulls.
+    """
+
+    def __init__(self, columns: List[ColumnSpec], batch_rows: int = 50000) -> None:
+        self.columns = columns
+        self.batch_rows = batch_rows
+        self._getters = [source if callable(source) else (lambda item, key=source: item.get(key))
+                         for _, source, _, _ in columns]
+        self._values: List[List[Any]] = [[] for _ in columns]
+        self.schema = pa.schema([
+            pa.field(name, pa.dictionary(pa.int32(), _ARROW_TYPES[kind]) if dictionary else _ARROW_TYPES[kind])
+            for name, _, kind, dictionary in columns
+        ])
+        self.rows = 0
+
+    def append(self, item: Dict[str, Any]) -> Optional[pa.RecordBatch]:
+        """Adds one row; returns a record batch whenever `batch_rows` rows have accumulated."""
+        for values, getter in zip(self._values, self._getters):
+            values.append(getter(item))
+        self.rows += 1
+        if len(self._values[0]) >= self.batch_rows:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[pa.RecordBatch]:
+        """Returns the accumulated rows as a record batch (None if there are none) and starts a new one."""
+        if not self._values[0]:
+            return None
+        arrays = []
+        for (_, _, kind, dictionary), values in zip(self.columns, self._values):
+            expected = _PYTHON_TYPES[kind]
+            if kind in ('string', 'large_string'):
+                values = [value if value is None or isinstance(value, str) else str(value) for value in values]
+            elif kind != 'bool':
+                values = [value if isinstance(value, expected) and not isinstance(value, bool) else None for value in values]
+            else:
+                values = [value if isinstance(value, bool) else None for value in values]
+            array = pa.array(values, type=_ARROW_TYPES[kind])
+            arrays.append(array.dictionary_encode() if dictionary else array)
+        self._values = [[] for _ in self.columns]
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def batches(self, items: Iterable[Dict[str, Any]]) -> Iterator[pa.RecordBatch]:
+        """Feeds every item through the builder, yielding record batches as they fill up."""
+        for item in items:
+            batch = self.append(item)
+            if batch is not None:
+                yield batch
+        batch = self.flush()
+        if batch is not None:
+            yield batch
+
+
+class TenantExporter:
+    """
+    Exports the tenant's configlets, configlet assignments, devices, containers and pending temp actions
+    as typed columnar tables, with low-cardinality strings dictionary-encoded.
+
+    Listings are consumed with the streaming decoder and fed straight into column builders, and configlet
+    assignments are fetched concurrently, only for configlets whose listing reports any device or
+    container. Parquet output is written batch by batch, so memory stays bounded by `batch_rows`.
+    """
+
+    def __init__(self, sdk: 'AristaCVAAS', page_size: int = 2000, batch_rows: int = 50000, max_workers: int = 8) -> None:
+        self.sdk = sdk
+        self.page_size = page_size
+        self.batch_rows = batch_rows
+        self.max_workers = max_workers
+        self._applied: List[Tuple[str, str, int, int]] = []
+
+    def _configlets(self) -> Iterator[Dict[str, Any]]:
+        self._applied = []
+        for configlet in self.sdk._iter_all_configlets(self.page_size):
+            if configlet.get('netElementCount') or configlet.get('containerCount'):
+                self._applied.append((configlet.get('key'), configlet.get('name'),
+                                      configlet.get('netElementCount') or 0, configlet.get('containerCount') or 0))
+            yield configlet
+
+    def _assignments(self) -> Iterator[Dict[str, Any]]:
+        if not self._applied:
+            # Assignments are derived from the configlet listing; stream it if it has not been read yet.
+            for _ in self._configlets():
+                pass
+        lookups = [(key, name, 'device') for key, name, devices, _ in self._applied if devices]
+        lookups += [(key, name, 'container') for key, name, _, containers in self._applied if containers]
+
+        def fetch(lookup: Tuple[str, str, str]) -> Any:
+            _, name, target_type = lookup
+            if target_type == 'device':
+                return self.sdk.get_configlet_applied_devices([name])
+            return self.sdk.get_configlet_applied_containers([name])
+
+        for (key, name, target_type), result, error in map_concurrently(fetch, lookups, self.max_workers):
+            if error is not None or not isinstance(result, list):
+                raise RuntimeError(f"Unable to fetch {target_type} assignments of {name}: {error or result}")
+            for applied in result:
+                for entry in applied.get('data') or []:
+                    yield dict(entry, configletKey=key, configletName=name, targetType=target_type)
+
+    def _containers(self) -> Iterator[Dict[str, Any]]:
+        containers = self.sdk.get_inventory_containers()
+        if isinstance(containers, dict):
+            raise RuntimeError(f"Unable to fetch containers: {containers}")
+        return iter(containers)
+
+    def sources(self) -> Dict[str, Callable[[], Iterable[Dict[str, Any]]]]:
+        """Returns the row source of every table, in export order (configlets before assignments)."""
+        return {
+            'configlets': self._configlets,
+            'assignments': self._assignments,
+            'devices': self.sdk.iter_inventory_devices,
+            'containers': self._containers,
+            'temp_actions': self.sdk.iter_provisioning_temp_actions,
+        }
+
+    def iter_batches(self, table: str) -> Iterator[pa.RecordBatch]:
+        """Yields the record batches of one table as its source is streamed."""
+        builder = ColumnBuilder(TABLES[table], self.batch_rows)
+        return builder.batches(self.sources()[table]())
+
+    def tables(self, tables: Optional[List[str]] = None) -> Dict[str, pa.Table]:
+        """
+        Builds the tables in memory.
+
+        Parameters:
+        - tables (Optional[List[str]], optional): The tables to build. Defaults to all of TABLES.
+
+        Returns:
+        - Dict[str, pa.Table]: Table name -> Arrow table.
+        """
+        result = {}
+        for table in self._ordered(tables):
+            schema = ColumnBuilder(TABLES[table]).schema
+            result[table] = pa.Table.from_batches(list(self.iter_batches(table)), schema=schema).unify_dictionaries()
+        return result
+
+    def export(self, directory: str, tables: Optional[List[str]] = None, format: str = 'parquet') -> Dict[str, str]:
+        """
+        Writes one file per table.
+
+        Parameters:
+        - directory (str): The output directory, created if needed.
+        - tables (Optional[List[str]], optional): The tables to export. Defaults to all of TABLES.
+        - format (str, optional): 'parquet' (written incrementally) or 'arrow' (Arrow IPC / Feather v2). Defaults to 'parquet'.
+
+        Returns:
+        - Dict[str, str]: Table name -> file path.
+        """
+        if format not in ('parquet', 'arrow'):
+            raise ValueError("format must be 'parquet' or 'arrow'")
+        os.makedirs(directory, exist_ok=True)
+        paths = {}
+        for table in self._ordered(tables):
+            path = os.path.join(directory, f'{table}.{format}')
+            schema = ColumnBuilder(TABLES[table]).schema
+            if format == 'parquet':
+                import pyarrow.parquet as pq
+
+                with pq.ParquetWriter(path, schema, compression='zstd') as writer:
+                    for batch in self.iter_batches(table):
+                        writer.write_batch(batch)
+            else:
+                import pyarrow.feather as feather
+
+                data = pa.Table.from_batches(list(self.iter_batches(table)), schema=schema).unify_dictionaries()
+                feather.write_feather(data, path, compression='zstd')
+            paths[table] = path
+        return paths
+
+    @staticmethod
+    def _ordered(tables: Optional[List[str]]) -> List[str]:
+        tables = list(TABLES) if tables is None else tables
+        unknown = set(tables) - set(TABLES)
+        if unknown:
+            raise ValueError(f"Unknown tables: {', '.join(sorted(unknown))}")
+        return sorted(tables, key=list(TABLES).index)
+
+
+def read_tenant_export(directory: str, tables: Optional[List[str]] = None) -> Dict[str, pa.Table]:
+    """
+    Loads tables written by `TenantExporter.export`.
+
+    Parameters:
+    - directory (str): The export directory.
+    - tables (Optional[List[str]], optional): The tables to load. Defaults to every table found.
+
+    Returns:
+    - Dict[str, pa.Table]: Table name -> Arrow table; call `.to_pandas()` for a DataFrame.
+    """
+    result = {}
+    for table in tables or list(TABLES):
+        for extension in ('parquet', 'arrow'):
+            path = os.path.join(directory, f'{table}.{extension}')
+            if os.path.exists(path):
+                if extension == 'parquet':
+                    import pyarrow.parquet as pq
+                    result[table] = pq.read_table(path)
+                else:
+                    import pyarrow.feather as feather
+                    result[table] = feather.read_table(path)
+                break
+    return result
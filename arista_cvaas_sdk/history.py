@@ -0,0 +1,192 @@
+import bisect
+import json
+import logging
+import os
+import sys
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from ._concurrency import map_concurrently
+
+if TYPE_CHECKING:
+    from .client import AristaCVAAS
+
+
+class ConfigletHistoryStore:
+    """
+    Local, incrementally synced store of configlet history for a whole tenant.
+
+    `sync()` fetches history for every configlet concurrently, stopping for each configlet once it
+    reaches entries that were already seen on a previous sync. Configlets whose history cannot be fetched
+    keep their watermark, so the next sync retries them, and are reported in `errors`. Entries are indexed by
+    `updatedDateTimeInLongFormat`, so time-range and per-configlet queries are local lookups.
+    The store can optionally be persisted to a JSON file between runs.
+    """
+
+    def __init__(self, sdk: 'AristaCVAAS', path: Optional[str] = None, page_size: int = 50, max_workers: int = 8) -> None:
+        self.sdk = sdk
+        self.path = path
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._timestamps: List[int] = []
+        self._entries: List[Dict[str, Any]] = []
+        self._by_configlet: Dict[str, List[Dict[str, Any]]] = {}
+        self._seen: set = set()
+        self.last_synced: Dict[str, int] = {}
+        self.configlet_names: Dict[str, str] = {}
+        self.errors: Dict[str, str] = {}
+        if path and os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _entry_id(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (entry.get('key'), entry.get('configletId'), entry.get('updatedDateTimeInLongFormat'))
+
+    def _add(self, configlet_key: str, entry: Dict[str, Any]) -> bool:
+        """Indexes a single history entry. Returns False if it was already present."""
+        entry_id = self._entry_id(entry)
+        if entry_id in self._seen:
+            return False
+        self._seen.add(entry_id)
+        entry.setdefault('configletId', configlet_key)
+        timestamp = entry.get('updatedDateTimeInLongFormat') or 0
+        position = bisect.bisect_right(self._timestamps, timestamp)
+        self._timestamps.insert(position, timestamp)
+        self._entries.insert(position, entry)
+        bisect.insort(self._by_configlet.setdefault(configlet_key, []), entry,
+                      key=lambda x: x.get('updatedDateTimeInLongFormat') or 0)
+        if timestamp > self.last_synced.get(configlet_key, 0):
+            self.last_synced[configlet_key] = timestamp
+        return True
+
+    def _fetch_new_entries(self, configlet_key: str) -> List[Dict[str, Any]]:
+        """
+        Pages through the history of one configlet until entries older than the last sync are reached.
+
+        Raises:
+        - RuntimeError: If a history page comes back as an error message.
+        """
+        watermark = self.last_synced.get(configlet_key, 0)
+        new_entries = []
+        start_index = 0
+        while True:
+            response = self.sdk.get_configlet_history_page(configlet_key, start_index, start_index + self.page_size)
+            if not isinstance(response, dict) or 'errorCode' in response or 'error' in response:
+                raise RuntimeError(f"Unable to fetch the history of {configlet_key}: {response}")
+            history = response.get('configletHistory', [])
+            if not history:
+                break
+            reached_watermark = False
+            for entry in history:
+                if (entry.get('updatedDateTimeInLongFormat') or 0) > watermark:
+                    new_entries.append(entry)
+                else:
+                    reached_watermark = True
+            total = response.get('total', 0)
+            start_index += len(history)
+            if reached_watermark or len(history) < self.page_size or (total and start_index >= total):
+                break
+        return new_entries
+
+    def sync(self, configlet_keys: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Fetches history entries newer than the last sync for every configlet (or the given keys).
+
+        Parameters:
+        - configlet_keys (Optional[List[str]], optional): Restricts the sync to these configlet keys. Defaults to all configlets.
+
+        Returns:
+        - Dict[str, int]: The number of new entries stored per configlet key, for configlets that had any.
+          Configlets that failed are left out and listed in `errors` (configlet key -> error message).
+        """
+        if configlet_keys is None:
+            configlet_names_ids = self.sdk.get_configlet_names_ids()
+            if isinstance(configlet_names_ids, dict):
+                raise RuntimeError(f"Unable to list configlets: {configlet_names_ids}")
+            self.configlet_names.update({key: name for name, key in configlet_names_ids})
+            configlet_keys = [key for _, key in configlet_names_ids]
+
+        added = {}
+        self.errors = {}
+        for configlet_key, new_entries, error in map_concurrently(self._fetch_new_entries, configlet_keys, self.max_workers):
+            if error is not None:
+                logging.getLogger(__name__).warning("History sync failed for %s: %s", configlet_key, error)
+                self.errors[configlet_key] = str(error)
+                continue
+            with self._lock:
+                count = sum(self._add(configlet_key, entry) for entry in new_entries)
+            if count:
+                added[configlet_key] = count
+
+        if self.path:
+            self.save()
+        return added
+
+    def between(self, start: Union[int, datetime], end: Union[int, datetime]) -> List[Dict[str, Any]]:
+        """
+        Returns every stored entry whose `updatedDateTimeInLongFormat` falls within [start, end].
+
+        Parameters:
+        - start (Union[int, datetime]): The start of the range, in milliseconds or as a datetime.
+        - end (Union[int, datetime]): The end of the range, in milliseconds or as a datetime.
+
+        Returns:
+        - List[Dict[str, Any]]: The matching entries, oldest first.
+        """
+        start, end = self._to_millis(start), self._to_millis(end)
+        return self._entries[bisect.bisect_left(self._timestamps, start):bisect.bisect_right(self._timestamps, end)]
+
+    def for_configlet(self, configlet_key: str, start: Optional[Union[int, datetime]] = None,
+                      end: Optional[Union[int, datetime]] = None) -> List[Dict[str, Any]]:
+        """Returns the stored entries of one configlet, oldest first, optionally restricted to a time range."""
+        entries = self._by_configlet.get(configlet_key, [])
+        if start is None and end is None:
+            return list(entries)
+        start = self._to_millis(start) if start is not None else 0
+        end = self._to_millis(end) if end is not None else sys.maxsize
+        return [x for x in entries if start <= (x.get('updatedDateTimeInLongFormat') or 0) <= end]
+
+    def changed_configlets(self, start: Union[int, datetime], end: Union[int, datetime]) -> Dict[str, int]:
+        """Returns the number of changes per configlet name (or key when the name is unknown) within a time range."""
+        counts: Dict[str, int] = {}
+        for entry in self.between(start, end):
+            key = entry.get('configletId')
+            name = self.configlet_names.get(key, key)
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    @staticmethod
+    def _to_millis(value: Union[int, datetime]) -> int:
+        if isinstance(value, datetime):
+            return int(value.timestamp() * 1000)
+        return int(value)
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Writes the store to a JSON file (defaults to the path given at construction)."""
+        path = path or self.path
+        with self._lock:
+            data = {
+                'last_synced': self.last_synced,
+                'configlet_names': self.configlet_names,
+                'entries': self._entries
+            }
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(temp_path, path)
+
+    def load(self, path: Optional[str] = None) -> None:
+        """Loads a store previously written with `save()`."""
+        with open(path or self.path) as f:
+            data = json.load(f)
+        with self._lock:
+            self.configlet_names.update(data.get('configlet_names', {}))
+            for entry in data.get('entries', []):
+                self._add(entry.get('configletId'), entry)
+            for key, timestamp in data.get('last_synced', {}).items():
+                self.last_synced[key] = max(timestamp, self.last_synced.get(key, 0))
@@ -0,0 +1,329 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .tracing import tracer_of
+
+if TYPE_CHECKING:
+    from .client import AristaCVAAS
+
+
+class _Missing:
+    # Stands in for a missing group key; unlike None and NaN it is never dropped by a groupby.
+    def __repr__(self) -> str:
+        return '<missing>'
+
+
+_MISSING = _Missing()
+
+
+class InventorySnapshot:
+    """
+    Columnar snapshot of the device inventory.
+
+    The inventory is fetched once and held in a pandas DataFrame with categorical dtypes for the
+    low-cardinality columns. Hash indexes on MAC address, serial number, hostname and version make
+    set-based lookups O(k) instead of scanning the device list, and regex filters run vectorized over
+    a whole column. One snapshot can be shared by every helper until `refresh()` is called.
+    """
+
+    INDEXED_COLUMNS = ('systemMacAddress', 'serialNumber', 'hostname', 'version')
+    CATEGORICAL_COLUMNS = ('modelName', 'version', 'internalVersion', 'domainName', 'deviceType', 'streamingStatus',
+                           'parentContainerKey', 'status', 'complianceCode', 'complianceIndication')
+
+    def __init__(self, sdk: Optional['AristaCVAAS'] = None, devices: Optional[Iterable[Dict[str, Any]]] = None,
+                 provisioned: bool = False, stream: bool = False) -> None:
+        self.sdk = sdk
+        self.provisioned = provisioned
+        self.stream = stream
+        self.refreshed_at: Optional[datetime] = None
+        self.df = pd.DataFrame()
+        self._indexes: Dict[str, Dict[Any, Any]] = {}
+        if devices is not None:
+            self._build(devices)
+        elif sdk is not None:
+            self.refresh()
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def refresh(self) -> 'InventorySnapshot':
+        """Re-fetches the inventory and rebuilds the table and its indexes."""
+        if self.sdk is None:
+            raise ValueError("A snapshot built from static devices cannot be refreshed")
+        if self.stream:
+            # Rows are fed to the DataFrame as they are decoded; the raw body is never held in memory.
+            self._build(self.sdk.iter_inventory_devices(provisioned=self.provisioned))
+            return self
+        devices = self.sdk.get_inventory_devices(provisioned=self.provisioned)
+        if isinstance(devices, dict):
+            raise RuntimeError(f"Unable to fetch inventory devices: {devices}")
+        self._build(devices)
+        return self
+
+    def _build(self, devices: Iterable[Dict[str, Any]]) -> None:
+        with tracer_of(self.sdk).span('inventory.build_dataframe') as span:
+            df = pd.DataFrame.from_records(devices)
+            for column in self.CATEGORICAL_COLUMNS:
+                if column in df.columns:
+                    df[column] = df[column].astype('category')
+            df = df.reset_index(drop=True)
+            indexes = self._build_indexes(df)
+            span.set_attribute('cvaas.devices', len(df))
+        # Swap both in together so concurrent readers never see a table with another table's indexes.
+        self.df, self._indexes = df, indexes
+        self.refreshed_at = datetime.now()
+
+    @classmethod
+    def _build_indexes(cls, df: pd.DataFrame, offset: int = 0) -> Dict[str, Dict[Any, Any]]:
+        return {
+            column: {key: positions + offset
+                     for key, positions in df.groupby(column, observed=True, sort=False).indices.items()}
+            for column in cls.INDEXED_COLUMNS if column in df.columns
+        }
+
+    def apply_changes(self, upserts: Iterable[Dict[str, Any]] = (), deletes: Iterable[str] = (),
+                      key: str = 'serialNumber') -> None:
+        """
+        Applies incremental inventory changes without refetching the inventory.
+
+        Only the changed devices are touched: updated fields are written into their rows, new devices are
+        appended, and the hash index entries of the old and new values move with them. Deletes also shift
+        the positions held by the indexes, one array lookup per indexed value. The table is copied first
+        and swapped in together with its indexes, like a refresh.
+
+        Parameters:
+        - upserts (Iterable[Dict[str, Any]], optional): Partial or full device records; fields are merged into the
+          existing device with the same `key`, or a new device is added.
+        - deletes (Iterable[str], optional): The `key` values of devices to remove.
+        - key (str, optional): The column identifying a device. Defaults to 'serialNumber'.
+        """
+        merged: Dict[Any, Dict[str, Any]] = {}
+        for device in upserts:
+            merged.setdefault(device.get(key), {}).update(device)
+        deleted = set(deletes)
+        if self.df.empty or key not in self.df.columns:
+            records = {record.get(key): record for record in self.records()}
+            for value in deleted:
+                records.pop(value, None)
+            for value, fields in merged.items():
+                records.setdefault(value, {}).update(fields)
+            self._build(list(records.values()))
+            return
+
+        with tracer_of(self.sdk).span('inventory.apply_changes', {'cvaas.upserts': len(merged),
+                                                                  'cvaas.deletes': len(deleted)}):
+            df = self.df.copy()
+            indexes = {column: dict(index) for column, index in self._indexes.items()}
+            found = self._key_positions(key, set(merged) | deleted)
+            updates = {found[value]: fields for value, fields in merged.items()
+                       if value in found and value not in deleted}
+            self._update_rows(df, indexes, updates)
+
+            # A deleted device that is upserted again starts over from the upserted fields.
+            inserts = [fields for value, fields in merged.items() if value not in found or value in deleted]
+            dropped = [found[value] for value in deleted if value in found]
+            if dropped:
+                df = self._drop_rows(df, indexes, dropped)
+            if inserts:
+                df, indexes = self._append_rows(df, indexes, inserts)
+        self.df, self._indexes = df, indexes
+
+    def _key_positions(self, key: str, values: Iterable[Any]) -> Dict[Any, int]:
+        values = set(values)
+        index = self._indexes.get(key)
+        if index is not None:
+            return {value: int(index[value][0]) for value in values if value in index}
+        column = self.df[key]
+        hits = column[column.isin(values)]
+        return {value: int(position) for position, value in zip(hits.index, hits)}
+
+    def _update_rows(self, df: pd.DataFrame, indexes: Dict[str, Dict[Any, Any]],
+                     updates: Dict[int, Dict[str, Any]]) -> None:
+        by_column: Dict[str, Tuple[List[int], List[Any]]] = {}
+        for position, fields in updates.items():
+            for column, value in fields.items():
+                rows, values = by_column.setdefault(column, ([], []))
+                rows.append(position)
+                # A null field is a missing field, as it is when the table is built from records.
+                values.append(float('nan') if value is None else value)
+        for column, (rows, values) in by_column.items():
+            if column not in df.columns:
+                df[column] = pd.Series(float('nan'), index=df.index, dtype=object)
+            series = df[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                new = {value for value in values if not pd.isna(value)} - set(series.cat.categories)
+                if new:
+                    df[column] = series.cat.add_categories(sorted(new, key=str))
+            index = indexes.get(column)
+            previous = df[column].iloc[rows].tolist() if index is not None else ()
+            location = df.columns.get_loc(column)
+            try:
+                df.iloc[rows, location] = values
+            except (TypeError, ValueError):
+                df[column] = df[column].astype(object)
+                df.iloc[rows, location] = values
+            for row, old, value in zip(rows, previous, values):
+                if old == value:
+                    continue
+                if not pd.isna(old):
+                    remaining = index[old][index[old] != row]
+                    if len(remaining):
+                        index[old] = remaining
+                    else:
+                        del index[old]
+                if not pd.isna(value):
+                    index[value] = np.append(index.get(value, np.zeros(0, dtype=np.intp)), row)
+
+    @staticmethod
+    def _drop_rows(df: pd.DataFrame, indexes: Dict[str, Dict[Any, Any]], rows: List[int]) -> pd.DataFrame:
+        dropped = np.zeros(len(df), dtype=bool)
+        dropped[rows] = True
+        new_positions = np.arange(len(df)) - np.cumsum(dropped)
+        for column, index in indexes.items():
+            for value in set(df[column].iloc[rows].dropna()):
+                kept = index[value][~dropped[index[value]]]
+                if len(kept):
+                    index[value] = kept
+                else:
+                    del index[value]
+            for value, positions in index.items():
+                index[value] = new_positions[positions]
+        return df.drop(index=rows).reset_index(drop=True)
+
+    def _append_rows(self, df: pd.DataFrame, indexes: Dict[str, Dict[Any, Any]],
+                     records: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, Dict[str, Dict[Any, Any]]]:
+        added = pd.DataFrame.from_records([{k: v for k, v in record.items() if v is not None} for record in records])
+        # Give both frames the same categories so the columns stay categorical through the concat.
+        for column in df.columns:
+            if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                continue
+            if column not in added.columns:
+                added[column] = float('nan')
+            new = set(added[column].dropna()) - set(df[column].cat.categories)
+            if new:
+                df[column] = df[column].cat.add_categories(sorted(new, key=str))
+            added[column] = pd.Categorical(added[column], categories=df[column].cat.categories)
+        offset = len(df)
+        df = pd.concat([df, added], ignore_index=True)
+        for column, positions in self._build_indexes(added, offset).items():
+            index = indexes.setdefault(column, {})
+            for value, rows in positions.items():
+                index[value] = np.concatenate([index[value], rows]) if value in index else rows
+        return df, indexes
+
+    def lookup(self, column: str, values: Union[str, List[str]]) -> pd.DataFrame:
+        """
+        Returns the rows whose `column` equals any of `values`, using the hash index when the column is indexed.
+
+        Parameters:
+        - column (str): The column to look up, e.g. 'systemMacAddress'.
+        - values (Union[str, List[str]]): A single value or a list of values.
+
+        Returns:
+        - pd.DataFrame: The matching rows, in inventory order.
+        """
+        if isinstance(values, str):
+            values = [values]
+        if column not in self.df.columns:
+            return self.df.iloc[0:0]
+        index = self._indexes.get(column)
+        if index is None:
+            return self.df[self.df[column].isin(set(values))]
+        positions = [position for value in set(values) for position in index.get(value, ())]
+        return self.df.iloc[sorted(positions)]
+
+    def by_mac(self, system_mac_addresses: Union[str, List[str]]) -> pd.DataFrame:
+        """Returns the devices with the given system MAC addresses."""
+        return self.lookup('systemMacAddress', system_mac_addresses)
+
+    def by_serial(self, serial_numbers: Union[str, List[str]]) -> pd.DataFrame:
+        """Returns the devices with the given serial numbers."""
+        return self.lookup('serialNumber', serial_numbers)
+
+    def by_hostname(self, hostnames: Union[str, List[str]]) -> pd.DataFrame:
+        """Returns the devices with the given hostnames."""
+        return self.lookup('hostname', hostnames)
+
+    def by_version(self, versions: Union[str, List[str]]) -> pd.DataFrame:
+        """Returns the devices running the given EOS versions."""
+        return self.lookup('version', versions)
+
+    def match(self, regex: str, columns: Union[str, List[str]] = ('hostname', 'systemMacAddress'),
+              anchored: bool = True) -> pd.DataFrame:
+        """
+        Filters devices with a regex evaluated vectorized over one or more columns.
+
+        Parameters:
+        - regex (str): The regex pattern.
+        - columns (Union[str, List[str]], optional): The columns to test; a row matches if any column matches.
+                                                     Defaults to hostname and system MAC address.
+        - anchored (bool, optional): Whether the pattern must match at the start of the value (like `re.match`).
+                                     Defaults to True.
+
+        Returns:
+        - pd.DataFrame: The matching rows.
+        """
+        if isinstance(columns, str):
+            columns = [columns]
+        mask = pd.Series(False, index=self.df.index)
+        for column in columns:
+            if column not in self.df.columns:
+                continue
+            # Missing values are tested as '' (not 'nan'), as the per-device loops did.
+            values = self.df[column].astype(object).fillna('').astype(str)
+            mask |= values.str.match(regex) if anchored else values.str.contains(regex, regex=True)
+        return self.df[mask]
+
+    def filter(self, **criteria: Any) -> pd.DataFrame:
+        """
+        Filters devices by column values, e.g. `filter(modelName='CCS-720DT-48S-2', version=['4.30.3M', '4.31.1F'])`.
+        List values are treated as sets of accepted values.
+        """
+        df = self.df
+        for column, value in criteria.items():
+            if column not in df.columns:
+                return df.iloc[0:0]
+            if isinstance(value, (list, tuple, set, frozenset)):
+                df = df[df[column].isin(set(value))]
+            else:
+                df = df[df[column] == value]
+        return df
+
+    def groupby(self, keys: Union[str, List[str]], columns: Optional[List[str]] = None) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Groups devices by one or more arbitrary columns.
+
+        Parameters:
+        - keys (Union[str, List[str]]): The column or columns to group by.
+        - columns (Optional[List[str]], optional): The columns to include in each device record. Defaults to all columns.
+
+        Returns:
+        - Dict[Any, List[Dict[str, Any]]]: Device records per group key (a tuple when grouping by several columns).
+        """
+        df = self.df if columns is None else self.df[[x for x in columns if x in self.df.columns]]
+        names = [keys] if isinstance(keys, str) else list(keys)
+        # Categorical groupers drop missing keys even with dropna=False, so group on object columns in which
+        # missing values are replaced by a marker; they form their own group, keyed None like `device.get()`.
+        frame = pd.DataFrame({name: self.df[name].astype(object).where(self.df[name].notna(), _MISSING)
+                              for name in names}, index=self.df.index)
+        grouped = {}
+        for key, positions in frame.groupby(names, sort=False).indices.items():
+            key = tuple(None if value is _MISSING else value for value in (key if isinstance(key, tuple) else (key,)))
+            grouped[key[0] if isinstance(keys, str) else key] = self.records(df.iloc[positions])
+        return grouped
+
+    def records(self, df: Optional[pd.DataFrame] = None) -> List[Dict[str, Any]]:
+        """Converts the snapshot (or a filtered frame taken from it) back to the inventory dict shape."""
+        df = self.df if df is None else df
+        return [{key: value for key, value in record.items() if not (isinstance(value, float) and value != value)}
+                for record in df.astype(object).to_dict('records')]
+
+    def hostname_mac_pairs(self, regex: Optional[str] = None) -> List[Tuple[str, str]]:
+        """Returns (hostname, systemMacAddress) pairs, optionally filtered like `get_system_mac_address_by_name`."""
+        df = self.match(regex) if regex else self.df
+        if df.empty:
+            return []
+        return list(zip(df['hostname'].astype(object).fillna(''), df['systemMacAddress'].astype(object).fillna('')))
@@ -0,0 +1,171 @@
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+def is_error_result(result: Any) -> bool:
+    """Returns whether an SDK helper returned an error dict instead of data."""
+    return isinstance(result, dict) and ('error' in result or 'errorCode' in result or
+                                         (result.get('code') == 24 and result.get('message') == 'Status unauthenticated'))
+
+
+def is_unauthenticated(result: Any) -> bool:
+    """Returns whether a result says the token is no longer valid, in which case every further call would fail too."""
+    return isinstance(result, dict) and result.get('code') == 24 and result.get('message') == 'Status unauthenticated'
+
+
+class JobAborted(RuntimeError):
+    """Raised when a fleet job stops early; finished items are journaled and skipped on the next run."""
+
+
+class FleetJobRunner:
+    """
+    Maps an operation over many items with a worker pool, journaling every finished item so that a
+    crashed or aborted job resumes where it stopped.
+
+    The journal is an append-only JSON Lines file with one {"key", "status", "result" | "error", "ts"} record
+    per finished item. On start the journal is replayed: items whose last record is 'ok' are not run again
+    and their journaled results are returned; failed items are retried unless `retry_errors` is False.
+    A truncated last line (the process died mid-write) is ignored. Results must be JSON serializable.
+
+    The job is aborted (JobAborted) as soon as an item reports an unauthenticated token, since every
+    remaining call would fail the same way; rerun it with a fresh token to continue.
+    """
+
+    def __init__(self, func: Callable[[Any], Any], journal_path: Optional[str] = None,
+                 key: Callable[[Any], str] = str, max_workers: int = 8, retry_errors: bool = True,
+                 is_error: Callable[[Any], bool] = is_error_result, fsync: bool = False,
+                 on_result: Optional[Callable[[str, str, Any], None]] = None) -> None:
+        self.func = func
+        self.journal_path = journal_path
+        self.key = key
+        self.max_workers = max_workers
+        self.retry_errors = retry_errors
+        self.is_error = is_error
+        self.fsync = fsync
+        self.on_result = on_result
+        self._lock = threading.Lock()
+
+    def load_journal(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Replays the journal.
+
+        Returns:
+        - Dict[str, Dict[str, Any]]: The last record of every journaled key.
+        """
+        records: Dict[str, Dict[str, Any]] = {}
+        if not self.journal_path or not os.path.exists(self.journal_path):
+            return records
+        with open(self.journal_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logging.getLogger(__name__).warning("Ignoring truncated journal line in %s", self.journal_path)
+                    continue
+                records[record['key']] = record
+        return records
+
+    def run(self, items: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Runs the operation for every item that has not already finished.
+
+        Parameters:
+        - items (Iterable[Any]): The items, e.g. device dicts or configlet keys.
+
+        Returns:
+        - Dict[str, Dict[str, Any]]: Item key -> {'status': 'ok' | 'error', 'result' | 'error', 'resumed': bool},
+          in input order.
+
+        Raises:
+        - JobAborted: If the token expired; everything finished so far is journaled.
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        items = list(items)
+        journal = self.load_journal()
+        outcomes: Dict[str, Dict[str, Any]] = {}
+        todo = []
+        for item in items:
+            item_key = self.key(item)
+            record = journal.get(item_key)
+            if record is not None and (record['status'] == 'ok' or not self.retry_errors):
+                outcomes[item_key] = dict(record, resumed=True)
+            else:
+                outcomes[item_key] = None
+                todo.append((item_key, item))
+
+        journal_file = self._open_journal()
+        aborted = None
+        finished = 0
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+                # Only a window of items is submitted at a time, so an abort stops promptly.
+                remaining = iter(todo)
+                running: Dict[Any, str] = {}
+                while True:
+                    while aborted is None and len(running) < 2 * max(1, self.max_workers):
+                        next_item = next(remaining, None)
+                        if next_item is None:
+                            break
+                        running[executor.submit(contextvars.copy_context().run, self.func, next_item[1])] = next_item[0]
+                    if not running:
+                        break
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        item_key = running.pop(future)
+                        record = self._record(item_key, future)
+                        if is_unauthenticated(record.get('error')) and aborted is None:
+                            aborted = record['error']
+                        self._append(journal_file, record)
+                        finished += record['status'] == 'ok'
+                        outcomes[item_key] = dict(record, resumed=False)
+                        if self.on_result is not None:
+                            self.on_result(item_key, record['status'], record.get('result', record.get('error')))
+        finally:
+            if journal_file is not None:
+                journal_file.close()
+
+        if aborted is not None:
+            resumed = sum(1 for outcome in outcomes.values() if outcome is not None and outcome['resumed'])
+            raise JobAborted(f"Token rejected after {finished + resumed} of {len(items)} items finished; "
+                             f"rerun to resume: {aborted}")
+        return outcomes
+
+    def _record(self, item_key: str, future: Any) -> Dict[str, Any]:
+        try:
+            result = future.result()
+        except Exception as exc:
+            record = {'key': item_key, 'status': 'error', 'error': f'{type(exc).__name__}: {exc}'}
+        else:
+            if self.is_error(result):
+                record = {'key': item_key, 'status': 'error', 'error': result}
+            else:
+                record = {'key': item_key, 'status': 'ok', 'result': result}
+        record['ts'] = time.time()
+        return record
+
+    def _open_journal(self) -> Any:
+        if not self.journal_path:
+            return None
+        journal_file = open(self.journal_path, 'a+b')
+        # Terminate a line truncated by a crash so the next record starts on its own line.
+        if journal_file.tell() > 0:
+            journal_file.seek(-1, os.SEEK_END)
+            if journal_file.read(1) != b'\n':
+                journal_file.write(b'\n')
+        return journal_file
+
+    def _append(self, journal_file: Any, record: Dict[str, Any]) -> None:
+        if journal_file is None:
+            return
+        line = (json.dumps(record) + '\n').encode('utf-8')
+        with self._lock:
+            journal_file.write(line)
+            journal_file.flush()
+            if self.fsync:
+                os.fsync(journal_file.fileno())
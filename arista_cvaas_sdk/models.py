@@ -0,0 +1,252 @@
+import sys
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+_MISSING = object()
+
+
+class _SlottedModel:
+    """
+    Base class for the compact model objects.
+
+    Each subclass declares `_FIELDS`, pairs of (CVaaS dict key, attribute name), and stores one value per
+    slot instead of a per-object dict. Keys absent from the source dict are remembered so `to_dict()`
+    reproduces the original shape, and unknown keys are kept in `_extra` (None when there are none).
+    String values of the attributes listed in `_INTERNED` are interned, so repeated values such as
+    usernames, model names or action types are stored once per process.
+
+    Models also support `model.get(key, default)` and `model[key]` with the CVaaS dict keys, so helpers
+    written against the dict shapes can consume them unchanged.
+    """
+    __slots__ = ('_extra',)
+    _FIELDS: Tuple[Tuple[str, str], ...] = ()
+    _INTERNED: frozenset = frozenset()
+    _KEY_TO_ATTR: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._KEY_TO_ATTR = {key: attr for key, attr in cls._FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> '_SlottedModel':
+        """Builds a model from the CVaaS dict shape."""
+        obj = cls.__new__(cls)
+        interned = cls._INTERNED
+        for key, attr in cls._FIELDS:
+            value = data.get(key, _MISSING)
+            if attr in interned and type(value) is str:
+                value = sys.intern(value)
+            setattr(obj, attr, value)
+        known = cls._KEY_TO_ATTR
+        obj._extra = {key: value for key, value in data.items() if key not in known} or None
+        return obj
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[Dict[str, Any]]) -> List['_SlottedModel']:
+        """Builds models from an iterable of dicts, e.g. a list response or one of the streaming iterators."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the model back to the CVaaS dict shape it was built from."""
+        result = {}
+        for key, attr in self._FIELDS:
+            value = getattr(self, attr)
+            if value is not _MISSING:
+                result[key] = value
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the value for a CVaaS dict key, like `dict.get`."""
+        attr = self._KEY_TO_ATTR.get(key)
+        if attr is not None:
+            value = getattr(self, attr)
+            return default if value is _MISSING else value
+        if self._extra:
+            return self._extra.get(key, default)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        identity = ', '.join(f"{attr}={getattr(self, attr)!r}" for attr in ('name', 'hostname', 'key')
+                             if attr in self._KEY_TO_ATTR.values() and getattr(self, attr) is not _MISSING)
+        return f"{type(self).__name__}({identity})"
+
+
+class Configlet(_SlottedModel):
+    """
+    Compact representation of a configlet. The body is held as UTF-8 bytes (zlib-compressed when it is
+    larger than `COMPRESS_THRESHOLD`) and is only decoded when `config` is read.
+    """
+    __slots__ = ('key', 'name', '_body', 'type', 'user', 'note', 'date_time', 'container_count',
+                 'net_element_count', 'editable', 'is_auto_builder', 'is_default', 'is_draft', 'reconciled',
+                 'ssl_config', 'type_studio_configlet', 'visible')
+    _FIELDS = (('key', 'key'), ('name', 'name'), ('config', '_body'), ('type', 'type'), ('user', 'user'),
+               ('note', 'note'), ('dateTimeInLongFormat', 'date_time'), ('containerCount', 'container_count'),
+               ('netElementCount', 'net_element_count'), ('editable', 'editable'), ('isAutoBuilder', 'is_auto_builder'),
+               ('isDefault', 'is_default'), ('isDraft', 'is_draft'), ('reconciled', 'reconciled'),
+               ('sslConfig', 'ssl_config'), ('typeStudioConfiglet', 'type_studio_configlet'), ('visible', 'visible'))
+    _INTERNED = frozenset({'key', 'name', 'type', 'user', 'note', 'is_auto_builder', 'is_default'})
+    COMPRESS_THRESHOLD = 512
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Configlet':
+        obj = super().from_dict(data)
+        obj._body = cls._encode_body(obj._body)
+        return obj
+
+    @classmethod
+    def _encode_body(cls, config: Any) -> Any:
+        if type(config) is not str:
+            return config
+        body = config.encode('utf-8')
+        if len(body) > cls.COMPRESS_THRESHOLD:
+            return (zlib.compress(body, 1),)
+        return body
+
+    @property
+    def config(self) -> Optional[str]:
+        """The configlet body, decoded on access."""
+        body = self._body
+        if body is _MISSING or body is None:
+            return None
+        if type(body) is tuple:
+            body = zlib.decompress(body[0])
+        return body.decode('utf-8')
+
+    @config.setter
+    def config(self, value: str) -> None:
+        self._body = self._encode_body(value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == 'config':
+            return default if self._body is _MISSING else self.config
+        return super().get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = super().to_dict()
+        if 'config' in result:
+            result['config'] = self.config
+        return result
+
+
+class Device(_SlottedModel):
+    """Compact representation of an inventory device."""
+    __slots__ = ('model_name', 'internal_version', 'system_mac_address', 'bootup_timestamp', 'version', 'architecture',
+                 'internal_build', 'hardware_revision', 'domain_name', 'hostname', 'fqdn', 'serial_number',
+                 'device_type', 'danz_enabled', 'mlag_enabled', 'streaming_status', 'parent_container_key', 'status',
+                 'compliance_code', 'compliance_indication', 'ztp_mode', 'unauthorized', 'ip_address')
+    _FIELDS = (('modelName', 'model_name'), ('internalVersion', 'internal_version'),
+               ('systemMacAddress', 'system_mac_address'), ('bootupTimestamp', 'bootup_timestamp'),
+               ('version', 'version'), ('architecture', 'architecture'), ('internalBuild', 'internal_build'),
+               ('hardwareRevision', 'hardware_revision'), ('domainName', 'domain_name'), ('hostname', 'hostname'),
+               ('fqdn', 'fqdn'), ('serialNumber', 'serial_number'), ('deviceType', 'device_type'),
+               ('danzEnabled', 'danz_enabled'), ('mlagEnabled', 'mlag_enabled'), ('streamingStatus', 'streaming_status'),
+               ('parentContainerKey', 'parent_container_key'), ('status', 'status'), ('complianceCode', 'compliance_code'),
+               ('complianceIndication', 'compliance_indication'), ('ztpMode', 'ztp_mode'),
+               ('unAuthorized', 'unauthorized'), ('ipAddress', 'ip_address'))
+    _INTERNED = frozenset({'model_name', 'internal_version', 'version', 'architecture', 'internal_build',
+                           'hardware_revision', 'domain_name', 'hostname', 'device_type', 'streaming_status',
+                           'parent_container_key', 'status', 'compliance_code', 'compliance_indication'})
+
+
+class Container(_SlottedModel):
+    """
+    Compact representation of a container, from either `/inventory/containers` (Key/Name/...) or the
+    provisioning topology (key/name/childContainerList). Topology children become nested Containers.
+    """
+    __slots__ = ('key', 'name', 'created_by', 'created_on', 'mode', 'type', 'parent_key', 'child_container_count',
+                 'child_net_element_count', 'children', '_inventory_shape')
+    _FIELDS = (('Key', 'key'), ('Name', 'name'), ('CreatedBy', 'created_by'), ('CreatedOn', 'created_on'),
+               ('Mode', 'mode'), ('key', 'key'), ('name', 'name'), ('type', 'type'), ('mode', 'mode'),
+               ('parentContainerId', 'parent_key'), ('childContainerCount', 'child_container_count'),
+               ('childNetElementCount', 'child_net_element_count'), ('childContainerList', 'children'))
+    _INTERNED = frozenset({'key', 'name', 'created_by', 'mode', 'type', 'parent_key'})
+    _INVENTORY_FIELDS = _FIELDS[:5]
+    _TOPOLOGY_FIELDS = _FIELDS[5:]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Container':
+        obj = cls.__new__(cls)
+        obj._inventory_shape = 'Key' in data
+        fields = obj._fields()
+        for attr in ('created_by', 'created_on', 'type', 'parent_key', 'child_container_count',
+                     'child_net_element_count', 'children'):
+            setattr(obj, attr, _MISSING)
+        for key, attr in fields:
+            value = data.get(key, _MISSING)
+            if attr in cls._INTERNED and type(value) is str:
+                value = sys.intern(value)
+            setattr(obj, attr, value)
+        if type(obj.children) is list:
+            obj.children = [cls.from_dict(child) for child in obj.children]
+        known = {key for key, _ in fields}
+        obj._extra = {key: value for key, value in data.items() if key not in known} or None
+        return obj
+
+    def _fields(self) -> Tuple[Tuple[str, str], ...]:
+        return self._INVENTORY_FIELDS if self._inventory_shape else self._TOPOLOGY_FIELDS
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {}
+        for key, attr in self._fields():
+            value = getattr(self, attr)
+            if value is _MISSING:
+                continue
+            result[key] = [child.to_dict() for child in value] if attr == 'children' else value
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == 'childContainerList' and type(self.children) is list:
+            return self.children
+        return super().get(key, default)
+
+
+class TempAction(_SlottedModel):
+    """Compact representation of a temporary provisioning action (an entry of `getAllTempActions.do` or an `addTempAction.do` payload)."""
+    __slots__ = ('action', 'node_type', 'node_id', 'node_name', 'to_id', 'to_id_type', 'to_name', 'from_id', 'from_name',
+                 'info', 'info_preview', 'note', 'configlet_list', 'configlet_names_list', 'ignore_configlet_list',
+                 'ignore_configlet_names_list', 'configlet_builder_list', 'configlet_builder_names_list',
+                 'ignore_configlet_builder_list', 'ignore_configlet_builder_names_list', 'node_target_ip_address',
+                 'task_id', 'session_id', 'cc_id', 'container_key', 'child_tasks', 'parent_task')
+    _FIELDS = (('action', 'action'), ('nodeType', 'node_type'), ('nodeId', 'node_id'), ('nodeName', 'node_name'),
+               ('toId', 'to_id'), ('toIdType', 'to_id_type'), ('toName', 'to_name'), ('fromId', 'from_id'),
+               ('fromName', 'from_name'), ('info', 'info'), ('infoPreview', 'info_preview'), ('note', 'note'),
+               ('configletList', 'configlet_list'), ('configletNamesList', 'configlet_names_list'),
+               ('ignoreConfigletList', 'ignore_configlet_list'), ('ignoreConfigletNamesList', 'ignore_configlet_names_list'),
+               ('configletBuilderList', 'configlet_builder_list'), ('configletBuilderNamesList', 'configlet_builder_names_list'),
+               ('ignoreConfigletBuilderList', 'ignore_configlet_builder_list'),
+               ('ignoreConfigletBuilderNamesList', 'ignore_configlet_builder_names_list'),
+               ('nodeTargetIpAddress', 'node_target_ip_address'), ('taskId', 'task_id'), ('sessionId', 'session_id'),
+               ('ccId', 'cc_id'), ('containerKey', 'container_key'), ('childTasks', 'child_tasks'),
+               ('parentTask', 'parent_task'))
+    _INTERNED = frozenset({'action', 'node_type', 'node_id', 'node_name', 'to_id', 'to_id_type', 'to_name', 'from_id',
+                           'from_name', 'note', 'session_id', 'cc_id', 'container_key', 'parent_task'})
+
+
+class DiffEntry(_SlottedModel):
+    """Compact representation of one entry of a `GetConfigDiff` response."""
+    __slots__ = ('op', 'a_lineno', 'a_parent_lineno', 'a_line', 'b_lineno', 'b_parent_lineno', 'b_line')
+    _FIELDS = (('op', 'op'), ('a_lineno', 'a_lineno'), ('a_parent_lineno', 'a_parent_lineno'), ('a_line', 'a_line'),
+               ('b_lineno', 'b_lineno'), ('b_parent_lineno', 'b_parent_lineno'), ('b_line', 'b_line'))
+    _INTERNED = frozenset({'op'})
@@ -0,0 +1,269 @@
+import math
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .transport import endpoint_family
+
+if TYPE_CHECKING:
+    from .client import AristaCVAAS
+    from .resolver import ConfigletResolver
+
+# Page sizes the helpers use; lookups larger than this cost one request per page.
+_CONFIGLET_PAGE = 2000
+_APPLIED_PAGE = 1000
+
+_LISTING = '/configlet/getConfiglets.do'
+_BY_ID = '/configlet/getConfigletById.do'
+_APPLIED_DEVICES = '/configlet/getAppliedDevices.do'
+_APPLIED_CONTAINERS = '/configlet/getAppliedContainers.do'
+_DEVICE_CONFIGLETS = '/ztp/getConfigletsByNetElementId.do'
+_INVENTORY = '/inventory/devices'
+_DEVICE_CONFIG = '/inventory/device/config'
+
+
+class BudgetExceeded(RuntimeError):
+    """Raised instead of running a helper whose planned cost is above the caller's budget."""
+
+    def __init__(self, plan: 'CostPlan', reason: str) -> None:
+        super().__init__(f"{plan.operation}: {reason} ({plan.total_requests} requests, ~{plan.estimated_seconds:.1f}s)")
+        self.plan = plan
+
+
+class CostPlan:
+    """
+    The predicted cost of one helper call: requests per endpoint family and an estimated wall time.
+
+    Each step is (endpoint family, request count, concurrency, seconds per request); steps run one after
+    another, and the requests of a step in waves of `concurrency`. `exact` is False when a count had to be
+    estimated from listing totals rather than derived from the data the helper will actually read.
+    """
+
+    def __init__(self, operation: str, steps: List[Tuple[str, int, int, float]], exact: bool = True) -> None:
+        self.operation = operation
+        self.steps = [step for step in steps if step[1] > 0]
+        self.exact = exact
+
+    @property
+    def requests(self) -> Dict[str, int]:
+        """Request counts per endpoint family."""
+        counts: Dict[str, int] = {}
+        for family, count, _, _ in self.steps:
+            counts[family] = counts.get(family, 0) + count
+        return counts
+
+    @property
+    def total_requests(self) -> int:
+        return sum(count for _, count, _, _ in self.steps)
+
+    @property
+    def estimated_seconds(self) -> float:
+        return sum(math.ceil(count / max(1, concurrency)) * latency for _, count, concurrency, latency in self.steps)
+
+    def check(self, max_requests: Optional[int] = None, max_seconds: Optional[float] = None) -> 'CostPlan':
+        """
+        Raises BudgetExceeded when the plan is above either limit.
+
+        Returns:
+        - CostPlan: The plan, for chaining.
+        """
+        if max_requests is not None and self.total_requests > max_requests:
+            raise BudgetExceeded(self, f"more than {max_requests} requests")
+        if max_seconds is not None and self.estimated_seconds > max_seconds:
+            raise BudgetExceeded(self, f"longer than {max_seconds}s")
+        return self
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'operation': self.operation, 'requests': self.requests, 'total_requests': self.total_requests,
+                'estimated_seconds': self.estimated_seconds, 'exact': self.exact}
+
+    def __repr__(self) -> str:
+        return (f"CostPlan({self.operation!r}, requests={self.total_requests}, "
+                f"estimated_seconds={self.estimated_seconds:.1f}, exact={self.exact})")
+
+
+class CostPlanner:
+    """
+    Predicts the requests and wall time of the high-level helpers without running them.
+
+    Counts come from listings the planner fetches once and keeps (configlets with their bodies, the
+    matching devices, and the effective-configlet resolver when the SDK already has one), so planning
+    several calls costs a handful of requests. Times use the latencies the SDK has observed per endpoint
+    family (`sdk.latency_stats`), falling back to the mean over all families and then `default_latency`.
+    """
+
+    PLANNED = ('get_configlets_by_regex_match', 'search_configlets', 'search_missing_context_lines',
+               'search_sections_missing_line', 'get_device_configlets', 'get_applied_configlets_per_container',
+               'batfish_analyze_network_configs', 'search_duplicate_lines')
+
+    def __init__(self, sdk: 'AristaCVAAS', default_latency: float = 0.3) -> None:
+        self.sdk = sdk
+        self.default_latency = default_latency
+        self._configlets: Optional[List[Dict[str, Any]]] = None
+        self._selections: Dict[Optional[str], List[Tuple[str, str]]] = {}
+
+    def refresh(self) -> 'CostPlanner':
+        """Drops the cached configlet listing and device selections."""
+        self._configlets = None
+        self._selections = {}
+        return self
+
+    def plan(self, operation: str, *args: Any, **kwargs: Any) -> CostPlan:
+        """
+        Plans a helper call given by name and its arguments.
+
+        Returns:
+        - CostPlan: The predicted cost.
+        """
+        if operation not in self.PLANNED:
+            raise ValueError(f"No cost model for {operation!r}; supported: {', '.join(self.PLANNED)}")
+        return getattr(self, operation)(*args, **kwargs)
+
+    def _latency(self, family: str) -> float:
+        latency = self.sdk.latency_stats.latency(family)
+        if latency is None:
+            latency = self.sdk.latency_stats.latency()
+        return self.default_latency if latency is None else latency
+
+    def _step(self, family: str, count: int, concurrency: int = 1) -> Tuple[str, int, int, float]:
+        return (endpoint_family(family), count, concurrency, self._latency(family))
+
+    def _listing(self) -> List[Dict[str, Any]]:
+        if self._configlets is None:
+            self._configlets = list(self.sdk._iter_all_configlets(_CONFIGLET_PAGE))
+        return self._configlets
+
+    def _listing_pages(self) -> int:
+        """The listing requests a helper paging through every configlet sends (the last page comes back short)."""
+        return len(self._listing()) // _CONFIGLET_PAGE + 1
+
+    def _devices(self, system_name: Optional[str]) -> Tuple[List[Tuple[str, str]], int]:
+        """Returns the devices a helper would select and the inventory requests that selection costs it."""
+        inventory_requests = 0 if self.sdk._inventory_snapshot is not None else 1
+        if system_name not in self._selections:
+            devices = self.sdk.get_system_mac_address_by_name(system_name)
+            if isinstance(devices, dict):
+                raise RuntimeError(f"Unable to fetch inventory devices: {devices}")
+            self._selections[system_name] = devices
+        return self._selections[system_name], inventory_requests
+
+    @staticmethod
+    def _pages(count: Optional[int], page_size: int = _APPLIED_PAGE) -> int:
+        return max(1, math.ceil((count or 0) / page_size))
+
+    def _resolver(self) -> Optional['ConfigletResolver']:
+        """Returns the SDK's shared configlet resolver, or None when there is none or it is stale."""
+        resolver = self.sdk._configlet_resolver
+        return None if resolver is None or resolver.stale else resolver
+
+    def _device_configlet_pairs(self, devices: List[Tuple[str, str]], selected: Dict[str, Dict[str, Any]]) -> Tuple[int, bool]:
+        """
+        Counts the assignment lookups made for (device, configlet) pairs among `devices` and the configlets in
+        `selected`: exactly from the effective-configlet resolver when the SDK has one, otherwise estimated
+        from the listing's assignment counts and the share of the fleet selected.
+        """
+        resolver = self._resolver()
+        if resolver is not None:
+            lookups = 0
+            for _, mac in devices:
+                try:
+                    effective = resolver.effective_configlets(mac)
+                except ValueError:
+                    continue
+                lookups += sum(self._pages(selected[name].get('netElementCount')) for name in effective if name in selected)
+            return lookups, True
+        share = len(devices) / max(1, len(self._devices(None)[0])) if devices else 0
+        return round(sum(self._pages(c.get('netElementCount')) * (c.get('netElementCount') or 0) * share
+                         for c in selected.values())), False
+
+    def get_configlets_by_regex_match(self, configlet_search_strings: List[str], readable_only: bool = False,
+                                      terse: bool = False, corpus: Optional[Any] = None) -> CostPlan:
+        """Plans `get_configlets_by_regex_match`: bodies by id (unless a corpus is used), then assignments per match."""
+        configlets = self._listing()
+        applied = 0
+        for pattern in configlet_search_strings:
+            regex = re.compile(pattern)
+            applied += sum(self._pages(c.get('netElementCount')) for c in configlets if regex.search(c.get('config') or ''))
+        steps = [] if corpus is not None else [self._step(_LISTING, self._listing_pages()),
+                                               self._step(_BY_ID, len(configlets))]
+        steps.append(self._step(_APPLIED_DEVICES, applied))
+        return CostPlan('get_configlets_by_regex_match', steps)
+
+    def search_duplicate_lines(self, target_configlet_name: str, exclusion_strings: list, terse: bool = True) -> CostPlan:
+        """Plans `search_duplicate_lines`: the listing and a lookup by id for the target, then `get_configlets_by_regex_match`."""
+        target = next((c for c in self._listing() if c.get('name') == target_configlet_name), None)
+        if target is None:
+            raise ValueError(f"Unknown configlet: {target_configlet_name}")
+        lines = [re.escape(line) for line in re.split(r'\n|\r\n', target.get('config') or '')
+                 if not re.search("(!)", line) and line.strip()]
+        plan = self.get_configlets_by_regex_match(lines, terse=terse)
+        target_steps = [self._step(_LISTING, self._listing_pages()), self._step(_BY_ID, 1)]
+        return CostPlan('search_duplicate_lines', target_steps + plan.steps, plan.exact)
+
+    def _device_search(self, operation: str, system_name: str, filter_substring: str,
+                       selects: Any, dedupe: bool) -> CostPlan:
+        devices, inventory_requests = self._devices(system_name)
+        filter_pattern = re.compile(filter_substring, re.IGNORECASE)
+        selected = {c['name']: c for c in self._listing() if filter_pattern.search(c.get('name') or '') and selects(c)}
+        if dedupe:
+            # Each offending configlet is reported once, so its assignments are looked up once.
+            pairs, exact = sum(self._pages(c.get('netElementCount')) for c in selected.values()), True
+            resolver = self._resolver()
+            if resolver is not None:
+                macs = {mac for _, mac in devices}
+                pairs = sum(self._pages(c.get('netElementCount')) for name, c in selected.items()
+                            if macs.intersection(resolver.affected_devices(name)))
+            else:
+                exact = False
+        else:
+            pairs, exact = self._device_configlet_pairs(devices, selected)
+        return CostPlan(operation, [self._step(_INVENTORY, inventory_requests),
+                                    self._step(_DEVICE_CONFIGLETS, len(devices)),
+                                    self._step(_APPLIED_DEVICES, pairs)], exact)
+
+    def search_configlets(self, system_name: str, filter_substring: str, regex_pattern: str,
+                          context_lines: int = 0) -> CostPlan:
+        """Plans `search_configlets`: configlets per device, then assignments per matching (device, configlet)."""
+        pattern = re.compile(regex_pattern, re.IGNORECASE)
+        selects = (lambda c: True) if context_lines < 0 else (lambda c: any(pattern.search(line) for line in (c.get('config') or '').split('\n')))
+        return self._device_search('search_configlets', system_name, filter_substring, selects, dedupe=False)
+
+    def search_missing_context_lines(self, system_name: str, filter_substring: str, expected_string: str) -> CostPlan:
+        """Plans `search_missing_context_lines`: configlets per device, then assignments per offending configlet."""
+        return self._device_search('search_missing_context_lines', system_name, filter_substring,
+                                   lambda c: expected_string not in (c.get('config') or ''), dedupe=True)
+
+    def search_sections_missing_line(self, system_name: str, *args: Any, **kwargs: Any) -> CostPlan:
+        """Plans `search_sections_missing_line`: configlets per device; sections are checked locally."""
+        devices, inventory_requests = self._devices(system_name)
+        return CostPlan('search_sections_missing_line', [self._step(_INVENTORY, inventory_requests),
+                                                         self._step(_DEVICE_CONFIGLETS, len(devices))])
+
+    def get_device_configlets(self, mac_address: Optional[str] = None, process_all: bool = False,
+                              journal_path: Optional[str] = None, max_workers: int = 8) -> CostPlan:
+        """Plans `get_device_configlets`: one request, or the inventory plus one request per device (less journaled ones)."""
+        if not process_all:
+            return CostPlan('get_device_configlets', [self._step(_DEVICE_CONFIGLETS, 1)])
+        devices, _ = self._devices(None)
+        done = 0
+        if journal_path is not None:
+            from .jobs import FleetJobRunner
+
+            journal = FleetJobRunner(lambda item: None, journal_path).load_journal()
+            done = sum(1 for _, mac in devices if journal.get(mac, {}).get('status') == 'ok')
+        return CostPlan('get_device_configlets', [self._step(_INVENTORY, 1),
+                                                  self._step(_DEVICE_CONFIGLETS, len(devices) - done, max_workers)])
+
+    def get_applied_configlets_per_container(self, refresh: bool = False, max_workers: int = 8) -> CostPlan:
+        """Plans `get_applied_configlets_per_container`: free while its cached map is current."""
+        cached = self.sdk._applied_containers
+        if cached is not None and not refresh and cached[0] == self.sdk._write_generation:
+            return CostPlan('get_applied_configlets_per_container', [])
+        configlets = self._listing()
+        lookups = sum(self._pages(c.get('containerCount')) for c in configlets if c.get('containerCount', 1))
+        return CostPlan('get_applied_configlets_per_container', [
+            self._step(_LISTING, self._listing_pages()),
+            self._step(_APPLIED_CONTAINERS, lookups, max_workers)])
+
+    def batfish_analyze_network_configs(self, device_list: list, *args: Any, max_workers: int = 8, **kwargs: Any) -> CostPlan:
+        """Plans the CVaaS side of `batfish_analyze_network_configs`: one running config per device."""
+        return CostPlan('batfish_analyze_network_configs', [self._step(_DEVICE_CONFIG, len(device_list), max_workers)])
@@ -0,0 +1,320 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from ._concurrency import map_concurrently
+from .tracing import tracer_of
+
+if TYPE_CHECKING:
+    from .client import AristaCVAAS
+
+_DEVICE_SOURCE = -1
+
+
+class _Index(NamedTuple):
+    configlets: List[str]
+    configlet_index: Dict[str, int]
+    devices: List[str]
+    device_index: Dict[str, int]
+    containers: List[str]
+    container_names: List[str]
+    container_index: Dict[str, int]
+    indptr: np.ndarray
+    indices: np.ndarray
+    sources: np.ndarray
+    t_indptr: np.ndarray
+    t_indices: np.ndarray
+
+
+class ConfigletResolver:
+    """
+    Local index of the configlets that apply to each device, directly or inherited from its containers.
+
+    The configlet listing, the topology, the inventory and the applied-device/applied-container lookups
+    are fetched once (lookups only for configlets whose listing reports an assignment, concurrently).
+    Container assignments are propagated down the topology and merged with device assignments into a
+    sparse device x configlet matrix held as CSR arrays, together with its transpose. Answering which
+    configlets apply to a device, or which devices a configlet affects, is then a dict lookup and an
+    array slice. Call `refresh()` after assignments change; a ResourceSubscriber sets `stale` when it sees
+    configlet or assignment changes, and the SDK's shared resolver is then refreshed on next use.
+
+    Effective configlets are ordered root container first, then each child container down to the
+    device's own container, then the device's configlets; a configlet assigned at several levels is
+    reported once, at the highest level.
+    """
+
+    def __init__(self, sdk: Optional['AristaCVAAS'] = None, max_workers: int = 8, page_size: int = 2000) -> None:
+        self.sdk = sdk
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.refreshed_at: Optional[datetime] = None
+        self.stale = False
+        self.hostnames: Dict[str, str] = {}
+        self._aliases: Dict[str, str] = {}
+        self._index = self._empty()
+        if sdk is not None:
+            self.refresh()
+
+    @staticmethod
+    def _empty() -> _Index:
+        empty = np.zeros(0, dtype=np.int32)
+        return _Index([], {}, [], {}, [], [], {}, np.zeros(1, dtype=np.int64), empty, empty,
+                      np.zeros(1, dtype=np.int64), empty)
+
+    def __len__(self) -> int:
+        return len(self._index.devices)
+
+    @property
+    def devices(self) -> List[str]:
+        """The device MAC addresses, in matrix row order."""
+        return self._index.devices
+
+    @property
+    def configlets(self) -> List[str]:
+        """The configlet names, in matrix column order."""
+        return self._index.configlets
+
+    def refresh(self) -> 'ConfigletResolver':
+        """Re-fetches configlets, topology, inventory and assignments, and rebuilds the index."""
+        if self.sdk is None:
+            raise ValueError("A resolver built from static assignments cannot be refreshed")
+        # Cleared before fetching, so changes seen while the refresh runs mark the new index stale again.
+        self.stale = False
+        configlets, lookups = [], []
+        for configlet in self.sdk._iter_all_configlets(self.page_size):
+            configlets.append(configlet['name'])
+            if configlet.get('netElementCount'):
+                lookups.append((configlet['name'], 'device'))
+            if configlet.get('containerCount'):
+                lookups.append((configlet['name'], 'container'))
+
+        container_parents, container_names, device_containers = self._topology()
+        hostnames: Dict[str, str] = {}
+        aliases: Dict[str, str] = {}
+        for device in self.sdk.iter_inventory_devices():
+            mac = device.get('systemMacAddress')
+            if not mac:
+                continue
+            hostnames[mac] = device.get('hostname') or mac
+            for alias in (device.get('hostname'), device.get('fqdn'), device.get('ipAddress'), device.get('serialNumber')):
+                if alias:
+                    aliases[alias] = mac
+            if device.get('parentContainerKey'):
+                device_containers[mac] = device['parentContainerKey']
+
+        def fetch(lookup: Tuple[str, str]) -> Any:
+            name, target_type = lookup
+            if target_type == 'device':
+                return self.sdk.get_configlet_applied_devices([name])
+            return self.sdk.get_configlet_applied_containers([name])
+
+        container_keys = {name: key for key, name in container_names.items()}
+        container_assignments: Dict[str, List[str]] = {}
+        device_assignments: Dict[str, List[str]] = {}
+        for (name, target_type), result, error in map_concurrently(fetch, lookups, self.max_workers):
+            if error is not None or not isinstance(result, list):
+                raise RuntimeError(f"Unable to fetch {target_type} assignments of {name}: {error or result}")
+            for applied in result:
+                for entry in applied.get('data') or []:
+                    if target_type == 'device':
+                        mac = (entry.get('macAddress') or entry.get('systemMacAddress')
+                               or aliases.get(entry.get('hostName')) or aliases.get(entry.get('ipAddress')))
+                        if mac:
+                            device_assignments.setdefault(mac, []).append(name)
+                    else:
+                        key = (entry.get('containerKey') or entry.get('key')
+                               or container_keys.get(entry.get('containerName')))
+                        if key:
+                            container_assignments.setdefault(key, []).append(name)
+
+        self.build(configlets, container_parents, device_containers, container_assignments, device_assignments,
+                   container_names=container_names, hostnames=hostnames, aliases=aliases)
+        return self
+
+    def _topology(self) -> Tuple[Dict[str, Optional[str]], Dict[str, str], Dict[str, str]]:
+        topology = self.sdk.get_provisioning_filter_topology()
+        if not isinstance(topology, dict) or 'list' not in topology:
+            raise RuntimeError(f"Unable to fetch the provisioning topology: {topology}")
+        container_parents: Dict[str, Optional[str]] = {}
+        container_names: Dict[str, str] = {}
+        device_containers: Dict[str, str] = {}
+        stack: List[Tuple[Dict[str, Any], Optional[str]]] = [(topology['list'], None)]
+        while stack:
+            node, parent = stack.pop()
+            key = node.get('key')
+            container_parents[key] = parent
+            container_names[key] = node.get('name') or key
+            for device in node.get('childNetElementList') or []:
+                mac = device.get('systemMacAddress') or device.get('key')
+                if mac:
+                    device_containers[mac] = key
+            stack.extend((child, key) for child in node.get('childContainerList') or [])
+        return container_parents, container_names, device_containers
+
+    def build(self, configlets: Iterable[str], container_parents: Dict[str, Optional[str]],
+              device_containers: Dict[str, str], container_assignments: Dict[str, List[str]],
+              device_assignments: Dict[str, List[str]], container_names: Optional[Dict[str, str]] = None,
+              hostnames: Optional[Dict[str, str]] = None, aliases: Optional[Dict[str, str]] = None) -> 'ConfigletResolver':
+        """
+        Builds the index from already collected assignments, without contacting CVaaS.
+
+        Parameters:
+        - configlets (Iterable[str]): Every configlet name; assigned names missing from it are added.
+        - container_parents (Dict[str, Optional[str]]): Container key -> parent container key (None for the root).
+        - device_containers (Dict[str, str]): Device MAC address -> the key of the container holding it.
+        - container_assignments (Dict[str, List[str]]): Container key -> configlet names applied to it, in order.
+        - device_assignments (Dict[str, List[str]]): Device MAC address -> configlet names applied to it, in order.
+        - container_names (Optional[Dict[str, str]], optional): Container key -> name. Defaults to the keys.
+        - hostnames (Optional[Dict[str, str]], optional): Device MAC address -> hostname. Defaults to None.
+        - aliases (Optional[Dict[str, str]], optional): Extra device identifiers (hostname, IP, serial) -> MAC.
+          Hostnames are always accepted as aliases.
+
+        Returns:
+        - ConfigletResolver: The resolver, for chaining.
+        """
+        with tracer_of(self.sdk).span('resolver.build') as span:
+            container_names = container_names or {}
+            configlet_list: List[str] = []
+            configlet_index: Dict[str, int] = {}
+
+            def column(name: str) -> int:
+                index = configlet_index.get(name)
+                if index is None:
+                    index = configlet_index[name] = len(configlet_list)
+                    configlet_list.append(name)
+                return index
+
+            for name in configlets:
+                column(name)
+
+            # Containers are visited parents first, so each one extends its parent's inherited assignments.
+            keys = set(container_parents) | set(container_assignments) | set(device_containers.values())
+            keys.discard(None)
+            children: Dict[Optional[str], List[str]] = {}
+            for key in keys:
+                parent = container_parents.get(key)
+                children.setdefault(parent if parent in keys else None, []).append(key)
+            containers: List[str] = []
+            inherited: Dict[str, Dict[int, int]] = {}
+            stack = [(key, None) for key in reversed(sorted(children.get(None, [])))]
+            while stack:
+                key, parent = stack.pop()
+                position = len(containers)
+                containers.append(key)
+                entries = dict(inherited[parent]) if parent is not None else {}
+                for name in container_assignments.get(key, ()):
+                    entries.setdefault(column(name), position)
+                inherited[key] = entries
+                stack.extend((child, key) for child in reversed(sorted(children.get(key, []))))
+            container_index = {key: position for position, key in enumerate(containers)}
+
+            devices = list(dict.fromkeys([*device_containers, *device_assignments]))
+            lengths = np.zeros(len(devices), dtype=np.int64)
+            indices: List[int] = []
+            sources: List[int] = []
+            for row, mac in enumerate(devices):
+                entries = inherited.get(device_containers.get(mac), {})
+                direct = device_assignments.get(mac)
+                if direct:
+                    entries = dict(entries)
+                    for name in direct:
+                        entries.setdefault(column(name), _DEVICE_SOURCE)
+                indices.extend(entries)
+                sources.extend(entries.values())
+                lengths[row] = len(entries)
+
+            indptr = np.zeros(len(devices) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=indptr[1:])
+            index_array = np.asarray(indices, dtype=np.int32)
+            # The transpose (configlet -> devices) is a stable sort of the row numbers by column.
+            rows = np.repeat(np.arange(len(devices), dtype=np.int32), lengths)
+            t_indices = rows[np.argsort(index_array, kind='stable')]
+            t_indptr = np.zeros(len(configlet_list) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(index_array, minlength=len(configlet_list)), out=t_indptr[1:])
+
+            self.hostnames = dict(hostnames or {})
+            self._aliases = {hostname: mac for mac, hostname in self.hostnames.items()}
+            self._aliases.update(aliases or {})
+            # Swap the whole index in at once so concurrent readers never see a partial rebuild.
+            self._index = _Index(configlet_list, configlet_index, devices, {mac: row for row, mac in enumerate(devices)},
+                                 containers, [container_names.get(key, key) for key in containers], container_index,
+                                 indptr, index_array, np.asarray(sources, dtype=np.int32), t_indptr, t_indices)
+            span.set_attributes({'cvaas.devices': len(devices), 'cvaas.configlets': len(configlet_list)})
+        self.refreshed_at = datetime.now()
+        return self
+
+    def _row(self, index: _Index, device: str) -> int:
+        row = index.device_index.get(device)
+        if row is None:
+            row = index.device_index.get(self._aliases.get(device))
+        if row is None:
+            raise ValueError(f"Unknown device: {device}")
+        return row
+
+    def effective_configlets(self, device: str) -> List[str]:
+        """
+        Returns the configlets that apply to a device, inherited and direct.
+
+        Parameters:
+        - device (str): The device MAC address, hostname, FQDN, IP address or serial number.
+
+        Returns:
+        - List[str]: The configlet names, root container first and device configlets last.
+        """
+        index = self._index
+        row = self._row(index, device)
+        names = index.configlets
+        return [names[column] for column in index.indices[index.indptr[row]:index.indptr[row + 1]].tolist()]
+
+    def explain(self, device: str) -> List[Tuple[str, str]]:
+        """
+        Returns the effective configlets of a device with where each one is assigned.
+
+        Parameters:
+        - device (str): The device MAC address, hostname, FQDN, IP address or serial number.
+
+        Returns:
+        - List[Tuple[str, str]]: (configlet name, container name or 'device') pairs, in effective order.
+        """
+        index = self._index
+        row = self._row(index, device)
+        start, end = index.indptr[row], index.indptr[row + 1]
+        return [(index.configlets[column], 'device' if source == _DEVICE_SOURCE else index.container_names[source])
+                for column, source in zip(index.indices[start:end].tolist(), index.sources[start:end].tolist())]
+
+    def affected_devices(self, configlet_name: str, hostnames: bool = False) -> List[str]:
+        """
+        Returns the devices a configlet applies to, directly or through any ancestor container.
+
+        Parameters:
+        - configlet_name (str): The configlet name.
+        - hostnames (bool, optional): Whether to return hostnames instead of MAC addresses. Defaults to False.
+
+        Returns:
+        - List[str]: The affected devices, in matrix row order; empty for unassigned or unknown configlets.
+        """
+        index = self._index
+        column = index.configlet_index.get(configlet_name)
+        if column is None:
+            return []
+        rows = index.t_indices[index.t_indptr[column]:index.t_indptr[column + 1]].tolist()
+        if hostnames:
+            return [self.hostnames.get(index.devices[row], index.devices[row]) for row in rows]
+        return [index.devices[row] for row in rows]
+
+    def device_counts(self) -> Dict[str, int]:
+        """Returns the number of affected devices per configlet, including unassigned configlets (0)."""
+        index = self._index
+        return dict(zip(index.configlets, np.diff(index.t_indptr).tolist()))
+
+    def matrix(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the device x configlet matrix in CSR form.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: `indptr` and `indices`; row i (`devices[i]`) holds the column numbers
+          (positions in `configlets`) in `indices[indptr[i]:indptr[i + 1]]`.
+        """
+        index = self._index
+        return index.indptr, index.indices
@@ -0,0 +1,127 @@
+import codecs
+import json
+from json import JSONDecodeError
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional
+
+try:
+    # Optional faster JSON backend; falls back to the standard library decoder.
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+class ParsedResponse(NamedTuple):
+    """The outcome of a single CVaaS request: status code, decoded body and error payload (None on success)."""
+    status_code: int
+    data: Any
+    error: Optional[Dict[str, Any]]
+
+
+def iter_json_array(chunks: Iterable[bytes], key: Optional[str] = 'data') -> Iterator[Any]:
+    """
+    Incrementally decodes a JSON array from a stream of byte chunks and yields its items one at a time.
+
+    Only the item being decoded is held in memory, so a response of any size can be processed with a
+    constant memory footprint.
+
+    Parameters:
+    - chunks (Iterable[bytes]): The raw response body, e.g. `response.iter_content(65536)`.
+    - key (Optional[str], optional): The top-level object key holding the array. Use None when the body
+                                     itself is the array. Defaults to 'data'.
+
+    Returns:
+    - Iterator[Any]: The decoded array items.
+
+    Raises:
+    - ValueError: If the body is not valid JSON of the expected shape, or if the object has no `key`
+                  (in which case the other top-level values, e.g. an error message, are included).
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    chunk_iter = iter(chunks)
+    buf = ''
+    pos = 0
+    exhausted = False
+
+    def read_more() -> bool:
+        nonlocal buf, pos, exhausted
+        if exhausted:
+            return False
+        for chunk in chunk_iter:
+            if chunk:
+                buf = buf[pos:] + utf8.decode(chunk)
+                pos = 0
+                return True
+        buf = buf[pos:] + utf8.decode(b'', final=True)
+        pos = 0
+        exhausted = True
+        return False
+
+    def skip_whitespace() -> Optional[str]:
+        """Advances past whitespace and returns the next character, or None at the end of the stream."""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n':
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not read_more():
+                return None
+
+    def decode_value() -> Any:
+        """Decodes the value at pos, reading more data until it is complete."""
+        nonlocal pos
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+                # A number at the end of the buffer may continue in the next chunk.
+                if end < len(buf) or exhausted:
+                    pos = end
+                    return value
+            except JSONDecodeError:
+                if exhausted:
+                    raise
+            # Grow the pending text geometrically so large items are not re-scanned per chunk.
+            pending = len(buf) - pos
+            while read_more() and len(buf) - pos < 2 * pending:
+                pass
+
+    def expect(character: str) -> None:
+        nonlocal pos
+        if skip_whitespace() != character:
+            raise ValueError(f"Expected {character!r} at offset {pos} of JSON stream")
+        pos += 1
+
+    if key is not None:
+        expect('{')
+        other_values = {}
+        while True:
+            token = skip_whitespace()
+            if token == ',':
+                pos += 1
+                continue
+            if token == '}' or token is None:
+                raise ValueError(f"JSON object has no {key!r} array: {other_values}")
+            name = decode_value()
+            expect(':')
+            if name == key:
+                break
+            skip_whitespace()
+            other_values[name] = decode_value()
+
+    expect('[')
+    while True:
+        token = skip_whitespace()
+        if token == ',':
+            pos += 1
+            continue
+        if token == ']':
+            return
+        if token is None:
+            raise ValueError("Unexpected end of JSON stream")
+        yield decode_value()
+        # Drop consumed text so the buffer only ever holds the item being decoded.
+        if pos > 65536:
+            buf = buf[pos:]
+            pos = 0
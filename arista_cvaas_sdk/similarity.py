@@ -0,0 +1,217 @@
+import hashlib
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_HIGH_BITS = np.uint64(32)
+_BAND_PRIME = np.uint64(1099511628211)
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalized_lines(config: str) -> List[str]:
+    """Returns the non-empty, non-comment lines of a configuration with runs of whitespace collapsed."""
+    lines = []
+    for line in config.splitlines():
+        line = _WHITESPACE.sub(' ', line).strip()
+        if line and not line.startswith('!'):
+            lines.append(line)
+    return lines
+
+
+def optimal_bands(num_perm: int, threshold: float) -> int:
+    """
+    Chooses the number of LSH bands for a similarity threshold.
+
+    The LSH S-curve crosses 50% candidate probability near (1/bands) ** (1/rows); the band count whose
+    crossing point is closest to, but not above, `threshold` keeps recall high at that threshold.
+
+    Parameters:
+    - num_perm (int): The signature length.
+    - threshold (float): The Jaccard similarity of interest.
+
+    Returns:
+    - int: A divisor of num_perm.
+    """
+    best, best_distance = 1, float('inf')
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands:
+            continue
+        crossing = (1 / bands) ** (1 / (num_perm // bands))
+        distance = threshold - crossing
+        if 0 <= distance < best_distance:
+            best, best_distance = bands, distance
+    return best
+
+
+class ConfigletSimilarity:
+    """
+    Finds near-duplicate configlets in roughly linear time with MinHash signatures and LSH banding.
+
+    Each configlet is reduced to the set of its `shingle_size`-line shingles over normalized lines
+    (whitespace collapsed, comments and blank lines dropped). A signature holds, for each of `num_perm`
+    multiply-shift hash functions, the minimum hash over the shingles, computed for all functions at once
+    with NumPy. Signatures are cached by the SHA-1 of the normalized text, so unchanged configlets are never
+    re-hashed and identical configlets share one signature. Signatures are split into bands; configlets
+    sharing any band bucket become candidate pairs, whose Jaccard similarity is estimated from the fraction
+    of equal signature positions.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 2, seed: int = 1) -> None:
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+        self.signatures: Dict[str, np.ndarray] = {}
+        self._content: Dict[str, str] = {}
+        self.names: Dict[str, str] = {}
+
+    def _shingles(self, lines: List[str]) -> np.ndarray:
+        size = min(self.shingle_size, len(lines)) or 1
+        shingles = {'\n'.join(lines[i:i + size]) for i in range(max(1, len(lines) - size + 1))}
+        return np.fromiter((int.from_bytes(hashlib.blake2b(x.encode('utf-8'), digest_size=8).digest(), 'little')
+                            for x in shingles), dtype=np.uint64, count=len(shingles))
+
+    def signature(self, config: str) -> Tuple[str, np.ndarray]:
+        """
+        Returns the content hash and MinHash signature of a configuration, from the cache when possible.
+
+        Parameters:
+        - config (str): The configuration text.
+
+        Returns:
+        - Tuple[str, np.ndarray]: The SHA-1 of the normalized text and the uint32 signature.
+        """
+        lines = normalized_lines(config)
+        digest = hashlib.sha1('\n'.join(lines).encode('utf-8')).hexdigest()
+        signature = self.signatures.get(digest)
+        if signature is None:
+            hashes = self._shingles(lines)
+            # Multiply-shift hashing: (a * x + b) mod 2**64, keeping the high 32 bits.
+            with np.errstate(over='ignore'):
+                mixed = (self._a[:, None] * hashes[None, :] + self._b[:, None]) >> _HIGH_BITS
+            signature = mixed.min(axis=1).astype(np.uint32)
+            self.signatures[digest] = signature
+        return digest, signature
+
+    def add(self, key: str, config: str, name: Optional[str] = None) -> str:
+        """Indexes one configlet and returns its content hash."""
+        digest, _ = self.signature(config)
+        self._content[key] = digest
+        self.names[key] = name if name is not None else key
+        return digest
+
+    def add_many(self, configlets: Iterable[Dict[str, Any]]) -> None:
+        """Indexes configlet dicts with 'key', 'name' and 'config' (for example `sdk.iter_configlets()`)."""
+        for configlet in configlets:
+            self.add(configlet['key'], configlet.get('config') or '', configlet.get('name'))
+
+    def remove(self, key: str) -> None:
+        """Removes a configlet from the index; its signature stays cached for identical content."""
+        self._content.pop(key, None)
+        self.names.pop(key, None)
+
+    @staticmethod
+    def jaccard(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+        """Estimates the Jaccard similarity of two shingle sets from their signatures."""
+        return float(np.count_nonzero(signature_a == signature_b)) / len(signature_a)
+
+    def pairs(self, threshold: float = 0.8, bands: Optional[int] = None) -> List[Tuple[str, str, float]]:
+        """
+        Finds candidate pairs with LSH and keeps those whose estimated Jaccard similarity reaches `threshold`.
+
+        Parameters:
+        - threshold (float, optional): The minimum estimated Jaccard similarity. Defaults to 0.8.
+        - bands (Optional[int], optional): The number of LSH bands (must divide num_perm). Defaults to `optimal_bands`.
+
+        Returns:
+        - List[Tuple[str, str, float]]: (key_a, key_b, similarity) tuples, most similar first. Configlets with
+          identical normalized content are reported with similarity 1.0.
+        """
+        bands = bands or optimal_bands(self.num_perm, threshold)
+        if self.num_perm % bands:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({self.num_perm})")
+        rows = self.num_perm // bands
+
+        groups: Dict[str, List[str]] = {}
+        for key, digest in self._content.items():
+            groups.setdefault(digest, []).append(key)
+        digests = list(groups)
+
+        result = []
+        for keys in groups.values():
+            result.extend((a, b, 1.0) for i, a in enumerate(keys) for b in keys[i + 1:])
+
+        if len(digests) > 1:
+            matrix = np.stack([self.signatures[digest] for digest in digests])
+            count = len(digests)
+            encoded = []
+            for band in range(bands):
+                # One 64-bit key per row and band; a rare key collision only adds a candidate that the
+                # similarity check below discards.
+                band_keys = np.zeros(count, dtype=np.uint64)
+                with np.errstate(over='ignore'):
+                    for column in matrix[:, band * rows:(band + 1) * rows].T:
+                        band_keys = band_keys * _BAND_PRIME + column.astype(np.uint64)
+                order = np.argsort(band_keys, kind='stable')
+                sorted_keys = band_keys[order]
+                starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+                sizes = np.diff(np.r_[starts, count])
+                # Buckets of equal size are expanded into pairs together, without a Python loop per bucket.
+                for size in np.unique(sizes[sizes > 1]).tolist():
+                    members = order[starts[sizes == size][:, None] + np.arange(size)]
+                    first, second = np.triu_indices(size, k=1)
+                    a, b = members[:, first].ravel(), members[:, second].ravel()
+                    encoded.append(np.minimum(a, b) * count + np.maximum(a, b))
+            if encoded:
+                candidates = np.unique(np.concatenate(encoded))
+                a, b = candidates // count, candidates % count
+                similarities = (matrix[a] == matrix[b]).mean(axis=1)
+                keep = similarities >= threshold
+                for x, y, similarity in zip(a[keep].tolist(), b[keep].tolist(), similarities[keep].tolist()):
+                    result.extend((p, q, similarity) for p in groups[digests[x]] for q in groups[digests[y]])
+
+        result.sort(key=lambda x: (-x[2], x[0], x[1]))
+        return result
+
+    def clusters(self, threshold: float = 0.8, bands: Optional[int] = None,
+                 pairs: Optional[List[Tuple[str, str, float]]] = None) -> List[List[str]]:
+        """
+        Groups configlets connected by pairs at or above `threshold` (union-find over `pairs()`, or over
+        `pairs` when the caller already computed them).
+
+        Returns:
+        - List[List[str]]: Clusters of two or more configlet keys, largest first.
+        """
+        parent: Dict[str, str] = {}
+
+        def find(key: str) -> str:
+            parent.setdefault(key, key)
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        for a, b, _ in (self.pairs(threshold, bands) if pairs is None else pairs):
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[root_b] = root_a
+
+        clusters: Dict[str, List[str]] = {}
+        for key in parent:
+            clusters.setdefault(find(key), []).append(key)
+        return sorted((sorted(members) for members in clusters.values()), key=lambda x: (-len(x), x))
+
+    def save(self, path: str) -> None:
+        """Writes the signature cache to an .npz file."""
+        digests = list(self.signatures)
+        matrix = np.stack([self.signatures[x] for x in digests]) if digests else np.zeros((0, self.num_perm), np.uint32)
+        np.savez(path, digests=np.array(digests, dtype='U40'), signatures=matrix)
+
+    def load(self, path: str) -> None:
+        """Loads a signature cache written by `save()` with the same num_perm, shingle_size and seed."""
+        with np.load(path) as data:
+            if len(data['signatures']) and data['signatures'].shape[1] != self.num_perm:
+                raise ValueError("The cache was built with a different num_perm")
+            self.signatures.update(zip(data['digests'].tolist(), data['signatures']))
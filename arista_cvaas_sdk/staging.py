@@ -0,0 +1,306 @@
+import copy
+import json
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .client import AristaCVAAS
+
+# A node created and deleted again before the flush never has to reach CVaaS.
+_CANCELLING = {'add': 'delete'}
+
+
+def configlet_assignment_action(to_id: str, to_id_type: str, configlets: List[Any], ignore_list: List[Any] = (),
+                                node_ip_address: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Builds the temp action that associates configlets with a device ('netelement') or container.
+
+    Parameters:
+    - to_id (str): The device system MAC address or the container key.
+    - to_id_type (str): 'netelement' or 'container'.
+    - configlets (List[Any]): The configlets to assign; entries also present in `ignore_list` are dropped.
+    - ignore_list (List[Any], optional): The configlets to remove from the target. Defaults to ().
+    - node_ip_address (Optional[str], optional): The device management IP, for devices. Defaults to None.
+
+    Returns:
+    - Dict[str, Any]: The action, as sent inside an addTempAction.do 'data' list.
+    """
+    action = {'action': 'associate',
+              'configletBuilderList': [],
+              'configletBuilderNamesList': [],
+              'configletList': [x for x in configlets if x not in ignore_list],
+              'fromId': '',
+              'fromName': '',
+              'ignoreConfigletBuilderList': [],
+              'ignoreConfigletBuilderNamesList': [],
+              'ignoreConfigletList': list(ignore_list),
+              'ignoreConfigletNamesList': [],
+              'nodeId': '',
+              'nodeName': '',
+              'nodeType': 'configlet',
+              'toId': to_id,
+              'toIdType': to_id_type}
+    if node_ip_address is not None:
+        action['nodeTargetIpAddress'] = node_ip_address
+    return action
+
+
+def image_assignment_action(device_id: str, image: Dict[str, Any], id_type: str = 'netelement') -> Dict[str, Any]:
+    """
+    Builds the temp action that assigns an image bundle ({'key', 'name'}) to a device or container.
+
+    Returns:
+    - Dict[str, Any]: The action, as sent inside an addTempAction.do 'data' list.
+    """
+    info = f"Apply image: {image['name']} to {id_type} {device_id}"
+    return {'info': info,
+            'infoPreview': info,
+            'note': '',
+            'action': 'associate',
+            'nodeType': 'imagebundle',
+            'nodeId': image['key'],
+            'toId': device_id,
+            'toIdType': id_type,
+            'fromId': '',
+            'nodeName': image['name'],
+            'fromName': '',
+            'toName': '',
+            'childTasks': [],
+            'parentTask': ''}
+
+
+def container_add_action(name: str, node_id: str, parent_id: str = 'root', parent_name: str = '') -> Dict[str, Any]:
+    """
+    Builds the temp action that creates a container under a parent container.
+
+    Parameters:
+    - name (str): The new container name.
+    - node_id (str): The temporary key of the new container, e.g. 'New_Container_1234567890123'.
+    - parent_id (str, optional): The parent container key, or a temporary key staged earlier. Defaults to 'root'.
+    - parent_name (str, optional): The parent container name; empty for the root. Defaults to ''.
+
+    Returns:
+    - Dict[str, Any]: The action, as sent inside an addTempAction.do 'data' list.
+    """
+    return {'info': f"Container {name} created",
+            'infoPreview': f"Container {name} created",
+            'action': 'add',
+            'nodeType': 'container',
+            'nodeId': node_id,
+            'toId': parent_id,
+            'fromId': '',
+            'nodeName': name,
+            'fromName': '',
+            'toName': parent_name,
+            'toIdType': 'container'}
+
+
+def _marker(configlet: Any) -> Hashable:
+    # Configlets may be given as keys or as configlet dicts; dicts are compared by content.
+    return json.dumps(configlet, sort_keys=True) if isinstance(configlet, dict) else configlet
+
+
+def action_key(action: Dict[str, Any]) -> Optional[Hashable]:
+    """
+    Returns the identity under which staged actions are coalesced, or None when an action cannot be coalesced.
+
+    Configlet actions are keyed by target, so every associate for one device or container merges into one.
+    Image actions are keyed by target too (a target holds one image, so the last one wins); adds and deletes
+    by node; other actions (moves, updates) by action and node, so the last one wins.
+    """
+    node_type = action.get('nodeType')
+    if node_type == 'configlet':
+        return ('configlet', action.get('toIdType'), action.get('toId'))
+    if node_type == 'imagebundle':
+        return ('imagebundle', action.get('toIdType'), action.get('toId'))
+    node = action.get('nodeId') or action.get('nodeName')
+    if not node:
+        return None
+    if action.get('action') in ('add', 'delete'):
+        return ('node', node_type, node)
+    return (action.get('action'), node_type, node)
+
+
+class TempActionQueue:
+    """
+    Client-side staging area for provisioning temp actions.
+
+    Actions are coalesced as they are staged: all configlet associations of one device or container merge
+    into a single action (a configlet added and later removed, or the other way round, keeps only the last
+    intent), a later image or move for the same target replaces the earlier one, and a node added and
+    deleted again before the flush is dropped together with its delete. `flush()` can skip actions that
+    `getAllTempActions.do` already holds, and sends the rest as batched addTempAction.do requests in
+    staging order.
+    """
+
+    def __init__(self, sdk: 'AristaCVAAS', batch_size: int = 100) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than zero")
+        self.sdk = sdk
+        self.batch_size = batch_size
+        self.staged = 0
+        self.merged = 0
+        self.cancelled = 0
+        self._actions: Dict[Hashable, Dict[str, Any]] = {}
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def stage(self, action: Dict[str, Any]) -> 'TempActionQueue':
+        """
+        Adds one temp action (an entry of an addTempAction.do 'data' list) to the queue.
+
+        Returns:
+        - TempActionQueue: The queue, for chaining.
+        """
+        action = copy.deepcopy(action)
+        key = action_key(action)
+        with self._lock:
+            self.staged += 1
+            if key is None:
+                self._sequence += 1
+                self._actions[('unkeyed', self._sequence)] = action
+                return self
+            current = self._actions.get(key)
+            if current is None:
+                self._actions[key] = action
+            elif key[0] == 'configlet':
+                # Merge into a copy: a flush in progress identifies what it sent by object identity.
+                merged = dict(current)
+                self._merge_configlets(merged, action)
+                self.merged += 1
+                if merged['configletList'] or merged['ignoreConfigletList']:
+                    self._actions[key] = merged
+                else:
+                    del self._actions[key]
+            elif key[0] == 'node' and _CANCELLING.get(current.get('action')) == action.get('action'):
+                del self._actions[key]
+                self.cancelled += 2
+            else:
+                # Keep the queue position of the first action so parents still precede children.
+                self._actions[key] = action
+                self.merged += 1
+        return self
+
+    @staticmethod
+    def _merge_configlets(current: Dict[str, Any], action: Dict[str, Any]) -> None:
+        def named(ids_key: str, names_key: str, source: Dict[str, Any]) -> Dict[Hashable, Tuple[Any, Any]]:
+            ids, names = source.get(ids_key) or [], source.get(names_key) or []
+            names = names if len(names) == len(ids) else [None] * len(ids)
+            return {_marker(configlet): (configlet, name) for configlet, name in zip(ids, names)}
+
+        adds = named('configletList', 'configletNamesList', current)
+        removes = named('ignoreConfigletList', 'ignoreConfigletNamesList', current)
+        for marker, entry in named('configletList', 'configletNamesList', action).items():
+            removes.pop(marker, None)
+            adds[marker] = entry
+        for marker, entry in named('ignoreConfigletList', 'ignoreConfigletNamesList', action).items():
+            adds.pop(marker, None)
+            removes[marker] = entry
+        current['configletList'] = [configlet for configlet, _ in adds.values()]
+        current['ignoreConfigletList'] = [configlet for configlet, _ in removes.values()]
+        if all(name is not None for _, name in adds.values()):
+            current['configletNamesList'] = [name for _, name in adds.values()]
+        if all(name is not None for _, name in removes.values()):
+            current['ignoreConfigletNamesList'] = [name for _, name in removes.values()]
+        if action.get('nodeTargetIpAddress'):
+            current['nodeTargetIpAddress'] = action['nodeTargetIpAddress']
+
+    def assign_configlets_to_device(self, device_id: str, node_ip_address: str, configlets: List[Any],
+                                    ignore_list: List[Any] = ()) -> 'TempActionQueue':
+        """Stages the action `post_assign_configlets_to_device` would send."""
+        return self.stage(configlet_assignment_action(device_id, 'netelement', configlets, ignore_list, node_ip_address))
+
+    def assign_configlets_to_container(self, container_id: str, configlets: List[Any],
+                                       ignore_list: List[Any] = ()) -> 'TempActionQueue':
+        """Stages the action `post_assign_configlets_to_container` would send."""
+        return self.stage(configlet_assignment_action(container_id, 'container', configlets, ignore_list))
+
+    def assign_image_to_device(self, device_id: str, image: Dict[str, Any], id_type: str = 'netelement') -> 'TempActionQueue':
+        """Stages the action `post_assign_image_to_device` would send."""
+        return self.stage(image_assignment_action(device_id, image, id_type))
+
+    def pending(self, existing: Optional[Iterable[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Returns the coalesced actions that a flush would send, in staging order.
+
+        Parameters:
+        - existing (Optional[Iterable[Dict[str, Any]]], optional): Temp actions already held by CVaaS; staged
+          actions they already cover are left out. Defaults to None.
+
+        Returns:
+        - List[Dict[str, Any]]: The actions.
+        """
+        with self._lock:
+            actions = list(self._actions.values())
+        if existing is None:
+            return actions
+        covered: Dict[Hashable, List[Dict[str, Any]]] = {}
+        for action in existing:
+            covered.setdefault(action_key(action), []).append(action)
+        return [action for action in actions
+                if not any(self._covers(held, action) for held in covered.get(action_key(action), ()))]
+
+    @staticmethod
+    def _covers(held: Dict[str, Any], action: Dict[str, Any]) -> bool:
+        if held.get('action') != action.get('action'):
+            return False
+        if action.get('nodeType') == 'configlet':
+            return all({_marker(x) for x in action.get(field) or ()} <= {_marker(x) for x in held.get(field) or ()}
+                       for field in ('configletList', 'ignoreConfigletList'))
+        return all(held.get(field) == action.get(field) for field in ('nodeType', 'nodeId', 'toId', 'toIdType'))
+
+    def existing_actions(self) -> List[Dict[str, Any]]:
+        """Returns the temp actions CVaaS currently holds (`get_provisioning_temp_actions`)."""
+        response = self.sdk.get_provisioning_temp_actions()
+        if not isinstance(response, dict) or 'data' not in response:
+            raise RuntimeError(f"Unable to fetch temp actions: {response}")
+        return response['data'] or []
+
+    def flush(self, skip_existing: bool = True, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Sends the coalesced actions in batches of `batch_size` per addTempAction.do request.
+
+        Batches that succeed are removed from the queue; actions of a failed batch stay queued so the flush
+        can be retried.
+
+        Parameters:
+        - skip_existing (bool, optional): Whether to leave out actions CVaaS already holds. Defaults to True.
+        - dry_run (bool, optional): Whether to only report what would be sent. Defaults to False.
+
+        Returns:
+        - Dict[str, Any]: 'actions' (the actions to send), 'staged', 'merged', 'cancelled', 'skipped_existing',
+          'requests' and 'results' (one response or {'error': ...} per request).
+        """
+        with self._lock:
+            queued = list(self._actions.items())
+        actions = self.pending(self.existing_actions() if skip_existing else None)
+        to_send = {id(action) for action in actions}
+        summary = {'actions': actions, 'staged': self.staged, 'merged': self.merged, 'cancelled': self.cancelled,
+                   'skipped_existing': len(queued) - len(actions), 'requests': 0, 'results': []}
+        if dry_run:
+            return summary
+
+        failed = set()
+        batches: List[List[Tuple[Hashable, Dict[str, Any]]]] = []
+        items = [(key, action) for key, action in queued if id(action) in to_send]
+        for index in range(0, len(items), self.batch_size):
+            batches.append(items[index:index + self.batch_size])
+        for batch in batches:
+            result = self.sdk.post_provisioning_add_temp_actions([{'data': [action for _, action in batch]}])[0]
+            summary['requests'] += 1
+            summary['results'].append(result)
+            if 'error' in result:
+                failed.update(key for key, _ in batch)
+        with self._lock:
+            for key, action in queued:
+                if key not in failed and self._actions.get(key) is action:
+                    del self._actions[key]
+        return summary
+
+    def clear(self) -> None:
+        """Drops every staged action without sending anything."""
+        with self._lock:
+            self._actions.clear()
@@ -0,0 +1,230 @@
+import json
+import logging
+import socket
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+
+if TYPE_CHECKING:
+    from .client import AristaCVAAS
+
+
+class ResourceChange(NamedTuple):
+    stream: str
+    type: str
+    key: Dict[str, Any]
+    value: Dict[str, Any]
+    time: Optional[str]
+
+
+# Resource API Device fields and the legacy inventory columns they update.
+DEVICE_FIELDS = {
+    'hostname': 'hostname',
+    'fqdn': 'fqdn',
+    'modelName': 'modelName',
+    'softwareVersion': 'version',
+    'systemMacAddress': 'systemMacAddress',
+    'domainName': 'domainName',
+    'streamingStatus': 'streamingStatus',
+}
+
+
+def device_record(value: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts a Resource API inventory Device to the inventory device dict shape used by InventorySnapshot.
+
+    Parameters:
+    - value (Dict[str, Any]): The resource value, e.g. {'key': {'deviceId': 'SN1'}, 'hostname': 'leaf1', 'softwareVersion': '4.31.1F'}.
+
+    Returns:
+    - Dict[str, Any]: The device record keyed by 'serialNumber'.
+    """
+    record = {'serialNumber': value.get('key', {}).get('deviceId')}
+    for field, column in DEVICE_FIELDS.items():
+        if field in value:
+            record[column] = value[field]
+    return record
+
+
+class ResourceSubscriber:
+    """
+    Keeps the SDK's in-memory state fresh from Resource API subscribe streams instead of polling listings.
+
+    Each stream is read as newline-delimited JSON, one `{"result": {"value": ..., "type": ..., "time": ...}}`
+    object per line. Changes are applied in batches: the built-in handlers merge inventory devices into the
+    shared InventorySnapshot and invalidate the matching response cache entries, configlet and assignment
+    changes also make the SDK rebuild its applied-container maps and configlet resolver on next use, and
+    handlers registered with `on()` receive every batch. When a stream breaks (connection loss, an error message, or an
+    undecodable line) updates may have been missed, so the stream is resynced with a full fetch before it
+    is reopened with exponential backoff.
+
+    Stream paths differ between CloudVision releases; pass `streams` to override the defaults.
+    """
+
+    DEFAULT_STREAMS: Dict[str, str] = {
+        'inventory': '/api/resources/inventory/v1/Device/subscribe',
+        'configlet': '/api/resources/configlet/v1/Configlet/subscribe',
+        'configlet_assignment': '/api/resources/configlet/v1/ConfigletAssignment/subscribe',
+        'tag': '/api/resources/tag/v2/Tag/subscribe',
+        'tag_assignment': '/api/resources/tag/v2/TagAssignment/subscribe',
+    }
+
+    # Response cache prefixes made stale by a change on each stream.
+    CACHE_PREFIXES: Dict[str, List[str]] = {
+        'inventory': ['/inventory/', '/provisioning/'],
+        'configlet': ['/configlet/'],
+        'configlet_assignment': ['/configlet/getApplied', '/provisioning/'],
+    }
+
+    # Streams whose changes make the SDK's applied-container maps and configlet resolver stale.
+    CONFIGLET_STREAMS = ('configlet', 'configlet_assignment')
+
+    def __init__(self, sdk: 'AristaCVAAS', streams: Optional[Union[List[str], Dict[str, str]]] = None,
+                 reconnect_delay: float = 1.0, max_reconnect_delay: float = 60.0, read_timeout: float = 300.0) -> None:
+        self.sdk = sdk
+        if streams is None:
+            streams = ['inventory', 'configlet']
+        if not isinstance(streams, dict):
+            streams = {name: self.DEFAULT_STREAMS[name] for name in streams}
+        self.streams = dict(streams)
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.read_timeout = read_timeout
+        self.stats: Dict[str, Dict[str, int]] = {name: {'messages': 0, 'batches': 0, 'resyncs': 0, 'reconnects': 0}
+                                                 for name in self.streams}
+        self._handlers: Dict[str, List[Callable[[List[ResourceChange]], None]]] = {name: [] for name in self.streams}
+        self._resync_handlers: Dict[str, List[Callable[[], None]]] = {name: [] for name in self.streams}
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._responses: Dict[str, Any] = {}
+
+    def on(self, stream: str, handler: Callable[[List[ResourceChange]], None],
+           resync: Optional[Callable[[], None]] = None) -> None:
+        """
+        Registers a handler for a stream's change batches and, optionally, a full-fetch function run on resync.
+
+        Parameters:
+        - stream (str): The stream name, e.g. 'tag'.
+        - handler (Callable[[List[ResourceChange]], None]): Called with each batch of changes.
+        - resync (Optional[Callable[[], None]], optional): Called after a gap, before the stream is reopened.
+        """
+        self._handlers[stream].append(handler)
+        if resync is not None:
+            self._resync_handlers[stream].append(resync)
+
+    def start(self) -> 'ResourceSubscriber':
+        """Consumes every stream from its own background thread until `stop()` is called."""
+        self._stop.clear()
+        for name in self.streams:
+            thread = threading.Thread(target=self.run, args=(name,), name=f'cvaas-subscribe-{name}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self) -> None:
+        """Stops every stream thread and closes the open connections."""
+        self._stop.set()
+        for response in list(self._responses.values()):
+            # Closing the response would wait for the blocked reader; shutting the socket down wakes it.
+            sock = getattr(getattr(response.raw, 'connection', None), 'sock', None)
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def run(self, stream: str, max_messages: Optional[int] = None) -> None:
+        """
+        Consumes one stream in the calling thread, reconnecting and resyncing after gaps.
+
+        Parameters:
+        - stream (str): The stream name.
+        - max_messages (Optional[int], optional): Return after this many messages (useful in tests). Defaults to None.
+        """
+        delay = self.reconnect_delay
+        received = 0
+        first_connection = True
+        while not self._stop.is_set():
+            if not first_connection:
+                self.resync(stream)
+            first_connection = False
+            try:
+                for batch in self._read_batches(stream):
+                    self._dispatch(stream, batch)
+                    received += len(batch)
+                    delay = self.reconnect_delay
+                    if max_messages is not None and received >= max_messages:
+                        return
+            except Exception as exc:
+                if self._stop.is_set():
+                    return
+                logging.getLogger(__name__).warning("Stream %s broke: %s", stream, exc)
+            if self._stop.is_set():
+                return
+            self.stats[stream]['reconnects'] += 1
+            self._stop.wait(delay)
+            delay = min(self.max_reconnect_delay, delay * 2)
+
+    def resync(self, stream: str) -> None:
+        """Replaces incrementally maintained state with a full fetch after a gap in a stream."""
+        self.stats[stream]['resyncs'] += 1
+        self._invalidate(stream)
+        if stream == 'inventory' and self.sdk._inventory_snapshot is not None:
+            self.sdk._inventory_snapshot.refresh()
+        for handler in self._resync_handlers.get(stream, []):
+            handler()
+
+    def _invalidate(self, stream: str) -> None:
+        """Drops the cached responses and derived maps that a change on `stream` makes stale."""
+        cache = self.sdk.cache
+        if cache is not None:
+            for prefix in self.CACHE_PREFIXES.get(stream, []):
+                cache.invalidate(prefix, self.sdk.host_url + self.sdk.path)
+        if stream in self.CONFIGLET_STREAMS:
+            # Moving the write generation drops the applied-container maps, as a write sent by the SDK does.
+            self.sdk._write_generation += 1
+            if self.sdk._configlet_resolver is not None:
+                self.sdk._configlet_resolver.stale = True
+
+    def _read_batches(self, stream: str) -> Iterable[List[ResourceChange]]:
+        """Yields the changes decoded from one connection; the lines of each received chunk form one batch."""
+        response = self.sdk._send('GET', self.streams[stream], use_path=False, stream=True,
+                                  timeout=(30, self.read_timeout))
+        self._responses[stream] = response
+        try:
+            if self._stop.is_set():
+                # stop() ran before the response was registered, so it could not shut this connection down.
+                return
+            response.raise_for_status()
+            pending = b''
+            for chunk in response.iter_content(chunk_size=None):
+                lines = (pending + chunk).split(b'\n')
+                pending = lines.pop()
+                batch = [self._decode(stream, line) for line in lines if line.strip()]
+                if batch:
+                    yield batch
+        finally:
+            self._responses.pop(stream, None)
+            response.close()
+        raise ConnectionError(f"Stream {stream} ended")
+
+    def _decode(self, stream: str, line: bytes) -> ResourceChange:
+        message = json.loads(line)
+        if 'error' in message:
+            raise RuntimeError(f"Stream error: {message['error']}")
+        result = message.get('result', message)
+        value = result.get('value', {})
+        self.stats[stream]['messages'] += 1
+        return ResourceChange(stream, result.get('type', 'UPDATED'), value.get('key', {}), value, result.get('time'))
+
+    def _dispatch(self, stream: str, batch: List[ResourceChange]) -> None:
+        self.stats[stream]['batches'] += 1
+        self._invalidate(stream)
+        if stream == 'inventory' and self.sdk._inventory_snapshot is not None:
+            upserts = [device_record(change.value) for change in batch if change.type != 'DELETED']
+            deletes = [change.key.get('deviceId') for change in batch if change.type == 'DELETED']
+            self.sdk._inventory_snapshot.apply_changes(upserts, deletes)
+        for handler in self._handlers.get(stream, []):
+            handler(batch)
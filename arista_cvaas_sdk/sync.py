@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import re
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from .bulk import ConfigletBulkWriter
+
+if TYPE_CHECKING:
+    from .client import AristaCVAAS
+
+
+def normalize_config(config: str) -> str:
+    """
+    Normalizes a configlet body so that formatting-only differences do not count as changes:
+    line endings become '\\n', trailing whitespace is stripped from every line and trailing blank
+    lines are dropped.
+
+    Parameters:
+    - config (str): The configuration text.
+
+    Returns:
+    - str: The normalized text.
+    """
+    lines = [line.rstrip() for line in config.replace('\r\n', '\n').replace('\r', '\n').split('\n')]
+    while lines and not lines[-1]:
+        lines.pop()
+    return '\n'.join(lines)
+
+
+def config_hash(config: str) -> str:
+    """Returns the SHA-256 hex digest of a normalized configlet body."""
+    return hashlib.sha256(normalize_config(config).encode('utf-8')).hexdigest()
+
+
+class ConfigletDirectorySync:
+    """
+    Synchronizes a directory of configlet files with the tenant by content hash.
+
+    Every file is one configlet named after the file (without `suffix`). Local and remote bodies are
+    compared by the hash of their normalized text, so only configlets whose content really differs are
+    pushed. Remote hashes are kept in an index keyed by configlet key and `dateTimeInLongFormat`; a remote
+    configlet whose version is unchanged is never normalized or hashed again. The index can be persisted
+    with `index_path`.
+
+    Remote configlets without a local file are only deleted when `delete=True`, and only among the
+    configlets whose name matches `name_regex` (when given), so a directory can manage a subset of the tenant.
+    """
+
+    def __init__(self, sdk: 'AristaCVAAS', directory: str, suffix: str = '', index_path: Optional[str] = None,
+                 name_regex: Optional[str] = None, delete: bool = False, max_workers: int = 8, page_size: int = 2000) -> None:
+        self.sdk = sdk
+        self.directory = directory
+        self.suffix = suffix
+        self.index_path = index_path
+        self.name_pattern = re.compile(name_regex) if name_regex else None
+        self.delete = delete
+        self.max_workers = max_workers
+        self.page_size = page_size
+        # key -> (dateTimeInLongFormat, hash, name)
+        self.remote_index: Dict[str, Tuple[Any, str, str]] = {}
+        if index_path and os.path.exists(index_path):
+            with open(index_path) as f:
+                self.remote_index = {key: tuple(value) for key, value in json.load(f).items()}
+
+    def local_configlets(self) -> Dict[str, Tuple[str, str]]:
+        """
+        Reads the directory.
+
+        Returns:
+        - Dict[str, Tuple[str, str]]: Configlet name -> (hash, body) for every file in the directory.
+        """
+        configlets = {}
+        for entry in sorted(os.scandir(self.directory), key=lambda x: x.name):
+            if not entry.is_file() or entry.name.startswith('.'):
+                continue
+            if self.suffix and not entry.name.endswith(self.suffix):
+                continue
+            name = entry.name[:-len(self.suffix)] if self.suffix else entry.name
+            if self.name_pattern and not self.name_pattern.search(name):
+                continue
+            with open(entry.path, encoding='utf-8') as f:
+                body = f.read()
+            configlets[name] = (config_hash(body), body)
+        return configlets
+
+    def remote_hashes(self) -> Dict[str, Tuple[str, str]]:
+        """
+        Streams the configlet listing page by page and returns the hash of every remote configlet, reusing the index
+        for configlets whose version has not changed since it was hashed.
+
+        Returns:
+        - Dict[str, Tuple[str, str]]: Configlet name -> (key, hash).
+        """
+        remote = {}
+        index = {}
+        for configlet in self.sdk._iter_all_configlets(self.page_size):
+            name, key, version = configlet.get('name'), configlet.get('key'), configlet.get('dateTimeInLongFormat')
+            if self.name_pattern and not self.name_pattern.search(name):
+                continue
+            cached = self.remote_index.get(key)
+            if cached is not None and cached[0] == version:
+                digest = cached[1]
+            else:
+                digest = config_hash(configlet.get('config') or '')
+            index[key] = (version, digest, name)
+            remote[name] = (key, digest)
+        self.remote_index = index
+        return remote
+
+    def plan(self) -> Dict[str, Any]:
+        """
+        Computes what a sync would change, without writing anything.
+
+        Returns:
+        - Dict[str, Any]: 'create' and 'update' (names), 'delete' ((name, key) pairs), 'unchanged' (count),
+          'operations' (bulk writer operations) and 'configlet_names_ids' (the remote listing).
+        """
+        local = self.local_configlets()
+        remote = self.remote_hashes()
+
+        create = [name for name in local if name not in remote]
+        update = [name for name in local if name in remote and remote[name][1] != local[name][0]]
+        delete = [(name, remote[name][0]) for name in remote if name not in local] if self.delete else []
+        operations = [{'op': 'create', 'name': name, 'config': local[name][1]} for name in create]
+        operations += [{'op': 'update', 'target': remote[name][0], 'config': local[name][1]} for name in update]
+        return {
+            'create': create,
+            'update': update,
+            'delete': delete,
+            'unchanged': len(local) - len(create) - len(update),
+            'operations': operations,
+            'configlet_names_ids': [(name, key) for name, (key, _) in remote.items()],
+        }
+
+    def sync(self, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Pushes the changed configlets concurrently and, when enabled, deletes remote configlets with no local file.
+
+        Parameters:
+        - dry_run (bool, optional): Plan and validate without writing. Defaults to False.
+
+        Returns:
+        - Dict[str, Any]: The plan ('create', 'update', 'delete', 'unchanged') plus 'results', the bulk writer's
+          per-operation rows, and 'deleted', the delete response (None if nothing was deleted).
+        """
+        plan = self.plan()
+        results = []
+        if plan['operations']:
+            # The listing was just streamed, so the writer does not need to fetch it again.
+            writer = ConfigletBulkWriter(self.sdk, max_workers=self.max_workers)
+            results = writer.run(plan['operations'], dry_run=dry_run, configlet_names_ids=plan['configlet_names_ids'])
+
+        deleted = None
+        if plan['delete'] and not dry_run:
+            deleted = self.sdk.delete_configlets(plan['delete'])
+
+        if not dry_run:
+            # Written configlets have a new version; drop them so the next run re-hashes them.
+            written = {row['key'] for row in results if row['status'] in ('created', 'updated')}
+            written.update(key for _, key in plan['delete'])
+            self.remote_index = {key: value for key, value in self.remote_index.items() if key not in written}
+        if self.index_path:
+            self.save_index()
+
+        return {
+            'create': plan['create'],
+            'update': plan['update'],
+            'delete': [name for name, _ in plan['delete']],
+            'unchanged': plan['unchanged'],
+            'results': results,
+            'deleted': deleted,
+        }
+
+    def save_index(self, path: Optional[str] = None) -> None:
+        """Writes the remote hash index to a JSON file (defaults to `index_path`)."""
+        path = path or self.index_path
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({key: list(value) for key, value in self.remote_index.items()}, f)
+        os.replace(temp_path, path)
@@ -0,0 +1,271 @@
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from .client import AristaCVAAS
+
+TERMINAL_STATUSES = frozenset(('Completed', 'Failed', 'Cancelled'))
+# Reported for a task that no poll has found `missing_polls` times in a row; it is not polled again.
+MISSING_STATUS = 'Missing'
+
+
+class TaskEvent(NamedTuple):
+    task_id: str
+    previous_status: Optional[str]
+    status: Optional[str]
+    task: Dict[str, Any]
+
+
+def task_ids_from_response(response: Any) -> List[str]:
+    """
+    Extracts the task IDs from a `post_provisioning_save_temp_actions` response.
+
+    Parameters:
+    - response (Any): The saveTopology response, e.g. {'data': {'status': 'success', 'taskIds': ['12', '13']}}.
+
+    Returns:
+    - List[str]: The task IDs (empty if the save created no tasks or failed).
+    """
+    if not isinstance(response, dict):
+        return []
+    data = response.get('data', response)
+    task_ids = data.get('taskIds', []) if isinstance(data, dict) else []
+    return [str(task_id) for task_id in task_ids]
+
+
+class _WatchedTask:
+    __slots__ = ('future', 'status', 'task', 'polls', 'missing', 'next_poll', 'started')
+
+    def __init__(self, future: 'Future', now: float) -> None:
+        self.future = future
+        self.status: Optional[str] = None
+        self.task: Dict[str, Any] = {}
+        self.polls = 0
+        self.missing = 0
+        self.next_poll = now
+        self.started = now
+
+
+class TaskWatcher:
+    """
+    Tracks many CVaaS tasks at once from a single background thread.
+
+    Every task has its own schedule: it is polled again after `min_interval` seconds, and the interval
+    grows by `backoff` on every poll that brings no state change, up to `max_interval`; a state change
+    resets it. Each poll covers only the tasks that are due: up to `max_individual` of them are fetched
+    one by one with getTaskById.do, more with one streamed task listing. A task that is not found
+    `missing_polls` times in a row is finished with status 'Missing' and a LookupError. Completion is
+    exposed three ways: callbacks receiving a TaskEvent for every state change, one Future per task
+    resolved with the final task dict, and the `events()` async iterator.
+    """
+
+    def __init__(self, sdk: 'AristaCVAAS', min_interval: float = 1.0, max_interval: float = 30.0,
+                 backoff: float = 1.5, timeout: Optional[float] = None, max_individual: int = 4,
+                 missing_polls: int = 5) -> None:
+        self.sdk = sdk
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.max_individual = max_individual
+        self.missing_polls = missing_polls
+        self.polls = 0
+        self._tasks: Dict[str, _WatchedTask] = {}
+        self._callbacks: List[Callable[[TaskEvent], None]] = []
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def add_callback(self, callback: Callable[[TaskEvent], None]) -> None:
+        """Registers a function called, from the polling thread, with a TaskEvent for every state change."""
+        with self._condition:
+            self._callbacks.append(callback)
+
+    def watch(self, task_ids: Union[Iterable[str], Dict[str, Any]]) -> Dict[str, 'Future']:
+        """
+        Starts tracking tasks.
+
+        Parameters:
+        - task_ids (Union[Iterable[str], Dict[str, Any]]): Task IDs, or a `post_provisioning_save_temp_actions` response.
+
+        Returns:
+        - Dict[str, Future]: One future per task ID, resolved with the task dict once the task reaches
+          Completed, Failed or Cancelled (or with a TimeoutError after `timeout` seconds, or a LookupError
+          once the task has been missing `missing_polls` polls in a row).
+        """
+        from concurrent.futures import Future
+
+        if isinstance(task_ids, dict):
+            task_ids = task_ids_from_response(task_ids)
+        now = time.monotonic()
+        futures = {}
+        with self._condition:
+            for task_id in map(str, task_ids):
+                if task_id not in self._tasks:
+                    self._tasks[task_id] = _WatchedTask(Future(), now)
+                futures[task_id] = self._tasks[task_id].future
+            self._stopped = False
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='cvaas-task-watcher', daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+        return futures
+
+    def wait(self, task_ids: Optional[Iterable[str]] = None, timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Blocks until the given tasks (default: every watched task) are finished.
+
+        Returns:
+        - Dict[str, Dict[str, Any]]: Task ID -> final task dict.
+
+        Raises:
+        - concurrent.futures.TimeoutError: If `timeout` seconds pass first.
+        """
+        from concurrent.futures import wait as wait_futures, TimeoutError as FutureTimeoutError
+
+        with self._condition:
+            ids = list(self._tasks) if task_ids is None else [str(x) for x in task_ids]
+            futures = {task_id: self._tasks[task_id].future for task_id in ids}
+        _, not_done = wait_futures(list(futures.values()), timeout=timeout)
+        if not_done:
+            raise FutureTimeoutError(f"{len(not_done)} task(s) still running")
+        return {task_id: future.result() for task_id, future in futures.items()}
+
+    async def events(self) -> AsyncIterator[TaskEvent]:
+        """
+        Async iterator of TaskEvents, ending once every task watched so far is finished.
+
+        Usage:
+            async for event in watcher.events():
+                print(event.task_id, event.status)
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        queue: 'asyncio.Queue[Optional[TaskEvent]]' = asyncio.Queue()
+
+        def forward(event: TaskEvent) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+        with self._condition:
+            self._callbacks.append(forward)
+            pending = [task.future for task in self._tasks.values()]
+        done = asyncio.ensure_future(asyncio.gather(*(asyncio.wrap_future(f) for f in pending), return_exceptions=True))
+        done.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                yield event
+            # Deliver events queued before the sentinel was processed.
+            while not queue.empty():
+                event = queue.get_nowait()
+                if event is not None:
+                    yield event
+        finally:
+            with self._condition:
+                self._callbacks.remove(forward)
+
+    def stop(self) -> None:
+        """Stops the polling thread; futures of unfinished tasks stay pending."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _pending(self) -> Dict[str, _WatchedTask]:
+        return {task_id: task for task_id, task in self._tasks.items() if not task.future.done()}
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    pending = self._pending()
+                    if not pending:
+                        self._condition.wait()
+                        continue
+                    delay = min(task.next_poll for task in pending.values()) - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                if self._stopped:
+                    return
+                now = time.monotonic()
+                due = {task_id: task for task_id, task in self._pending().items() if task.next_poll <= now}
+            self._poll(due)
+
+    def _fetch(self, task_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetches the given tasks, one by one when there are at most `max_individual`, otherwise with one
+        streamed task listing. Tasks CVaaS does not know are left out; other failures raise.
+        """
+        wanted = set(task_ids)
+        if len(wanted) <= self.max_individual:
+            found = {}
+            for task_id in wanted:
+                task = self.sdk.get_task_by_id(task_id)
+                if isinstance(task, dict) and 'errorCode' in task:
+                    continue
+                if not isinstance(task, dict) or 'workOrderId' not in task:
+                    raise RuntimeError(f"Unable to fetch task {task_id}: {task}")
+                found[task_id] = task
+            return found
+        found = {}
+        for task in self.sdk.iter_tasks():
+            task_id = str(task.get('workOrderId'))
+            if task_id in wanted:
+                found[task_id] = task
+                if len(found) == len(wanted):
+                    break
+        return found
+
+    def _poll(self, pending: Dict[str, _WatchedTask]) -> None:
+        self.polls += 1
+        failed = False
+        try:
+            found = self._fetch(pending)
+        except Exception as exc:
+            logging.getLogger(__name__).warning("Task poll failed: %s", exc)
+            found, failed = {}, True
+
+        now = time.monotonic()
+        events = []
+        finished = []
+        with self._condition:
+            callbacks = list(self._callbacks)
+            for task_id, watched in pending.items():
+                task = found.get(task_id)
+                status = task.get('workOrderUserDefinedStatus') if task else watched.status
+                watched.polls += 1
+                # A failed poll says nothing about the task, so only successful polls count it as missing.
+                watched.missing = 0 if task is not None else watched.missing + (not failed)
+                if task is not None and status != watched.status:
+                    events.append(TaskEvent(task_id, watched.status, status, task))
+                    watched.status, watched.task = status, task
+                    watched.polls = 0
+                watched.next_poll = now + min(self.max_interval, self.min_interval * self.backoff ** watched.polls)
+                if status in TERMINAL_STATUSES:
+                    finished.append((watched, None))
+                elif watched.missing >= self.missing_polls:
+                    events.append(TaskEvent(task_id, watched.status, MISSING_STATUS, watched.task))
+                    watched.status = MISSING_STATUS
+                    finished.append((watched, LookupError(f"Task {task_id} not found in {watched.missing} polls")))
+                elif self.timeout is not None and now - watched.started > self.timeout:
+                    finished.append((watched, TimeoutError(f"Task {task_id} still {status} after {self.timeout}s")))
+
+        for event in events:
+            for callback in callbacks:
+                try:
+                    callback(event)
+                except Exception:
+                    logging.getLogger(__name__).exception("Task callback failed")
+        for watched, error in finished:
+            if error is None:
+                watched.future.set_result(watched.task)
+            else:
+                watched.future.set_exception(error)
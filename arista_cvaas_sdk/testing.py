@@ -0,0 +1,134 @@
+import json
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Union
+
+_DISCONNECT = object()
+
+
+class LocalResourceStream:
+    """
+    Local stand-in for CVaaS used to exercise ResourceSubscriber without a tenant.
+
+    Subscribe paths are served as chunked newline-delimited JSON that stays open until `disconnect()`;
+    every `publish()` is sent to the open subscriptions of that path as one chunk. Plain GETs are
+    answered from `routes` (path without query string -> JSON body, or a callable returning it), which
+    lets resyncs perform their full fetch against the same server.
+
+    Usage:
+        with LocalResourceStream(routes={'/cvpservice/inventory/devices': devices}) as server:
+            sdk = AristaCVAAS(server.url, 'token')
+            server.publish('/api/resources/inventory/v1/Device/subscribe', {'key': {'deviceId': 'SN1'}, 'hostname': 'leaf1'})
+    """
+
+    def __init__(self, routes: Optional[Dict[str, Union[Any, Callable[[], Any]]]] = None, host: str = '127.0.0.1', port: int = 0) -> None:
+        self.routes = dict(routes or {})
+        self._subscribers: Dict[str, List[queue.Queue]] = {}
+        self._lock = threading.Lock()
+        self.connections: Dict[str, int] = {}
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'LocalResourceStream':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        with self._lock:
+            for subscribers in self._subscribers.values():
+                for subscriber in subscribers:
+                    subscriber.put(_DISCONNECT)
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'LocalResourceStream':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def wait_for_subscribers(self, path: str, count: int = 1, timeout: float = 5.0) -> bool:
+        """Blocks until `path` has had at least `count` connections in total."""
+        deadline = time.monotonic() + timeout
+        while self.connections.get(path, 0) < count:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def publish(self, path: str, *values: Dict[str, Any], type: str = 'UPDATED', time: Optional[str] = None) -> None:
+        """Sends resource values, as one chunk, to every open subscription of `path`."""
+        lines = [json.dumps({'result': {'value': value, 'type': type, 'time': time}}) for value in values]
+        self._broadcast(path, ('\n'.join(lines) + '\n').encode('utf-8'))
+
+    def publish_error(self, path: str, message: str = 'internal error') -> None:
+        """Sends an error message to every open subscription of `path`."""
+        self._broadcast(path, (json.dumps({'error': {'code': 13, 'message': message}}) + '\n').encode('utf-8'))
+
+    def disconnect(self, path: str) -> None:
+        """Ends every open subscription of `path`, simulating a dropped connection."""
+        self._broadcast(path, _DISCONNECT)
+
+    def _broadcast(self, path: str, item: Any) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(path, []))
+        for subscriber in subscribers:
+            subscriber.put(item)
+
+    def _handler_class(self) -> type:
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                path = self.path.split('?', 1)[0]
+                if path in stand_in.routes:
+                    body = stand_in.routes[path]
+                    body = json.dumps(body() if callable(body) else body).encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                self._subscribe(path)
+
+            def _subscribe(self, path: str) -> None:
+                subscriber: queue.Queue = queue.Queue()
+                with stand_in._lock:
+                    stand_in._subscribers.setdefault(path, []).append(subscriber)
+                    stand_in.connections[path] = stand_in.connections.get(path, 0) + 1
+                try:
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/x-ndjson')
+                    self.send_header('Transfer-Encoding', 'chunked')
+                    self.end_headers()
+                    self.wfile.flush()
+                    while True:
+                        item = subscriber.get()
+                        if item is _DISCONNECT:
+                            self.wfile.write(b'0\r\n\r\n')
+                            break
+                        self.wfile.write(f'{len(item):x}\r\n'.encode('ascii') + item + b'\r\n')
+                        self.wfile.flush()
+                except OSError:
+                    pass
+                finally:
+                    with stand_in._lock:
+                        stand_in._subscribers[path].remove(subscriber)
+                    self.close_connection = True
+
+        return Handler
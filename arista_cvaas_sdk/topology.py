@@ -0,0 +1,180 @@
+import os
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .staging import container_add_action
+from .tracing import tracer_of
+
+if TYPE_CHECKING:
+    from .client import AristaCVAAS
+
+# Joins the names of a path into the key of its prefix; cannot occur in a container name read from a table.
+_KEY_SEP = '\x1f'
+
+
+class TopologyImport:
+    """
+    Container tree built from a table of hierarchy paths, e.g. one row per rack with region, site, pod and
+    rack columns, or one column of 'EMEA/London/Pod1/Rack3' strings split on `sep`.
+
+    The table is processed column by column with vectorized pandas operations: every distinct path prefix
+    becomes one container, so a site shared by thousands of racks is created once. Containers are ordered
+    level by level, so every parent precedes its children, and `iter_actions()` / `iter_batches()` stream
+    the addTempAction.do actions in that order. Containers named in `existing` are reused instead of added.
+
+    Parameters:
+    - source (Union[pd.DataFrame, str, os.PathLike]): A DataFrame, or the path of a CSV file with a header row.
+    - columns (Optional[Sequence[str]], optional): The level columns, top level first. Defaults to every column
+      (or the first column when `sep` is given).
+    - sep (Optional[str], optional): Splits a single path column into levels, e.g. '/'. Defaults to None.
+    - parent_id (str, optional): The container key the top level is created under. Defaults to 'root'.
+    - parent_name (str, optional): The name of that container; empty for the root. Defaults to ''.
+    - existing (Optional[Dict[str, str]], optional): Container name -> key of containers that already exist.
+    - uuid_length (int, optional): The number of digits of the generated temporary keys. Defaults to 13.
+    """
+
+    def __init__(self, source: Union['pd.DataFrame', str, 'os.PathLike'], columns: Optional[Sequence[str]] = None,
+                 sep: Optional[str] = None, parent_id: str = 'root', parent_name: str = '',
+                 existing: Optional[Dict[str, str]] = None, uuid_length: int = 13) -> None:
+        self.parent_id = parent_id
+        self.parent_name = parent_name
+        self.uuid_length = uuid_length
+        self.levels = self._levels(self._frame(source), columns, sep)
+        self.nodes = self._build(self.levels, existing or {})
+
+    @staticmethod
+    def _frame(source: Union['pd.DataFrame', str, 'os.PathLike']) -> 'pd.DataFrame':
+        if isinstance(source, pd.DataFrame):
+            return source
+        if isinstance(source, (str, os.PathLike)):
+            return pd.read_csv(source, dtype=str, keep_default_na=False)
+        raise TypeError("source must be a pandas DataFrame or the path of a CSV file")
+
+    @staticmethod
+    def _levels(frame: 'pd.DataFrame', columns: Optional[Sequence[str]], sep: Optional[str]) -> 'pd.DataFrame':
+        if columns is None:
+            columns = list(frame.columns[:1]) if sep is not None else list(frame.columns)
+        missing = [column for column in columns if column not in frame.columns]
+        if missing:
+            raise ValueError(f"Missing hierarchy columns: {missing}")
+        if not columns:
+            raise ValueError("At least one hierarchy column is required")
+        if sep is not None:
+            if len(columns) != 1:
+                raise ValueError("sep splits exactly one path column")
+            levels = frame[columns[0]].astype('string').str.strip(sep).str.split(sep, expand=True)
+            levels.columns = [f'level_{index}' for index in range(levels.shape[1])]
+        else:
+            levels = frame[list(columns)].astype('string')
+        levels = levels.apply(lambda column: column.str.strip()).replace('', pd.NA)
+
+        present = levels.notna().to_numpy()
+        gaps = np.flatnonzero((~present[:, :-1] & present[:, 1:]).any(axis=1))
+        if len(gaps):
+            raise ValueError(f"Rows with an empty level above a non-empty one: {levels.index[gaps[:5]].tolist()}")
+        return levels
+
+    def _build(self, levels: 'pd.DataFrame', existing: Dict[str, str]) -> 'pd.DataFrame':
+        frames = []
+        parent_keys = pd.Series('', index=levels.index, dtype='string')
+        for depth, column in enumerate(levels.columns):
+            names = levels[column]
+            keys = parent_keys + _KEY_SEP + names if depth else names
+            present = names.notna()
+            frames.append(pd.DataFrame({'depth': depth, 'name': names[present], 'key': keys[present],
+                                        'parent_key': parent_keys[present] if depth else pd.NA})
+                          .drop_duplicates('key'))
+            parent_keys = keys
+        nodes = pd.concat(frames, ignore_index=True)
+
+        # CloudVision container names are unique tenant-wide, so one name cannot appear under two parents.
+        paths_per_name = nodes.groupby('name', sort=False)['key'].nunique()
+        duplicates = paths_per_name[paths_per_name > 1]
+        if len(duplicates):
+            raise ValueError(f"Container names used at more than one path: {duplicates.index[:5].tolist()}")
+
+        nodes['exists'] = nodes['name'].isin(list(existing)).to_numpy()
+        nodes['node_id'] = [existing[name] if found else f"New_Container_{str(uuid.uuid4().int)[:self.uuid_length]}"
+                            for name, found in zip(nodes['name'], nodes['exists'])]
+        by_key = pd.Series(nodes['node_id'].to_numpy(), index=nodes['key'].to_numpy())
+        names_by_key = pd.Series(nodes['name'].to_numpy(), index=nodes['key'].to_numpy())
+        top = nodes['depth'] == 0
+        nodes['parent_id'] = nodes['parent_key'].map(by_key).where(~top, self.parent_id)
+        nodes['parent_name'] = nodes['parent_key'].map(names_by_key).where(~top, self.parent_name)
+        return nodes.drop(columns='parent_key')
+
+    def __len__(self) -> int:
+        """The number of containers to add (existing containers excluded)."""
+        return int((~self.nodes['exists']).sum())
+
+    def iter_actions(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the container add actions, parents before children.
+
+        Returns:
+        - Iterator[Dict[str, Any]]: The actions, as sent inside an addTempAction.do 'data' list.
+        """
+        new = self.nodes[~self.nodes['exists']]
+        for name, node_id, parent_id, parent_name in zip(new['name'], new['node_id'], new['parent_id'],
+                                                         new['parent_name']):
+            yield container_add_action(name, node_id, parent_id, parent_name)
+
+    def iter_batches(self, batch_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Yields addTempAction.do payloads of up to `batch_size` actions; a payload only refers to parents
+        added by itself or by an earlier payload.
+
+        Parameters:
+        - batch_size (int, optional): The number of actions per payload. Defaults to 100.
+
+        Returns:
+        - Iterator[Dict[str, Any]]: {'data': [...]} payloads.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than zero")
+        batch: List[Dict[str, Any]] = []
+        for action in self.iter_actions():
+            batch.append(action)
+            if len(batch) == batch_size:
+                yield {'data': batch}
+                batch = []
+        if batch:
+            yield {'data': batch}
+
+    def ascii_tree(self) -> str:
+        """Returns the tree in the style of `generate_topology_hierarchy_post_data(print_ascii=True)`."""
+        # Sorting the keys of all prefixes gives the depth-first order: a prefix sorts before its extensions.
+        ordered = self.nodes.sort_values('key', kind='stable')
+        return '\n'.join(('| ' * depth) + f"+-{name}" for depth, name in zip(ordered['depth'], ordered['name']))
+
+    def submit(self, sdk: 'AristaCVAAS', batch_size: int = 100) -> Dict[str, Any]:
+        """
+        Sends the batches as addTempAction.do requests, stopping at the first failed request because later
+        batches may add children of its containers.
+
+        Parameters:
+        - sdk (AristaCVAAS): The client.
+        - batch_size (int, optional): The number of actions per request. Defaults to 100.
+
+        Returns:
+        - Dict[str, Any]: 'containers' (the number added), 'existing', 'requests', 'results' (one response or
+          {'error': ...} per request) and 'node_ids' (path -> container key, '/'-joined).
+        """
+        summary = {'containers': 0, 'existing': int(self.nodes['exists'].sum()), 'requests': 0, 'results': [],
+                   'node_ids': self.node_ids()}
+        with tracer_of(sdk).span('topology_import', {'containers': len(self), 'batch_size': batch_size}):
+            for payload in self.iter_batches(batch_size):
+                result = sdk.post_provisioning_add_temp_actions([payload])[0]
+                summary['requests'] += 1
+                summary['results'].append(result)
+                if 'error' in result:
+                    break
+                summary['containers'] += len(payload['data'])
+        return summary
+
+    def node_ids(self, sep: str = '/') -> Dict[str, str]:
+        """Returns path -> container key (temporary for new containers), the path joined with `sep`."""
+        return dict(zip(self.nodes['key'].str.replace(_KEY_SEP, sep, regex=False), self.nodes['node_id']))
@@ -0,0 +1,214 @@
+import contextvars
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# The span of the innermost open `Tracer.span()` block in this thread or task.
+_current_span: 'contextvars.ContextVar[Optional[Span]]' = contextvars.ContextVar('cvaas_current_span', default=None)
+_span_ids = itertools.count(1)
+
+
+class Span:
+    """
+    One finished or in-progress span, shaped after OpenTelemetry's ReadableSpan: a name, a kind ('internal'
+    or 'client'), nanosecond start and end times, attributes, a status ('unset', 'ok' or 'error') and the
+    exceptions recorded as events. `parent_id` links a span to the span that was current when it started.
+    """
+    __slots__ = ('name', 'kind', 'span_id', 'parent_id', 'trace_id', 'start_time', 'end_time', 'attributes',
+                 'status', 'events')
+
+    def __init__(self, name: str, kind: str = 'internal', parent: Optional['Span'] = None,
+                 attributes: Optional[Dict[str, Any]] = None) -> None:
+        self.name = name
+        self.kind = kind
+        self.span_id = next(_span_ids)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.trace_id = parent.trace_id if parent is not None else self.span_id
+        self.start_time = time.time_ns()
+        self.end_time: Optional[int] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status = 'unset'
+        self.events: List[Dict[str, Any]] = []
+
+    @property
+    def duration(self) -> Optional[float]:
+        """The duration in seconds, once the span has ended."""
+        return None if self.end_time is None else (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        self.attributes.update(attributes)
+
+    def set_status(self, status: str) -> None:
+        self.status = status
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.events.append({'name': 'exception', 'exception.type': type(exc).__name__, 'exception.message': str(exc)})
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, kind={self.kind!r}, duration={self.duration}, status={self.status!r})"
+
+
+class _NoOpSpan:
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+    def set_status(self, status: str) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+
+class _NoOpContext:
+    __slots__ = ()
+
+    def __enter__(self) -> _NoOpSpan:
+        return _NOOP_SPAN
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NOOP_CONTEXT = _NoOpContext()
+
+
+class NoOpTracer:
+    """The default tracer: spans cost one attribute check and are never recorded."""
+    enabled = False
+
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None, kind: str = 'internal') -> _NoOpContext:
+        return _NOOP_CONTEXT
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans in memory, e.g. for tests; mirrors OpenTelemetry's exporter of the same name."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self) -> List[Span]:
+        """Returns the finished spans, in the order they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class Tracer:
+    """
+    Records nested spans and hands each finished span to an exporter (anything with `export(spans)`).
+
+    The current span is kept in a context variable, so nesting follows the call stack, and work submitted
+    through the SDK's thread pools is parented to the span that submitted it.
+    """
+    enabled = True
+
+    def __init__(self, exporter: Optional[Any] = None) -> None:
+        self.exporter = exporter if exporter is not None else InMemorySpanExporter()
+
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None, kind: str = 'internal') -> Iterator[Span]:
+        """
+        Opens a span as a child of the current span.
+
+        Parameters:
+        - name (str): The span name, e.g. a helper name or 'HTTP GET'.
+        - attributes (Optional[Dict[str, Any]], optional): Initial attributes. Defaults to None.
+        - kind (str, optional): 'internal' or 'client'. Defaults to 'internal'.
+
+        Returns:
+        - Iterator[Span]: A context manager yielding the span; an escaping exception is recorded and re-raised.
+        """
+        span = Span(name, kind, _current_span.get(), attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            span.set_status('error')
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_time = time.time_ns()
+            self.exporter.export([span])
+
+
+class OpenTelemetryTracer:
+    """
+    Sends spans to OpenTelemetry. Requires the `opentelemetry-api` package; configure the SDK and exporters
+    through OpenTelemetry as usual.
+
+    Parameters:
+    - tracer (Optional[Any], optional): An `opentelemetry.trace.Tracer`. Defaults to the global provider's
+      tracer for this package.
+    """
+    enabled = True
+
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = tracer if tracer is not None else trace.get_tracer('arista_cvaas_sdk')
+        self._kinds = {'internal': trace.SpanKind.INTERNAL, 'client': trace.SpanKind.CLIENT}
+
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None, kind: str = 'internal') -> Iterator[Any]:
+        with self._tracer.start_as_current_span(name, kind=self._kinds.get(kind, self._kinds['internal']),
+                                                attributes=attributes) as span:
+            yield _OpenTelemetrySpan(span, self._trace)
+
+
+class _OpenTelemetrySpan:
+    __slots__ = ('_span', '_trace')
+
+    def __init__(self, span: Any, trace: Any) -> None:
+        self._span = span
+        self._trace = trace
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self._span.set_attribute(key, value)
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        self._span.set_attributes(attributes)
+
+    def set_status(self, status: str) -> None:
+        codes = {'ok': self._trace.StatusCode.OK, 'error': self._trace.StatusCode.ERROR}
+        if status in codes:
+            self._span.set_status(self._trace.Status(codes[status]))
+
+    def record_exception(self, exc: BaseException) -> None:
+        self._span.record_exception(exc)
+
+
+def current_span() -> Optional[Span]:
+    """Returns the innermost open span recorded by a `Tracer`, or None."""
+    return _current_span.get()
+
+
+def tracer_of(owner: Any) -> Any:
+    """Returns the tracer of an SDK-like object, or a no-op tracer when it has none."""
+    tracer = getattr(owner, 'tracer', None)
+    return tracer if tracer is not None else _NOOP_TRACER
+
+
+_NOOP_TRACER = NoOpTracer()
@@ -0,0 +1,160 @@
+import gzip
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from requests import Response
+
+# Request bodies smaller than this are sent as-is; compressing them saves nothing on the wire.
+COMPRESS_MIN_BYTES = 1024
+
+
+def compress_json_body(body: Any, min_bytes: int = COMPRESS_MIN_BYTES) -> Optional[Tuple[bytes, int]]:
+    """
+    Serializes a JSON request body and gzips it.
+
+    Parameters:
+    - body (Any): The JSON-serializable request body.
+    - min_bytes (int, optional): Bodies smaller than this, once serialized, are not compressed. Defaults to COMPRESS_MIN_BYTES.
+
+    Returns:
+    - Optional[Tuple[bytes, int]]: The gzip-compressed body and its uncompressed size, or None if the body is
+      too small to be worth compressing.
+    """
+    raw = json.dumps(body).encode('utf-8')
+    if len(raw) < min_bytes:
+        return None
+    return gzip.compress(raw, compresslevel=6), len(raw)
+
+
+def _body_length(body: Any) -> int:
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return 0
+
+
+class TransferStats:
+    """
+    Thread-safe counters of request and response body bytes, as sent on the wire and after decoding.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Resets every counter to zero."""
+        with self._lock:
+            self.requests = 0
+            self.bytes_sent = 0
+            self.bytes_sent_uncompressed = 0
+            self.bytes_received_wire = 0
+            self.bytes_received_decoded = 0
+            self.encodings: Dict[str, int] = {}
+
+    def record(self, response: Response, decoded_bytes: Optional[int] = None, uncompressed_sent: Optional[int] = None) -> None:
+        """
+        Records one completed request.
+
+        Parameters:
+        - response (Response): The response; its prepared request supplies the bytes sent.
+        - decoded_bytes (Optional[int], optional): The decoded body size, for streamed responses. Defaults to len(response.content).
+        - uncompressed_sent (Optional[int], optional): The request body size before compression, if it was compressed.
+        """
+        request = getattr(response, 'request', None)
+        sent = _body_length(getattr(request, 'body', None))
+        if uncompressed_sent is not None and not sent:
+            sent = uncompressed_sent
+        if decoded_bytes is None:
+            decoded_bytes = len(response.content or b'')
+        wire_bytes = 0
+        tell = getattr(response.raw, 'tell', None)
+        if callable(tell):
+            try:
+                wire_bytes = tell()
+            except (OSError, ValueError):
+                wire_bytes = 0
+        if not wire_bytes:
+            content_length = response.headers.get('Content-Length')
+            wire_bytes = int(content_length) if content_length and content_length.isdigit() else decoded_bytes
+        encoding = response.headers.get('Content-Encoding', 'identity')
+
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += sent
+            self.bytes_sent_uncompressed += uncompressed_sent if uncompressed_sent is not None else sent
+            self.bytes_received_wire += wire_bytes
+            self.bytes_received_decoded += decoded_bytes
+            self.encodings[encoding] = self.encodings.get(encoding, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the counters together with the bytes saved by compression in each direction."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'bytes_sent': self.bytes_sent,
+                'bytes_sent_uncompressed': self.bytes_sent_uncompressed,
+                'bytes_received_wire': self.bytes_received_wire,
+                'bytes_received_decoded': self.bytes_received_decoded,
+                'bytes_saved': (self.bytes_sent_uncompressed - self.bytes_sent)
+                               + (self.bytes_received_decoded - self.bytes_received_wire),
+                'encodings': dict(self.encodings),
+            }
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Returns the endpoint path without its query string, e.g. '/configlet/getConfigletById.do'."""
+    return endpoint.split('?', 1)[0]
+
+
+class LatencyStats:
+    """
+    Thread-safe request latencies per endpoint family: a count, the mean and an exponentially weighted
+    recent mean, which follows the current conditions of the tenant.
+    """
+
+    def __init__(self, alpha: float = 0.2) -> None:
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forgets every observation."""
+        with self._lock:
+            self._families: Dict[str, list] = {}
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Records the duration of one request to `endpoint`."""
+        family = endpoint_family(endpoint)
+        with self._lock:
+            entry = self._families.get(family)
+            if entry is None:
+                self._families[family] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] += self.alpha * (seconds - entry[2])
+
+    def latency(self, endpoint: Optional[str] = None) -> Optional[float]:
+        """
+        Returns the recent latency of an endpoint family, or across all families when `endpoint` is None.
+
+        Returns:
+        - Optional[float]: Seconds, or None when nothing matching has been observed.
+        """
+        with self._lock:
+            if endpoint is not None:
+                entry = self._families.get(endpoint_family(endpoint))
+                return entry[2] if entry else None
+            count = sum(entry[0] for entry in self._families.values())
+            return sum(entry[1] for entry in self._families.values()) / count if count else None
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Returns 'requests', 'mean' and 'recent' per endpoint family."""
+        with self._lock:
+            return {family: {'requests': count, 'mean': total / count, 'recent': recent}
+                    for family, (count, total, recent) in self._families.items()}
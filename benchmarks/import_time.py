@@ -0,0 +1,59 @@
+"""
+Cold-start benchmark for the SDK.
+
+Imports the client and constructs an AristaCVAAS instance in fresh interpreters, reports the best
+wall time, and exits non-zero if it exceeds the target or if a heavy dependency was imported eagerly.
+
+    python benchmarks/import_time.py --target-ms 250 --runs 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('pandas', 'numpy', 'tqdm', 'pybatfish', 'pyarrow')
+
+PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+from arista_cvaas_sdk import AristaCVAAS
+AristaCVAAS('https://example.invalid', 'token')
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{'ms': elapsed_ms, 'heavy': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def measure(runs: int) -> dict:
+    """Runs the probe `runs` times in fresh interpreters and returns the best time and any heavy imports seen."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    timings = []
+    heavy = set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', PROBE], env=env, check=True, capture_output=True, text=True).stdout
+        result = json.loads(output)
+        timings.append(result['ms'])
+        heavy.update(result['heavy'])
+    return {'best_ms': min(timings), 'timings_ms': timings, 'heavy': sorted(heavy)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--target-ms', type=float, default=250.0, help='Maximum accepted cold start in milliseconds.')
+    parser.add_argument('--runs', type=int, default=5, help='Number of fresh interpreters to measure.')
+    args = parser.parse_args()
+
+    result = measure(args.runs)
+    print(f"best {result['best_ms']:.1f} ms over {args.runs} runs (target {args.target_ms:.0f} ms)")
+    if result['heavy']:
+        print(f"FAIL: heavy modules imported at startup: {', '.join(result['heavy'])}")
+        return 1
+    if result['best_ms'] > args.target_ms:
+        print("FAIL: cold start exceeds target")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
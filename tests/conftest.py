@@ -0,0 +1,119 @@
+import io
+import json
+import os
+import sys
+from typing import Any, Callable, Dict, List, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arista_cvaas_sdk import AristaCVAAS  # noqa: E402
+
+Route = Union[Tuple[int, Any], Callable[[str, Dict[str, Any]], Tuple[int, Any]]]
+
+
+class FakeSession:
+    """
+    Stands in for `requests.Session`: the first route whose key is a substring of the URL answers the
+    request with (status, body), or with what a callable route returns for (url, request kwargs).
+    Unrouted URLs answer 404. Every request is recorded in `calls` as (method, url, kwargs).
+    """
+
+    def __init__(self, routes: Dict[str, Route]) -> None:
+        self.routes = routes
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    def request(self, method: str, url: str, headers: Any = None, stream: bool = False, **kwargs: Any) -> requests.Response:
+        self.calls.append((method, url, kwargs))
+        status, body = 404, b''
+        for fragment, route in self.routes.items():
+            if fragment in url:
+                status, body = route(url, kwargs) if callable(route) else route
+                break
+        response = requests.Response()
+        response.status_code = status
+        response._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        response.url = url
+        response.raw = io.BytesIO(response._content)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('DELETE', url, **kwargs)
+
+    def urls(self, fragment: str = '') -> List[str]:
+        return [url for _, url, _ in self.calls if fragment in url]
+
+
+@pytest.fixture
+def make_sdk() -> Callable[..., AristaCVAAS]:
+    """Returns a factory for clients whose requests are answered by a FakeSession with the given routes."""
+    def make(routes: Dict[str, Route], **kwargs: Any) -> AristaCVAAS:
+        sdk = AristaCVAAS('https://cvaas.example', 'token', **kwargs)
+        sdk.session = FakeSession(routes)
+        return sdk
+    return make
+
+
+class FakeConfiglets:
+    """
+    An in-memory configlet store answering the configlet listing (paged by startIndex/endIndex), lookup, create,
+    update and delete endpoints.
+    Configlets are kept as {key: {'key', 'name', 'config', 'dateTimeInLongFormat'}}.
+    """
+
+    def __init__(self, configs: Dict[str, str]) -> None:
+        self.configlets: Dict[str, Dict[str, Any]] = {}
+        self.version = 1000
+        for name, config in configs.items():
+            self.add(name, config)
+
+    def add(self, name: str, config: str) -> str:
+        key = f'configlet_{len(self.configlets) + 1}'
+        self.version += 1
+        self.configlets[key] = {'key': key, 'name': name, 'config': config, 'dateTimeInLongFormat': self.version}
+        return key
+
+    def by_name(self, name: str) -> Dict[str, Any]:
+        return next(configlet for configlet in self.configlets.values() if configlet['name'] == name)
+
+    def routes(self) -> Dict[str, Route]:
+        return {
+            'getConfiglets.do': self._list,
+            'getConfigletById.do': self._get,
+            'addConfiglet.do': lambda url, kwargs: (200, {'data': self.add(kwargs['json']['name'], kwargs['json']['config'])}),
+            'updateConfiglet.do': self._update,
+            'deleteConfiglet.do': self._delete,
+        }
+
+    def _list(self, url: str, kwargs: Dict[str, Any]) -> Tuple[int, Any]:
+        query = {name: int(values[0]) for name, values in parse_qs(urlparse(url).query).items()}
+        configlets = list(self.configlets.values())
+        page = configlets[query.get('startIndex', 0):query.get('endIndex', len(configlets))]
+        return 200, {'data': page, 'total': len(configlets)}
+
+    def _get(self, url: str, kwargs: Dict[str, Any]) -> Tuple[int, Any]:
+        configlet = self.configlets.get(url.split('id=', 1)[1])
+        return (200, configlet) if configlet else (200, {'errorCode': '132801', 'errorMessage': 'Entity does not exist'})
+
+    def _update(self, url: str, kwargs: Dict[str, Any]) -> Tuple[int, Any]:
+        body = kwargs['json']
+        self.version += 1
+        self.configlets[body['key']].update(name=body['name'], config=body['config'], dateTimeInLongFormat=self.version)
+        return 200, {'data': 'Configlet is successfully updated'}
+
+    def _delete(self, url: str, kwargs: Dict[str, Any]) -> Tuple[int, Any]:
+        for item in kwargs['json']:
+            self.configlets.pop(item['key'], None)
+        return 200, {'data': 'success'}
@@ -0,0 +1,66 @@
+from urllib.parse import parse_qs, urlparse
+
+from conftest import FakeConfiglets
+
+CONFIGLETS = [{'key': 'k1', 'name': 'aaa', 'containerCount': 3}, {'key': 'k2', 'name': 'ntp', 'containerCount': 1},
+              {'key': 'k3', 'name': 'unused', 'containerCount': 0}]
+APPLIED = {'aaa': ['Tenant', 'DC1', 'DC2'], 'ntp': ['DC1']}
+
+
+def applied_containers(url, kwargs):
+    query = {k: v[0] for k, v in parse_qs(urlparse(url).query).items()}
+    entries = [{'containerName': name} for name in APPLIED[query['configletName']]]
+    return 200, {'data': entries[int(query['startIndex']):int(query['endIndex'])], 'total': len(entries)}
+
+
+def routes():
+    return {'getConfiglets.do': (200, {'data': CONFIGLETS, 'total': 3}), 'getAppliedContainers.do': applied_containers,
+            'addConfiglet.do': (200, {'data': 'k4'})}
+
+
+def test_lookups_are_paginated_and_keep_input_order(make_sdk):
+    sdk = make_sdk(routes())
+    result = sdk.get_configlet_applied_containers(['ntp', 'aaa'], page_size=2)
+    assert [(entry['configletName'], [x['containerName'] for x in entry['data']]) for entry in result] == \
+        [('ntp', ['DC1']), ('aaa', ['Tenant', 'DC1', 'DC2'])]
+    assert len(sdk.session.urls('configletName=aaa')) == 2
+
+
+def test_lookup_errors_are_returned(make_sdk):
+    sdk = make_sdk({'getAppliedContainers.do': (200, {'errorCode': '1', 'errorMessage': 'denied'})})
+    assert sdk.get_configlet_applied_containers(['aaa', 'ntp']) == {'errorCode': '1', 'errorMessage': 'denied'}
+
+
+def test_maps_are_built_once_and_rebuilt_after_writes(make_sdk):
+    sdk = make_sdk(routes())
+    assert sdk.get_applied_configlets_per_container() == [['Tenant', ['aaa']], ['DC1', ['aaa', 'ntp']], ['DC2', ['aaa']]]
+    assert sdk.get_applied_containers_per_configlet() == [['aaa', ['Tenant', 'DC1', 'DC2']], ['ntp', ['DC1']]]
+    assert sdk.session.urls('configletName=unused') == []
+    lookups = len(sdk.session.urls('getAppliedContainers.do'))
+    assert lookups == 2
+
+    sdk.get_applied_configlets_per_container()
+    assert len(sdk.session.urls('getAppliedContainers.do')) == lookups
+    sdk.get_applied_configlets_per_container(refresh=True)
+    assert len(sdk.session.urls('getAppliedContainers.do')) == 2 * lookups
+
+    sdk.post_create_configlet('ntp server 1.1.1.1', 'ntp2')
+    sdk.get_applied_containers_per_configlet()
+    assert len(sdk.session.urls('getAppliedContainers.do')) == 3 * lookups
+
+
+def test_listings_page_past_the_first_2000_configlets(make_sdk):
+    tenant = FakeConfiglets({f'c{i}': '' for i in range(2001)})
+    sdk = make_sdk(tenant.routes())
+    names_ids = sdk.get_configlet_names_ids()
+    assert len(names_ids) == 2001 and names_ids[-1] == ('c2000', 'configlet_2001')
+    assert [url.split('?', 1)[1] for url in sdk.session.urls('getConfiglets.do')] == [
+        'startIndex=0&endIndex=2000', 'startIndex=2000&endIndex=4000']
+    assert [c['name'] for c in sdk._iter_all_configlets(page_size=1000)][-2:] == ['c1999', 'c2000']
+    assert len(sdk.session.urls('getConfiglets.do')) == 5
+
+
+def test_listing_errors_are_returned(make_sdk):
+    sdk = make_sdk({'getConfiglets.do': (500, b'')})
+    assert 'error' in sdk.get_configlet_names_ids()
+    assert 'error' in sdk.get_configlets_by_regex_match(['ntp'])
@@ -0,0 +1,74 @@
+from conftest import FakeConfiglets
+
+
+def statuses(rows):
+    return [(row['op'], row['name'], row['status']) for row in rows]
+
+
+def test_operations_are_applied(make_sdk):
+    tenant = FakeConfiglets({'ntp': 'ntp server 1.1.1.1', 'dns': 'ip name-server 8.8.8.8'})
+    sdk = make_sdk(tenant.routes())
+    ntp = tenant.by_name('ntp')
+    rows = sdk.bulk_write_configlets([
+        {'op': 'create', 'name': 'snmp', 'config': 'snmp-server community x ro'},
+        {'op': 'update', 'target': ntp['key'], 'config': 'ntp server 2.2.2.2', 'expected_version': ntp['dateTimeInLongFormat']},
+        {'op': 'copy', 'source': 'dns'},
+        {'op': 'append', 'source': 'snmp-missing', 'target': 'dns'},
+    ])
+    assert statuses(rows) == [('create', 'snmp', 'created'), ('update', 'ntp', 'updated'),
+                              ('copy', 'dns copy', 'created'), ('append', None, 'not_found')]
+    assert rows[0]['key'] == tenant.by_name('snmp')['key']
+    assert tenant.by_name('ntp')['config'] == 'ntp server 2.2.2.2'
+    assert tenant.by_name('dns copy')['config'] == 'ip name-server 8.8.8.8'
+    assert len(sdk.session.urls('getConfiglets.do')) == 1
+
+
+def test_append_concatenates_bodies(make_sdk):
+    tenant = FakeConfiglets({'base': 'hostname leaf1', 'extra': 'ip routing'})
+    sdk = make_sdk(tenant.routes())
+    assert statuses(sdk.bulk_write_configlets([{'op': 'append', 'source': 'extra', 'target': 'base'}])) == \
+        [('append', 'base', 'updated')]
+    assert tenant.by_name('base')['config'] == 'hostname leaf1\n! APPENDED FROM extra\nip routing'
+
+
+def test_conflicts_are_rejected_before_any_write(make_sdk):
+    tenant = FakeConfiglets({'ntp': 'ntp server 1.1.1.1'})
+    sdk = make_sdk(tenant.routes())
+    rows = sdk.bulk_write_configlets([
+        {'op': 'create', 'name': 'ntp', 'config': 'x'},
+        {'op': 'create', 'name': 'new', 'config': 'x'},
+        {'op': 'copy', 'source': 'ntp', 'name': 'new'},
+        {'op': 'update', 'target': 'ntp', 'config': 'a'},
+        {'op': 'append', 'source': 'ntp', 'target': 'ntp'},
+        {'op': 'update', 'target': 'ntp', 'config': 'b', 'expected_version': 1},
+        {'op': 'rename', 'target': 'ntp'},
+        {'op': 'create', 'name': 'no-body'},
+    ], dry_run=True)
+    assert [row['status'] for row in rows] == ['conflict', 'planned', 'conflict', 'planned', 'conflict', 'conflict',
+                                               'invalid', 'invalid']
+    assert sdk.session.urls('addConfiglet.do') == sdk.session.urls('updateConfiglet.do') == []
+
+
+def test_names_past_the_first_listing_page_conflict(make_sdk):
+    tenant = FakeConfiglets({f'c{i}': '' for i in range(2001)})
+    sdk = make_sdk(tenant.routes())
+    rows = sdk.bulk_write_configlets([{'op': 'create', 'name': 'c2000', 'config': 'x'},
+                                      {'op': 'update', 'target': 'c2000', 'config': 'y'}], dry_run=True)
+    assert [row['status'] for row in rows] == ['conflict', 'planned']
+    assert rows[1]['key'] == 'configlet_2001'
+    assert len(sdk.session.urls('getConfiglets.do')) == 2
+
+
+def test_stale_versions_and_failed_writes_are_reported(make_sdk):
+    tenant = FakeConfiglets({'ntp': 'ntp server 1.1.1.1', 'dns': 'ip name-server 8.8.8.8'})
+    routes = tenant.routes()
+    routes['addConfiglet.do'] = (200, {'errorCode': '132518', 'errorMessage': 'Data already exists'})
+    sdk = make_sdk(routes)
+    rows = sdk.bulk_write_configlets([
+        {'op': 'update', 'target': 'ntp', 'config': 'x', 'expected_version': 1},
+        {'op': 'create', 'name': 'snmp', 'config': 'x'},
+        {'op': 'update', 'target': 'dns', 'config': 'ip name-server 1.1.1.1'},
+    ])
+    assert [row['status'] for row in rows] == ['stale', 'error', 'updated']
+    assert rows[1]['error'] == {'errorCode': '132518', 'errorMessage': 'Data already exists'}
+    assert tenant.by_name('ntp')['config'] == 'ntp server 1.1.1.1'
@@ -0,0 +1,89 @@
+import time
+
+from arista_cvaas_sdk import DiskCacheBackend, MemoryCacheBackend, ResponseCache
+
+
+def test_memory_backend_lru_and_ttl(monkeypatch):
+    backend = MemoryCacheBackend(max_bytes=10)
+    backend.set('a', b'12345', ttl=60)
+    backend.set('b', b'12345', ttl=60)
+    assert backend.get('a') == b'12345'
+    backend.set('c', b'1', ttl=60)  # evicts 'b', the least recently used
+    assert backend.get('b') is None and backend.get('a') == b'12345' and backend.evictions == 1
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 120)
+    assert backend.get('a') is None
+    assert backend.delete_prefix('') == 1 and len(backend) == 0
+
+
+def test_disk_backend_round_trip(tmp_path):
+    backend = DiskCacheBackend(str(tmp_path))
+    backend.set('/configlet/getConfiglets.do?x', b'{"data": []}', ttl=60)
+    assert DiskCacheBackend(str(tmp_path)).get('/configlet/getConfiglets.do?x') == b'{"data": []}'
+    assert backend.delete_prefix('/configlet/') == 1
+    assert backend.get('/configlet/getConfiglets.do?x') is None
+
+
+def test_policies_use_the_longest_prefix():
+    cache = ResponseCache(policies={'/configlet/': 10, '/configlet/getConfigletById.do': 99})
+    assert cache.ttl_for('/configlet/getConfigletById.do?id=1') == 99
+    assert cache.ttl_for('/configlet/getConfiglets.do') == 10
+    assert cache.ttl_for('/inventory/devices') is None
+
+
+def test_client_serves_hits_and_invalidates_on_writes(make_sdk):
+    sdk = make_sdk({'getConfiglets.do': (200, {'data': [], 'total': 0}),
+                    'addConfiglet.do': (200, {'data': 'ok'})}, cache=True)
+    for _ in range(3):
+        assert sdk.get_configlets() == (200, {'data': [], 'total': 0})
+    assert len(sdk.session.urls('getConfiglets.do')) == 1
+    sdk.post_create_configlet('ntp server 1.1.1.1', 'ntp')
+    sdk.get_configlets()
+    assert len(sdk.session.urls('getConfiglets.do')) == 2
+    assert sdk.cache.stats()['hits'] == 2
+
+
+def test_read_only_posts_are_not_writes(make_sdk):
+    sdk = make_sdk({'getConfiglets.do': (200, {'data': [], 'total': 0}),
+                    'getManagementIp.do': (200, {'data': [], 'proposedMgmtIp': '10.0.0.1'}),
+                    'addConfiglet.do': (200, {'data': 'ok'})}, cache=True)
+    sdk.get_configlets()
+    sdk.post_retrieve_device_management_ip('00:1c:73:00:00:01')
+    sdk.post_get_device_managment_ip_addresses('00:1c:73:00:00:01', ['c1'])
+    assert sdk._write_generation == 0
+    sdk.get_configlets()
+    assert len(sdk.session.urls('getConfiglets.do')) == 1
+
+    sdk.post_create_configlet('ntp server 1.1.1.1', 'ntp')
+    assert sdk._write_generation == 1
+
+
+def test_tenants_sharing_a_backend_are_kept_apart(make_sdk, tmp_path):
+    backend = DiskCacheBackend(str(tmp_path))
+    first = make_sdk({'getConfiglets.do': (200, {'data': [{'name': 'a'}], 'total': 1}),
+                      'addConfiglet.do': (200, {'data': 'ok'})}, cache=ResponseCache(backend))
+    second = make_sdk({'getConfiglets.do': (200, {'data': [{'name': 'b'}], 'total': 1})},
+                      cache=ResponseCache(backend))
+    second.host_url = 'https://other.example'
+    assert first.get_configlets()[1]['data'] == [{'name': 'a'}]
+    assert second.get_configlets()[1]['data'] == [{'name': 'b'}]
+    assert len(backend) == 2
+
+    first.post_create_configlet('ntp server 1.1.1.1', 'ntp')
+    assert len(backend) == 1
+    assert second.get_configlets()[1]['data'] == [{'name': 'b'}]
+    assert len(second.session.urls('getConfiglets.do')) == 1
+
+
+def test_responses_overtaken_by_a_write_are_not_stored(make_sdk):
+    def listing(url, kwargs):
+        if len(sdk.session.urls('getConfiglets.do')) == 1:
+            sdk.post_create_configlet('ntp server 1.1.1.1', 'ntp')
+        return 200, {'data': [], 'total': 0}
+
+    sdk = make_sdk({'getConfiglets.do': listing, 'addConfiglet.do': (200, {'data': 'ok'})}, cache=True)
+    sdk.get_configlets()
+    assert len(sdk.cache.backend) == 0
+    sdk.get_configlets()
+    sdk.get_configlets()
+    assert len(sdk.session.urls('getConfiglets.do')) == 2
@@ -0,0 +1,81 @@
+import threading
+import time
+
+import pytest
+
+from arista_cvaas_sdk._concurrency import SingleFlight, map_concurrently
+
+
+def run_together(count, func):
+    """Runs `func` in `count` threads released at the same moment and returns their results or exceptions."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(index):
+        barrier.wait()
+        try:
+            results[index] = func()
+        except Exception as exc:
+            results[index] = exc
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return {'data': 'shared'}
+
+    threading.Timer(0.2, release.set).start()
+    results = run_together(8, lambda: flight.do('key', slow))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {'executed': 1, 'coalesced': 7, 'in_flight': 0}
+
+
+def test_errors_are_shared_and_nothing_is_cached():
+    flight = SingleFlight()
+
+    def failing():
+        time.sleep(0.2)
+        raise RuntimeError('boom')
+
+    assert all(isinstance(result, RuntimeError) for result in run_together(4, lambda: flight.do('key', failing)))
+    assert flight.do('key', lambda: 'fresh') == 'fresh'
+    assert flight.do('other', lambda: 'other') == 'other'
+    assert flight.stats()['executed'] == 3
+
+
+def test_client_coalesces_identical_gets(make_sdk):
+    def listing(url, kwargs):
+        time.sleep(0.2)
+        return 200, {'data': [], 'total': 0}
+
+    sdk = make_sdk({'getConfiglets.do': listing})
+    results = run_together(5, sdk.get_configlets)
+    assert len(sdk.session.urls('getConfiglets.do')) == 1
+    assert all(result == (200, {'data': [], 'total': 0}) for result in results)
+
+    sdk = make_sdk({'getConfiglets.do': listing}, coalesce_requests=False)
+    run_together(3, sdk.get_configlets)
+    assert len(sdk.session.urls('getConfiglets.do')) == 3
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_map_concurrently_keeps_order_and_reports_errors(max_workers):
+    def invert(x):
+        return 1 / x
+
+    assert [(item, result, type(error)) for item, result, error in map_concurrently(invert, [1, 0, 4], max_workers)] \
+        == [(1, 1.0, type(None)), (0, None, ZeroDivisionError), (4, 0.25, type(None))]
+    assert map_concurrently(invert, [], max_workers) == []
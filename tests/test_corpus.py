@@ -0,0 +1,61 @@
+import re
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from arista_cvaas_sdk import ConfigletCorpus
+
+CONFIGLETS = [
+    {'key': 'c1', 'name': 'base', 'config': 'hostname leaf1\nntp server 10.0.0.1', 'dateTimeInLongFormat': 1},
+    {'key': 'c2', 'name': 'empty', 'config': '', 'dateTimeInLongFormat': 2},
+    {'key': 'c3', 'name': 'ntp', 'config': 'ntp server 10.0.0.2\nhostname leaf2\n', 'dateTimeInLongFormat': 3},
+    {'key': 'c4', 'name': 'unicode', 'config': 'description Zürich café\nhostname züri', 'dateTimeInLongFormat': 4},
+]
+
+PATTERNS = [r'^hostname', r'ntp.*$', r'leaf\d\Z', r'^$', r'(?m)^hostname (\w+)', r'Zürich\s(\w+)',
+            r'(?i)ZÜRI', r'\w+é', r'ntp server (\S+)']
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    with ConfigletCorpus.build(str(tmp_path / 'corpus'), CONFIGLETS) as corpus:
+        yield corpus
+
+
+@pytest.mark.parametrize('pattern', PATTERNS)
+def test_search_matches_re_search_per_body(corpus, pattern):
+    expected = [c['key'] for c in CONFIGLETS if re.search(pattern, c['config'])]
+    assert [key for key, _, _ in corpus.search(pattern)] == expected
+    for key in expected:
+        config = next(c['config'] for c in CONFIGLETS if c['key'] == key)
+        assert corpus.findall(pattern, key) == re.findall(pattern, config)
+
+
+def test_bytes_patterns_behave_like_str_patterns(corpus):
+    assert [key for key, _, _ in corpus.search(rb'\w+' + 'é'.encode())] == ['c4']
+    assert [key for key, _, _ in corpus.search(re.compile(rb'^hostname'))] == ['c1']
+
+
+def test_text_and_reopen(corpus, tmp_path):
+    assert corpus.text('c4') == CONFIGLETS[3]['config']
+    assert bytes(corpus.body('c1')) == CONFIGLETS[0]['config'].encode()
+    assert len(corpus) == 4 and 'c3' in corpus and 'missing' not in corpus
+    with ConfigletCorpus(str(tmp_path / 'corpus')) as reopened:
+        assert reopened.keys == corpus.keys
+
+
+def test_regex_match_helper_returns_the_same_with_and_without_corpus(make_sdk, corpus):
+    by_key = {c['key']: c for c in CONFIGLETS}
+
+    def configlet_by_id(url, kwargs):
+        return 200, by_key[parse_qs(urlparse(url).query)['id'][0]]
+
+    sdk = make_sdk({
+        'getConfiglets.do': (200, {'data': CONFIGLETS, 'total': len(CONFIGLETS)}),
+        'getConfigletById.do': configlet_by_id,
+        'getAppliedDevices.do': (200, {'data': [{'hostName': 'leaf1'}], 'total': 1}),
+    })
+    for pattern in PATTERNS:
+        fetched = sdk.get_configlets_by_regex_match([pattern], terse=True)
+        scanned = sdk.get_configlets_by_regex_match([pattern], terse=True, corpus=corpus)
+        assert scanned == fetched, pattern
@@ -0,0 +1,71 @@
+import pytest
+
+from arista_cvaas_sdk import AristaCVAAS, SubtreeHasher, diff_models
+from arista_cvaas_sdk.diff import format_path, iter_leaves
+
+
+def changes(a, b, **kwargs):
+    return [(c.op, c.path_str, c.old, c.new) for c in diff_models(a, b, **kwargs)]
+
+
+def test_dict_adds_removes_and_changes():
+    a = {'x': 1, 'nested': {'name': 'DC1', 'tags': ['a']}, 'gone': True}
+    b = {'x': 2, 'nested': {'name': 'DC1', 'tags': ['a', 'b']}, 'new': None}
+    assert sorted(changes(a, b)) == sorted([
+        ('change', 'x', 1, 2), ('remove', 'gone', True, None), ('add', 'new', None, None),
+        ('add', 'nested.tags[1]', None, 'b')])
+    assert changes(a, a) == []
+
+
+def test_reordered_lists_report_nothing():
+    a = [{'key': 'c1', 'n': 1}, {'key': 'c2', 'n': 2}, 3]
+    assert changes(a, list(reversed(a))) == []
+
+
+def test_list_items_are_matched_by_identity_field():
+    a = [{'key': 'c1', 'name': 'DC1'}, {'key': 'c2', 'name': 'DC2'}]
+    b = [{'key': 'c0', 'name': 'New'}, {'key': 'c2', 'name': 'DC2'}, {'key': 'c1', 'name': 'DC1-renamed'}]
+    assert changes(a, b) == [('add', '[0]', None, {'key': 'c0', 'name': 'New'}),
+                             ('change', '[2].name', 'DC1', 'DC1-renamed')]
+    # Without identity fields the unmatched items pair up by position.
+    assert sorted(changes(a, b, identity_keys=()), key=repr) == sorted([
+        ('change', '[0].key', 'c1', 'c0'), ('change', '[0].name', 'DC1', 'New'),
+        ('add', '[2]', None, {'key': 'c1', 'name': 'DC1-renamed'})], key=repr)
+
+
+@pytest.mark.parametrize('a, b', [(1, 1.0), (1, True), (0, False), ([1, {'x': 2.0}], [1.0, {'x': 2}]),
+                                  ({1: 'a'}, {1.0: 'a'})])
+def test_numbers_that_compare_equal_are_equal(a, b):
+    assert a == b
+    hasher = SubtreeHasher()
+    assert hasher.key(a) == hasher.key(b)
+    assert changes(a, b) == []
+
+
+def test_numbers_that_differ_are_reported():
+    assert changes({'v': 1}, {'v': 1.5}) == [('change', 'v', 1, 1.5)]
+    assert changes({'v': 1}, {'v': '1'}) == [('change', 'v', 1, '1')]
+
+
+def test_compare_models_keeps_membership_semantics():
+    a = [{'a': 1}, {'b': 2}, 3, 1, True, 'x']
+    b = [{'b': 2.0}, 1.0, 'y']
+    expected = [item for item in a if item not in b]
+    assert AristaCVAAS.compare_models(a, b) == expected == [{'a': 1}, 3, 'x']
+    assert AristaCVAAS.compare_models(['a', 'b'], {'a': 1}) == ['b']
+
+
+def test_deep_models_do_not_recurse():
+    deep = current = []
+    for _ in range(5000):
+        current.append([])
+        current = current[0]
+    current.append(1)
+    assert list(iter_leaves(deep)) == [1]
+    assert len(changes(deep, [[]])) == 1
+
+
+def test_leaves_and_paths():
+    assert list(iter_leaves({'a': [1, {'b': 2}], 'c': 3})) == [1, 2, 3]
+    assert list(iter_leaves([1, [2, {'a': [5]}]], into_dicts=False)) == [1, 2, {'a': [5]}]
+    assert format_path(('list', 'childContainerList', 3, 'name')) == 'list.childContainerList[3].name'
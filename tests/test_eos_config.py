@@ -0,0 +1,72 @@
+from arista_cvaas_sdk import EOSConfigParser
+
+CONFIG = """\
+hostname leaf1
+!
+interface Ethernet1
+   description uplink
+   no shutdown
+interface Ethernet2
+   shutdown
+interface Loopback0
+   ip address 10.0.0.1/32
+!
+router bgp 65001
+   neighbor SPINES peer group
+   address-family ipv4
+      neighbor SPINES activate
+banner login
+Authorized use only
+   interface Ethernet9
+EOF
+management api http-commands
+   no shutdown
+end
+"""
+
+
+def test_blocks_follow_indentation():
+    tree = EOSConfigParser().parse(CONFIG)
+    assert [block.header for block in tree.blocks] == [
+        'hostname leaf1', 'interface Ethernet1', 'interface Ethernet2', 'interface Loopback0', 'router bgp 65001',
+        'banner login', 'management api http-commands']
+    bgp = tree.get('router bgp 65001')
+    assert [child.header for child in bgp.children] == ['neighbor SPINES peer group', 'address-family ipv4']
+    assert bgp.children[1].children[0].lineno == 14
+    assert bgp.text() == '\n'.join(CONFIG.splitlines()[10:14])
+
+
+def test_banner_bodies_stay_inside_the_banner():
+    tree = EOSConfigParser().parse(CONFIG)
+    banner = tree.get('banner login')
+    assert [child.line for child in banner.children] == ['Authorized use only', '   interface Ethernet9', 'EOF']
+    assert [block.header for block in tree.sections('interface')] == \
+        ['interface Ethernet1', 'interface Ethernet2', 'interface Loopback0']
+
+
+def test_section_queries():
+    tree = EOSConfigParser().parse(CONFIG)
+    assert [b.header for b in tree.sections('interface Ethernet')] == ['interface Ethernet1', 'interface Ethernet2']
+    assert [b.header for b in tree.sections('interface', regex=r'Loopback\d+$')] == ['interface Loopback0']
+    assert [b.header for b in tree.sections_missing('interface Ethernet', 'no shutdown')] == ['interface Ethernet2']
+    assert [b.header for b in tree.sections_containing('interface', '  shutdown ')] == ['interface Ethernet2']
+    bgp = tree.get('router bgp 65001')
+    assert not bgp.contains('neighbor SPINES activate')
+    assert bgp.contains('neighbor SPINES activate', deep=True)
+    assert tree.sections('vlan') == []
+
+
+def test_find_reports_parent_headers():
+    tree = EOSConfigParser().parse(CONFIG)
+    assert tree.find(r'neighbor SPINES') == [
+        (('router bgp 65001',), '   neighbor SPINES peer group'),
+        (('router bgp 65001', 'address-family ipv4'), '      neighbor SPINES activate')]
+
+
+def test_trees_are_cached_by_content():
+    parser = EOSConfigParser(max_entries=1)
+    tree = parser.parse(CONFIG)
+    assert parser.parse(CONFIG) is tree
+    parser.parse('hostname leaf2\n')
+    assert parser.parse(CONFIG) is not tree
+    assert parser.cache_info() == {'hits': 1, 'misses': 3, 'size': 1}
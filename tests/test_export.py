@@ -0,0 +1,72 @@
+import pyarrow as pa
+import pytest
+
+from arista_cvaas_sdk import TenantExporter, read_tenant_export
+from arista_cvaas_sdk.export import TABLES, ColumnBuilder
+
+CONFIGLETS = [
+    {'key': 'c1', 'name': 'ntp', 'config': 'ntp server 1.1.1.1', 'type': 'Static', 'user': 'cvp',
+     'dateTimeInLongFormat': 1700000000000, 'containerCount': 1, 'netElementCount': 1, 'reconciled': False},
+    {'key': 'c2', 'name': 'unused', 'config': 'x', 'type': 'Static', 'containerCount': 0, 'netElementCount': 0},
+]
+DEVICES = [{'serialNumber': 'SN1', 'hostname': 'leaf1', 'version': '4.30.1F', 'modelName': 'DCS-7050',
+            'mlagEnabled': 'yes', 'bootupTimestamp': 1.5},
+           {'serialNumber': 'SN2', 'hostname': 'leaf2', 'version': '4.30.1F', 'modelName': 'DCS-7050'}]
+
+
+def routes():
+    return {
+        'getConfiglets.do': (200, {'data': CONFIGLETS, 'total': 2}),
+        'getAppliedDevices.do': (200, {'data': [{'hostName': 'leaf1', 'ipAddress': '10.0.0.1', 'macAddress': 'mac1',
+                                                 'appliedBy': 'cvp', 'appliedDate': 1700000000000}], 'total': 1}),
+        'getAppliedContainers.do': (200, {'data': [{'containerName': 'DC1', 'containerKey': 'k1'}], 'total': 1}),
+        '/inventory/devices': (200, DEVICES),
+        '/inventory/containers': (200, [{'Key': 'k1', 'Name': 'DC1', 'Mode': 'expand', 'CreatedOn': 1700000000000}]),
+        'getAllTempActions.do': (200, {'data': [{'action': 'associate', 'nodeType': 'configlet',
+                                                 'configletList': ['c1']}], 'total': 1}),
+    }
+
+
+def test_column_builder_types_values_and_batches():
+    builder = ColumnBuilder(TABLES['devices'], batch_rows=2)
+    batches = list(builder.batches(DEVICES + [{'serialNumber': 3, 'ztpMode': 'false'}]))
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    table = pa.Table.from_batches(batches).unify_dictionaries()
+    assert table.column('serial_number').to_pylist() == ['SN1', 'SN2', '3']
+    assert table.column('mlag_enabled').to_pylist() == [None, None, None]
+    assert table.column('ztp_mode').to_pylist() == [None, None, None]
+    assert pa.types.is_dictionary(table.schema.field('version').type)
+    assert table.column('version').to_pylist() == ['4.30.1F', '4.30.1F', None]
+
+
+def test_tables_are_filled_from_the_streamed_listings(make_sdk):
+    sdk = make_sdk(routes())
+    tables = TenantExporter(sdk).tables()
+    assert list(tables) == list(TABLES)
+    assert tables['configlets'].column('name').to_pylist() == ['ntp', 'unused']
+    assignments = tables['assignments'].to_pylist()
+    assert [(row['configlet_key'], row['target_type'], row['target_id'], row['target_name']) for row in assignments] == \
+        [('c1', 'device', 'mac1', 'leaf1'), ('c1', 'container', 'k1', 'DC1')]
+    assert tables['temp_actions'].column('configlet_list').to_pylist() == [['c1']]
+    assert tables['containers'].column('created_on').type == pa.timestamp('ms')
+    # Only configlets reported as applied are looked up, and the listing is streamed once.
+    assert len(sdk.session.urls('getAppliedDevices.do')) == 1
+    assert len(sdk.session.urls('getConfiglets.do')) == 1
+
+
+@pytest.mark.parametrize('format', ['parquet', 'arrow'])
+def test_export_round_trip(make_sdk, tmp_path, format):
+    sdk = make_sdk(routes())
+    paths = sdk.export_tenant(str(tmp_path), tables=['devices', 'configlets'], format=format)
+    assert list(paths) == ['configlets', 'devices']
+    loaded = read_tenant_export(str(tmp_path))
+    assert set(loaded) == {'configlets', 'devices'}
+    assert loaded['devices'].column('hostname').to_pylist() == ['leaf1', 'leaf2']
+
+
+def test_unknown_tables_and_formats_are_rejected(make_sdk, tmp_path):
+    exporter = TenantExporter(make_sdk(routes()))
+    with pytest.raises(ValueError):
+        exporter.tables(['devices', 'nope'])
+    with pytest.raises(ValueError):
+        exporter.export(str(tmp_path), format='csv')
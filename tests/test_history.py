@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlparse
+
+from arista_cvaas_sdk import ConfigletHistoryStore
+from conftest import FakeConfiglets
+
+
+class FakeHistory:
+    """Serves getConfigletHistory.do pages, newest first, from a per-configlet list of timestamps."""
+
+    def __init__(self, timestamps):
+        self.timestamps = timestamps
+
+    def route(self, url, kwargs):
+        query = {k: v[0] for k, v in parse_qs(urlparse(url).query).items()}
+        entries = [{'key': f"{query['configletId']}-{t}", 'updatedDateTimeInLongFormat': t}
+                   for t in sorted(self.timestamps.get(query['configletId'], []), reverse=True)]
+        page = entries[int(query['startIndex']):int(query['endIndex'])]
+        return 200, {'total': len(entries), 'configletHistory': page}
+
+
+def make_store(make_sdk, timestamps, **kwargs):
+    history = FakeHistory(timestamps)
+    configlets = {'data': [{'name': f'name-{key}', 'key': key} for key in timestamps], 'total': len(timestamps)}
+    sdk = make_sdk({'getConfigletHistory.do': history.route, 'getConfiglets.do': (200, configlets)})
+    return sdk, history, sdk.configlet_history_store(page_size=2, **kwargs)
+
+
+def test_sync_pages_through_history_and_indexes_by_time(make_sdk):
+    sdk, _, store = make_store(make_sdk, {'c1': [100, 300, 500], 'c2': [200, 400]})
+    assert store.sync() == {'c1': 3, 'c2': 2}
+    assert [entry['updatedDateTimeInLongFormat'] for entry in store.between(150, 400)] == [200, 300, 400]
+    assert [entry['key'] for entry in store.for_configlet('c1', start=300)] == ['c1-300', 'c1-500']
+    assert store.changed_configlets(0, 450) == {'name-c1': 2, 'name-c2': 2}
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    assert store.between(epoch, epoch.replace(microsecond=250000)) == store.between(0, 250)
+
+
+def test_resync_stops_at_the_watermark(make_sdk):
+    sdk, history, store = make_store(make_sdk, {'c1': [100, 200, 300, 400, 500]})
+    store.sync()
+    history.timestamps['c1'].append(600)
+    before = len(sdk.session.urls('getConfigletHistory.do'))
+    assert store.sync(['c1']) == {'c1': 1}
+    assert len(sdk.session.urls('getConfigletHistory.do')) - before == 1
+    assert store.sync(['c1']) == {}
+    assert len(store) == 6
+
+
+def test_failed_configlets_are_reported_and_retried(make_sdk):
+    sdk, history, store = make_store(make_sdk, {'c1': [100], 'c2': [200], 'c3': [300]})
+    sdk.session.routes['getConfigletHistory.do'] = lambda url, kwargs: (
+        (500, b'') if 'c2' in url else
+        (200, {'errorCode': '132801', 'errorMessage': 'Entity does not exist'}) if 'c3' in url else history.route(url, kwargs))
+    assert store.sync() == {'c1': 1}
+    assert sorted(store.errors) == ['c2', 'c3'] and 'HTTP 500' in store.errors['c2'] and '132801' in store.errors['c3']
+
+    sdk.session.routes['getConfigletHistory.do'] = history.route
+    assert store.sync() == {'c2': 1, 'c3': 1}
+    assert store.errors == {}
+
+
+def test_sync_lists_configlets_past_the_first_listing_page(make_sdk):
+    tenant = FakeConfiglets({f'c{i}': '' for i in range(2001)})
+    history = FakeHistory({'configlet_2001': [100]})
+    sdk = make_sdk(dict(tenant.routes(), **{'getConfigletHistory.do': history.route}))
+    store = sdk.configlet_history_store()
+    assert store.sync() == {'configlet_2001': 1}
+    assert len(store.configlet_names) == 2001
+
+
+def test_store_persists_between_runs(make_sdk, tmp_path):
+    path = str(tmp_path / 'history.json')
+    sdk, history, store = make_store(make_sdk, {'c1': [100, 200]}, max_workers=1)
+    store.path = path
+    store.sync()
+
+    reloaded = ConfigletHistoryStore(sdk, path=path, page_size=2)
+    assert len(reloaded) == 2 and reloaded.last_synced == {'c1': 200}
+    assert reloaded.configlet_names == {'c1': 'name-c1'}
+    assert reloaded.sync() == {}
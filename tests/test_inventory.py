@@ -0,0 +1,103 @@
+import random
+
+import pandas as pd
+import pytest
+
+from arista_cvaas_sdk import InventorySnapshot
+
+DEVICES = [
+    {'hostname': 'leaf1', 'systemMacAddress': '00:1c:73:00:00:01', 'serialNumber': 'SN1', 'version': '4.30.1F',
+     'modelName': 'DCS-7050', 'complianceCode': '0000', 'parentContainerKey': 'c1'},
+    {'hostname': 'leaf2', 'systemMacAddress': '00:1c:73:00:00:02', 'serialNumber': 'SN2', 'version': '4.31.0F',
+     'modelName': 'DCS-7050', 'complianceCode': '0001', 'parentContainerKey': 'c1'},
+    {'hostname': None, 'systemMacAddress': '00:1c:73:00:00:03', 'serialNumber': 'SN3', 'version': '4.30.1F',
+     'modelName': 'DCS-7280', 'parentContainerKey': 'c2'},
+    {'systemMacAddress': '00:1c:73:00:00:04', 'serialNumber': 'SN4', 'version': '4.30.1F', 'modelName': 'DCS-7280',
+     'complianceCode': None, 'parentContainerKey': 'c2'},
+]
+
+
+@pytest.fixture
+def snapshot():
+    return InventorySnapshot(devices=DEVICES)
+
+
+def serials(frame):
+    return list(frame['serialNumber'])
+
+
+def test_indexed_lookups(snapshot):
+    assert serials(snapshot.by_version('4.30.1F')) == ['SN1', 'SN3', 'SN4']
+    assert serials(snapshot.by_mac(['00:1c:73:00:00:02', 'unknown'])) == ['SN2']
+    assert serials(snapshot.by_hostname('leaf1')) == ['SN1']
+    assert serials(snapshot.lookup('modelName', 'DCS-7280')) == ['SN3', 'SN4']
+    assert snapshot.lookup('missingColumn', 'x').empty
+
+
+def test_match_does_not_match_missing_values_as_nan(snapshot):
+    assert serials(snapshot.match('n.*', columns='hostname')) == []
+    assert serials(snapshot.match('leaf', columns='hostname')) == ['SN1', 'SN2']
+    assert serials(snapshot.match('.*', columns='hostname')) == ['SN1', 'SN2', 'SN3', 'SN4']
+    assert serials(snapshot.match('00:03', anchored=False)) == ['SN3']
+
+
+def test_groupby_keeps_devices_with_missing_keys(snapshot):
+    grouped = snapshot.groupby('complianceCode', columns=['serialNumber'])
+    assert grouped == {'0000': [{'serialNumber': 'SN1'}], '0001': [{'serialNumber': 'SN2'}],
+                       None: [{'serialNumber': 'SN3'}, {'serialNumber': 'SN4'}]}
+    by_two = snapshot.groupby(['parentContainerKey', 'complianceCode'], columns=['serialNumber'])
+    assert sum(len(devices) for devices in by_two.values()) == len(DEVICES)
+    assert by_two[('c2', None)] == [{'serialNumber': 'SN3'}, {'serialNumber': 'SN4'}]
+
+
+def test_group_devices_matches_the_per_device_loop(make_sdk):
+    sdk = make_sdk({'/inventory/devices': (200, DEVICES)})
+    expected = sdk.group_devices('complianceCode')
+    sdk.inventory_snapshot()
+    assert sdk.group_devices('complianceCode') == expected
+    assert {key: len(devices) for key, devices in expected.items()} == {'0000': 1, '0001': 1, None: 2}
+
+
+def test_filter_and_records_round_trip(snapshot):
+    assert serials(snapshot.filter(modelName='DCS-7050', version=['4.31.0F'])) == ['SN2']
+    assert snapshot.records(snapshot.by_serial('SN1')) == [DEVICES[0]]
+    assert snapshot.hostname_mac_pairs('leaf2') == [('leaf2', '00:1c:73:00:00:02')]
+
+
+def test_apply_changes(snapshot):
+    snapshot.apply_changes(upserts=[{'serialNumber': 'SN2', 'version': '4.32.0F'},
+                                    {'serialNumber': 'SN5', 'hostname': 'spine1', 'version': '4.32.0F'}],
+                           deletes=['SN1'])
+    assert serials(snapshot.by_version('4.32.0F')) == ['SN2', 'SN5']
+    assert snapshot.by_serial('SN1').empty
+    assert serials(snapshot.by_hostname('leaf2')) == ['SN2']
+    assert len(snapshot) == 4
+
+
+def test_incremental_changes_match_a_full_rebuild():
+    rng = random.Random(7)
+    devices = [{'serialNumber': f'SN{i}', 'hostname': f'leaf{i}', 'systemMacAddress': f'mac{i}',
+                'version': rng.choice(['4.30.1F', '4.31.0F']), 'complianceCode': rng.choice(['0000', None]),
+                'modelName': 'DCS-7050'} for i in range(200)]
+    snapshot = InventorySnapshot(devices=devices)
+    expected = {device['serialNumber']: {k: v for k, v in device.items() if v is not None} for device in devices}
+    for batch in range(30):
+        upserts = [{'serialNumber': f'SN{rng.randrange(260)}', rng.choice(['version', 'hostname', 'fqdn']):
+                    rng.choice(['4.32.0F', f'host{batch}', None, 'x'])} for _ in range(5)]
+        deletes = [f'SN{rng.randrange(260)}' for _ in range(rng.randrange(3))]
+        snapshot.apply_changes(upserts, deletes)
+        for serial in deletes:
+            expected.pop(serial, None)
+        for upsert in upserts:
+            record = expected.setdefault(upsert['serialNumber'], {})
+            record.update({k: v for k, v in upsert.items() if v is not None})
+            for k, v in upsert.items():
+                if v is None:
+                    record.pop(k, None)
+
+    assert {r['serialNumber']: r for r in snapshot.records()} == expected
+    rebuilt = InventorySnapshot(devices=list(expected.values()))
+    for column in ('version', 'hostname', 'systemMacAddress', 'serialNumber'):
+        for value in set(rebuilt.df[column].dropna()) | {'4.32.0F', 'leaf3'}:
+            assert sorted(serials(snapshot.lookup(column, value))) == sorted(serials(rebuilt.lookup(column, value)))
+    assert isinstance(snapshot.df['version'].dtype, pd.CategoricalDtype)
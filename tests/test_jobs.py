@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from arista_cvaas_sdk import FleetJobRunner, JobAborted
+
+UNAUTHENTICATED = {'code': 24, 'message': 'Status unauthenticated'}
+
+
+def summary(outcomes):
+    return {key: (outcome['status'], outcome.get('result', outcome.get('error')), outcome['resumed'])
+            for key, outcome in outcomes.items()}
+
+
+def test_results_errors_and_exceptions_are_recorded(tmp_path):
+    def operation(item):
+        if item == 2:
+            return {'errorCode': '1'}
+        if item == 3:
+            raise ValueError('bad item')
+        return item * 10
+
+    outcomes = FleetJobRunner(operation, str(tmp_path / 'job.jsonl'), max_workers=3).run([1, 2, 3, 4])
+    assert list(outcomes) == ['1', '2', '3', '4']
+    assert summary(outcomes) == {'1': ('ok', 10, False), '2': ('error', {'errorCode': '1'}, False),
+                                 '3': ('error', 'ValueError: bad item', False), '4': ('ok', 40, False)}
+
+
+def test_rerun_resumes_and_retries_only_failures(tmp_path):
+    journal = str(tmp_path / 'job.jsonl')
+    calls = []
+    failing = {2}
+
+    def operation(item):
+        calls.append(item)
+        if item in failing:
+            raise RuntimeError('transient')
+        return {'item': item}
+
+    FleetJobRunner(operation, journal).run([1, 2, 3])
+    failing.clear()
+    calls.clear()
+    outcomes = FleetJobRunner(operation, journal).run([1, 2, 3])
+    assert calls == [2]
+    assert summary(outcomes) == {'1': ('ok', {'item': 1}, True), '2': ('ok', {'item': 2}, False),
+                                 '3': ('ok', {'item': 3}, True)}
+
+    failing.add(4)
+    FleetJobRunner(operation, journal).run([4])
+    calls.clear()
+    assert summary(FleetJobRunner(operation, journal, retry_errors=False).run([4]))['4'][2] is True
+    assert calls == []
+
+
+def test_truncated_journal_lines_are_ignored(tmp_path):
+    journal = tmp_path / 'job.jsonl'
+    journal.write_text(json.dumps({'key': 'a', 'status': 'ok', 'result': 1}) + '\n{"key": "b", "sta')
+    calls = []
+    outcomes = FleetJobRunner(lambda item: calls.append(item) or 2, str(journal)).run(['a', 'b'])
+    assert calls == ['b']
+    assert summary(outcomes) == {'a': ('ok', 1, True), 'b': ('ok', 2, False)}
+    records = [json.loads(line) for line in journal.read_text().splitlines()[2:]]
+    assert [(record['key'], record['result']) for record in records] == [('b', 2)]
+
+
+def test_expired_token_aborts_and_the_rerun_finishes(tmp_path):
+    journal = str(tmp_path / 'job.jsonl')
+    token_valid = False
+    calls = []
+
+    def operation(item):
+        calls.append(item)
+        if item >= 3 and not token_valid:
+            return UNAUTHENTICATED
+        return item
+
+    with pytest.raises(JobAborted, match='rerun to resume'):
+        FleetJobRunner(operation, journal, max_workers=1).run(range(100))
+    assert len(calls) < 100
+
+    token_valid = True
+    calls.clear()
+    outcomes = FleetJobRunner(operation, journal, max_workers=4).run(range(100))
+    assert 0 not in calls and 3 in calls
+    assert all(outcome['status'] == 'ok' for outcome in outcomes.values())
+
+
+def test_client_helper_reports_progress(make_sdk):
+    seen = []
+    outcomes = make_sdk({}).run_fleet_job(lambda device: device['hostname'].upper(),
+                                          [{'hostname': 'leaf1'}, {'hostname': 'leaf2'}], key=lambda d: d['hostname'],
+                                          on_result=lambda key, status, value: seen.append((key, status, value)))
+    assert summary(outcomes) == {'leaf1': ('ok', 'LEAF1', False), 'leaf2': ('ok', 'LEAF2', False)}
+    assert sorted(seen) == [('leaf1', 'ok', 'LEAF1'), ('leaf2', 'ok', 'LEAF2')]
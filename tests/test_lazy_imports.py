@@ -0,0 +1,37 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import arista_cvaas_sdk
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('pandas', 'numpy', 'pyarrow', 'tqdm', 'pybatfish')
+
+
+def loaded_modules(code):
+    """Runs `code` in a fresh interpreter and returns which heavy modules it imported."""
+    script = f"import sys\n{code}\nimport json\nprint(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    output = subprocess.run([sys.executable, '-c', script], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def test_client_import_does_not_load_heavy_dependencies():
+    assert loaded_modules("from arista_cvaas_sdk import AristaCVAAS\nAristaCVAAS('https://cvaas.example', 'token')") == []
+
+
+def test_heavy_dependencies_load_with_the_feature_that_needs_them():
+    assert 'pandas' in loaded_modules("from arista_cvaas_sdk import InventorySnapshot")
+
+
+@pytest.mark.parametrize('name', arista_cvaas_sdk.__all__)
+def test_every_public_name_resolves(name):
+    assert getattr(arista_cvaas_sdk, name) is not None
+    assert name in dir(arista_cvaas_sdk)
+
+
+def test_unknown_names_raise_attribute_error():
+    with pytest.raises(AttributeError):
+        arista_cvaas_sdk.NotAThing
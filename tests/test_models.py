@@ -0,0 +1,56 @@
+import pytest
+
+from arista_cvaas_sdk import Configlet, Container, Device, TempAction
+
+CONFIGLET = {'key': 'configlet_1', 'name': 'ntp', 'config': 'ntp server 1.1.1.1\n', 'type': 'Static',
+             'containerCount': 0, 'isDraft': False, 'customField': [1]}
+
+
+def test_models_round_trip_the_dict_shape():
+    configlet = Configlet.from_dict(CONFIGLET)
+    assert configlet.to_dict() == CONFIGLET
+    assert configlet.name == 'ntp' and configlet.container_count == 0
+    assert configlet['customField'] == [1] and configlet.get('note', 'none') == 'none'
+    assert 'type' in configlet and 'note' not in configlet
+    with pytest.raises(KeyError):
+        configlet['note']
+    with pytest.raises(AttributeError):
+        configlet.unknown = 1
+    assert Configlet.from_dict(CONFIGLET) == configlet
+
+
+def test_large_configlet_bodies_are_compressed():
+    body = 'interface Ethernet1\n   description é\n' * 100
+    configlet = Configlet.from_dict({'key': 'c', 'config': body})
+    assert type(configlet._body) is tuple and len(configlet._body[0]) < len(body)
+    assert configlet.config == configlet['config'] == body
+    configlet.config = 'short'
+    assert configlet._body == b'short' and configlet.to_dict() == {'key': 'c', 'config': 'short'}
+    assert Configlet.from_dict({'key': 'c', 'config': None}).config is None
+
+
+def test_repeated_strings_are_interned():
+    first, second = Device.from_dicts([{'version': ''.join(['4.30', '.1F']), 'serialNumber': 'SN1'},
+                                       {'version': ''.join(['4.3', '0.1F']), 'serialNumber': 'SN2'}])
+    assert first.version is second.version
+    assert first.to_dict() == {'version': '4.30.1F', 'serialNumber': 'SN1'}
+
+
+def test_containers_keep_their_source_shape():
+    inventory = {'Key': 'c1', 'Name': 'DC1', 'Mode': 'expand', 'CreatedBy': 'cvp'}
+    assert Container.from_dict(inventory).to_dict() == inventory
+
+    topology = {'key': 'root', 'name': 'Tenant', 'type': 'container', 'childContainerList': [
+        {'key': 'c1', 'name': 'DC1', 'childContainerList': []}]}
+    root = Container.from_dict(topology)
+    assert root.to_dict() == topology
+    assert isinstance(root.children[0], Container) and root.get('childContainerList')[0].name == 'DC1'
+    assert repr(root) == "Container(name='Tenant', key='root')"
+
+
+def test_temp_action_payloads():
+    payload = {'action': 'associate', 'nodeType': 'configlet', 'nodeId': '', 'toId': 'SN1', 'toIdType': 'netelement',
+               'configletList': ['c1'], 'configletNamesList': ['ntp'], 'childTasks': [], 'parentTask': ''}
+    action = TempAction.from_dict(payload)
+    assert action.to_dict() == payload
+    assert action.configlet_list == ['c1'] and action.get('fromId') is None
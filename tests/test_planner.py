@@ -0,0 +1,84 @@
+from collections import Counter
+
+import pytest
+
+from arista_cvaas_sdk import BudgetExceeded, CostPlan
+from arista_cvaas_sdk.transport import endpoint_family
+from conftest import FakeConfiglets
+
+
+def families(sdk, since=0):
+    """Counts the requests sent after the `since`-th one per endpoint family, as the planner names them."""
+    return dict(Counter(endpoint_family(url.split('/cvpservice', 1)[1]) for _, url, _ in sdk.session.calls[since:]))
+
+
+def tenant_sdk(make_sdk):
+    tenant = FakeConfiglets({'ntp': 'ntp server 1.1.1.1', 'dns': 'ip name-server 1.1.1.1', 'aaa': 'aaa root secret x'})
+    routes = tenant.routes()
+    routes['getAppliedDevices.do'] = (200, {'data': [{'hostName': 'leaf1'}], 'total': 1})
+    routes['getConfigletsByNetElementId.do'] = (200, {'configletList': [{'name': 'ntp'}]})
+    routes['/inventory/devices'] = (200, [{'hostname': f'leaf{i}', 'systemMacAddress': f'mac{i}'} for i in range(5)])
+    return make_sdk(routes)
+
+
+def test_plan_arithmetic_and_budgets():
+    plan = CostPlan('op', [('/a', 10, 4, 0.5), ('/b', 1, 1, 2.0), ('/a', 2, 1, 0.5), ('/c', 0, 1, 9.0)], exact=False)
+    assert plan.requests == {'/a': 12, '/b': 1}
+    assert (plan.total_requests, plan.estimated_seconds) == (13, 4.5)
+    assert plan.check(max_requests=13, max_seconds=5) is plan
+    with pytest.raises(BudgetExceeded, match='more than 12 requests') as raised:
+        plan.check(max_requests=12)
+    assert raised.value.plan is plan
+    with pytest.raises(BudgetExceeded, match='longer than 4'):
+        plan.check(max_seconds=4)
+    assert plan.as_dict()['exact'] is False
+
+
+def test_regex_match_plan_matches_the_requests_sent(make_sdk):
+    sdk = tenant_sdk(make_sdk)
+    plan = sdk.plan_cost('get_configlets_by_regex_match', [r'1\.1\.1\.1', 'secret'])
+    sent = len(sdk.session.calls)
+    sdk.get_configlets_by_regex_match([r'1\.1\.1\.1', 'secret'])
+    assert plan.requests == families(sdk, sent) == {'/configlet/getConfiglets.do': 1,
+                                                    '/configlet/getConfigletById.do': 3,
+                                                    '/configlet/getAppliedDevices.do': 3}
+
+
+
+def test_search_duplicate_lines_plan_matches_the_requests_sent(make_sdk):
+    sdk = tenant_sdk(make_sdk)
+    plan = sdk.plan_cost('search_duplicate_lines', 'ntp', [])
+    sent = len(sdk.session.calls)
+    sdk.search_duplicate_lines('ntp', [])
+    assert plan.requests == families(sdk, sent) == {'/configlet/getConfiglets.do': 2,
+                                                    '/configlet/getConfigletById.do': 4,
+                                                    '/configlet/getAppliedDevices.do': 1}
+
+def test_device_configlets_plan_skips_journaled_devices(make_sdk, tmp_path):
+    sdk = tenant_sdk(make_sdk)
+    journal = str(tmp_path / 'job.jsonl')
+    sdk.run_fleet_job(lambda mac: [], ['mac0', 'mac1'], journal_path=journal)
+    plan = sdk.plan_cost('get_device_configlets', process_all=True, journal_path=journal)
+    sent = len(sdk.session.calls)
+    sdk.get_device_configlets(process_all=True, journal_path=journal)
+    assert plan.requests == families(sdk, sent) == {'/inventory/devices': 1, '/ztp/getConfigletsByNetElementId.do': 3}
+    assert sdk.plan_cost('get_device_configlets', 'mac0').total_requests == 1
+
+
+def test_observed_latencies_drive_the_estimate(make_sdk):
+    sdk = tenant_sdk(make_sdk)
+    planner = sdk.cost_planner(default_latency=1.0)
+    assert planner.plan('batfish_analyze_network_configs', [{}] * 10, max_workers=5).estimated_seconds == 2.0
+    sdk.latency_stats.record('/inventory/device/config?netElementId=mac1', 0.25)
+    assert planner.plan('batfish_analyze_network_configs', [{}] * 10, max_workers=5).estimated_seconds == 0.5
+    with pytest.raises(ValueError):
+        planner.plan('delete_everything')
+
+
+def test_over_budget_helpers_do_not_run(make_sdk):
+    sdk = tenant_sdk(make_sdk)
+    with pytest.raises(BudgetExceeded):
+        sdk.run_within_budget('get_configlets_by_regex_match', ['ntp'], max_requests=2)
+    assert sdk.session.urls('getConfigletById.do') == []
+    result = sdk.run_within_budget('get_configlets_by_regex_match', ['aaa'], terse=True, max_requests=10)
+    assert result == [{'configlet': 'aaa', 'matched': ['aaa'], 'assignment': ['leaf1']}]
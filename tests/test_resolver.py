@@ -0,0 +1,73 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from arista_cvaas_sdk import ConfigletResolver
+
+# Tenant -> DC1 -> Leafs (mac1, mac2); Tenant -> DC2 (mac3)
+PARENTS = {'root': None, 'dc1': 'root', 'leafs': 'dc1', 'dc2': 'root'}
+NAMES = {'root': 'Tenant', 'dc1': 'DC1', 'leafs': 'Leafs', 'dc2': 'DC2'}
+DEVICES = {'mac1': 'leafs', 'mac2': 'leafs', 'mac3': 'dc2'}
+CONTAINER_ASSIGNMENTS = {'root': ['aaa'], 'dc1': ['ntp-dc1', 'aaa'], 'leafs': ['leaf-base'], 'dc2': ['ntp-dc2']}
+DEVICE_ASSIGNMENTS = {'mac1': ['leaf1-intf', 'ntp-dc1'], 'mac9': ['orphan']}
+
+
+@pytest.fixture
+def resolver():
+    return ConfigletResolver().build(['aaa', 'ntp-dc1', 'ntp-dc2', 'leaf-base', 'leaf1-intf', 'unused'], PARENTS,
+                                     DEVICES, CONTAINER_ASSIGNMENTS, DEVICE_ASSIGNMENTS, container_names=NAMES,
+                                     hostnames={'mac1': 'leaf1'}, aliases={'SN2': 'mac2'})
+
+
+def test_effective_configlets_follow_inheritance(resolver):
+    assert resolver.effective_configlets('mac1') == ['aaa', 'ntp-dc1', 'leaf-base', 'leaf1-intf']
+    assert resolver.effective_configlets('SN2') == ['aaa', 'ntp-dc1', 'leaf-base']
+    assert resolver.effective_configlets('mac3') == ['aaa', 'ntp-dc2']
+    assert resolver.effective_configlets('mac9') == ['orphan']
+    assert resolver.explain('leaf1') == [('aaa', 'Tenant'), ('ntp-dc1', 'DC1'), ('leaf-base', 'Leafs'),
+                                         ('leaf1-intf', 'device')]
+    with pytest.raises(ValueError):
+        resolver.effective_configlets('unknown')
+
+
+def test_affected_devices_use_the_transpose(resolver):
+    assert resolver.affected_devices('aaa') == ['mac1', 'mac2', 'mac3']
+    assert resolver.affected_devices('ntp-dc1', hostnames=True) == ['leaf1', 'mac2']
+    assert resolver.affected_devices('unused') == resolver.affected_devices('missing') == []
+    assert resolver.device_counts() == {'aaa': 3, 'ntp-dc1': 2, 'ntp-dc2': 1, 'leaf-base': 2, 'leaf1-intf': 1,
+                                        'unused': 0, 'orphan': 1}
+    indptr, indices = resolver.matrix()
+    for row, mac in enumerate(resolver.devices):
+        assert [resolver.configlets[c] for c in indices[indptr[row]:indptr[row + 1]]] == \
+            resolver.effective_configlets(mac)
+
+
+def test_static_resolvers_cannot_refresh(resolver):
+    with pytest.raises(ValueError):
+        resolver.refresh()
+
+
+def test_refresh_fetches_only_assigned_configlets(make_sdk):
+    configlets = [{'key': 'k1', 'name': 'aaa', 'containerCount': 1, 'netElementCount': 0},
+                  {'key': 'k2', 'name': 'leaf1-intf', 'containerCount': 0, 'netElementCount': 1},
+                  {'key': 'k3', 'name': 'unused', 'containerCount': 0, 'netElementCount': 0}]
+    topology = {'list': {'key': 'root', 'name': 'Tenant', 'childContainerList': [
+        {'key': 'leafs', 'name': 'Leafs', 'childContainerList': [],
+         'childNetElementList': [{'systemMacAddress': 'mac1'}, {'systemMacAddress': 'mac2'}]}]}}
+
+    def applied(url, kwargs):
+        name = parse_qs(urlparse(url).query)['configletName'][0]
+        if 'getAppliedContainers' in url:
+            return 200, {'data': [{'containerName': 'Tenant'}], 'total': 1}
+        assert name == 'leaf1-intf'
+        return 200, {'data': [{'hostName': 'leaf1.example'}], 'total': 1}
+
+    sdk = make_sdk({'getConfiglets.do': (200, {'data': configlets, 'total': 3}), 'filterTopology.do': (200, topology),
+                    '/inventory/devices': (200, [{'systemMacAddress': 'mac1', 'hostname': 'leaf1', 'fqdn': 'leaf1.example'},
+                                                 {'systemMacAddress': 'mac2', 'hostname': 'leaf2'}]),
+                    'getApplied': applied})
+    resolver = sdk.configlet_resolver()
+    assert resolver.effective_configlets('leaf1') == ['aaa', 'leaf1-intf']
+    assert resolver.affected_devices('aaa', hostnames=True) == ['leaf1', 'leaf2']
+    assert len(sdk.session.urls('getApplied')) == 2
+    assert sdk.configlet_resolver() is resolver and len(sdk.session.urls('getApplied')) == 2
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+import requests
+
+from arista_cvaas_sdk.responses import iter_json_array
+
+UNAUTHENTICATED = {'code': 24, 'message': 'Status unauthenticated'}
+
+
+@pytest.mark.parametrize('status, body, data, error', [
+    (200, {'data': [1]}, {'data': [1]}, None),
+    (200, [1, 2], [1, 2], None),
+    (200, b'', None, None),
+    (200, {'errorCode': '1', 'errorMessage': 'nope'}, {'errorCode': '1', 'errorMessage': 'nope'},
+     {'errorCode': '1', 'errorMessage': 'nope'}),
+    (401, UNAUTHENTICATED, UNAUTHENTICATED, UNAUTHENTICATED),
+    (500, b'', None, {'error': 'HTTP 500', 'original_response': ''}),
+    (502, ['bad'], ['bad'], {'error': 'HTTP 502', 'original_response': ['bad']}),
+    (200, b'<html>', None, {'error': 'Invalid JSON response', 'original_response': '<html>'}),
+])
+def test_responses_are_classified(make_sdk, status, body, data, error):
+    sdk = make_sdk({'/endpoint': (status, body)})
+    result = sdk._request_json('GET', '/endpoint')
+    assert (result.status_code, result.data, result.error) == (status, data, error)
+
+
+def test_helpers_return_the_error_payload(make_sdk):
+    sdk = make_sdk({'getConfigletHistory.do': (200, {'errorCode': '132801', 'errorMessage': 'Not found'})})
+    assert sdk.get_configlet_history_page('c1') == {'errorCode': '132801', 'errorMessage': 'Not found'}
+
+
+def chunked(body, size):
+    data = json.dumps(body, ensure_ascii=False).encode()
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+STREAMED = {'total': 4, 'data': [{'name': 'é-configlet', 'config': 'x' * 100}, 12345678901234567890, -1.5e3,
+                                  [None, True, {'nested': ['"quoted"']}]]}
+
+
+@pytest.mark.parametrize('size', [1, 3, 7, 64, 100000])
+def test_streamed_items_survive_any_chunk_boundary(size):
+    assert list(iter_json_array(chunked(STREAMED, size))) == STREAMED['data']
+    assert list(iter_json_array(chunked(STREAMED['data'], size), key=None)) == STREAMED['data']
+
+
+def test_streaming_is_lazy():
+    def chunks():
+        yield b'{"data": [1, '
+        yield b'2, '
+        raise AssertionError("read past the requested items")
+
+    items = iter_json_array(chunks())
+    assert next(items) == 1
+
+
+@pytest.mark.parametrize('body, message', [
+    (b'{"errorCode": "1", "errorMessage": "nope"}', "no 'data' array"),
+    (b'[1, 2]', "Expected '{'"),
+    (b'{"data": [1, 2', 'Unexpected end'),
+    (b'{"data": {"a": 1}}', r"Expected '\['"),
+])
+def test_unexpected_shapes_raise(body, message):
+    with pytest.raises(ValueError, match=message):
+        list(iter_json_array([body]))
+
+
+def test_client_streams_list_responses(make_sdk):
+    sdk = make_sdk({'getConfiglets.do': (200, STREAMED), '/inventory/devices': (500, b'')})
+    assert list(sdk.iter_configlets(chunk_size=5)) == STREAMED['data']
+    with pytest.raises(requests.HTTPError):
+        list(sdk.iter_inventory_devices())
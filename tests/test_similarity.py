@@ -0,0 +1,98 @@
+import itertools
+import random
+
+import pytest
+
+from arista_cvaas_sdk import ConfigletSimilarity
+from arista_cvaas_sdk.similarity import normalized_lines, optimal_bands
+from conftest import FakeConfiglets
+
+
+def interfaces(count, offset=0, description='host'):
+    return '\n'.join(f'interface Ethernet{i}\n   description {description}{i}\n   switchport access vlan {i % 7}'
+                     for i in range(offset, offset + count))
+
+
+def shingles(config, size=2):
+    lines = normalized_lines(config)
+    return {'\n'.join(lines[i:i + size]) for i in range(len(lines) - size + 1)}
+
+
+def test_normalization_and_band_choice():
+    assert normalized_lines('! comment\ninterface  Ethernet1\n\n   description   x  \n') == \
+        ['interface Ethernet1', 'description x']
+    for threshold in (0.5, 0.8, 0.9):
+        bands = optimal_bands(128, threshold)
+        assert 128 % bands == 0 and (1 / bands) ** (bands / 128) <= threshold
+
+
+def test_estimates_track_the_true_jaccard():
+    engine = ConfigletSimilarity(num_perm=256)
+    base = interfaces(40)
+    variant = base.replace('description host3\n', 'description uplink3\n')
+    expected = len(shingles(base) & shingles(variant)) / len(shingles(base) | shingles(variant))
+    estimate = engine.jaccard(engine.signature(base)[1], engine.signature(variant)[1])
+    assert abs(estimate - expected) < 0.1
+    assert engine.jaccard(engine.signature(base)[1], engine.signature(interfaces(40, offset=100))[1]) < 0.1
+
+
+def test_pairs_match_a_brute_force_scan():
+    rng = random.Random(3)
+    engine = ConfigletSimilarity()
+    configs = {}
+    for family in range(6):
+        base = interfaces(30, offset=family * 100)
+        for member in range(4):
+            lines = base.splitlines()
+            for _ in range(rng.randrange(3)):
+                lines[rng.randrange(len(lines))] = f'   description changed{rng.random()}'
+            configs[f'c{family}-{member}'] = '\n'.join(lines)
+    configs['copy'] = '! same body\n' + configs['c0-0'] + '\n\n'
+    for key, config in configs.items():
+        engine.add(key, config, name=key.upper())
+
+    signatures = {key: engine.signature(config)[1] for key, config in configs.items()}
+    brute = {(a, b) for a, b in itertools.combinations(configs, 2)
+             if engine.jaccard(signatures[a], signatures[b]) >= 0.8}
+    found = engine.pairs(0.8)
+    assert {tuple(sorted((a, b))) for a, b, _ in found} == {tuple(sorted(pair)) for pair in brute}
+    assert found[0][2] == 1.0 and {found[0][0], found[0][1]} == {'c0-0', 'copy'}
+    assert all(cluster[0][:3] == key[:3] for cluster in engine.clusters(0.8) for key in cluster if key != 'copy')
+
+
+def test_signatures_are_cached_and_persisted(tmp_path):
+    engine = ConfigletSimilarity(num_perm=64)
+    engine.add_many([{'key': 'a', 'name': 'A', 'config': interfaces(5)}, {'key': 'b', 'config': interfaces(5)}])
+    assert len(engine.signatures) == 1
+    assert engine.pairs() == [('a', 'b', 1.0)]
+    engine.remove('b')
+    assert engine.pairs() == [] and engine.names == {'a': 'A'}
+
+    path = str(tmp_path / 'signatures.npz')
+    engine.save(path)
+    restored = ConfigletSimilarity(num_perm=64)
+    restored.load(path)
+    digest, signature = engine.signature(interfaces(5))
+    assert (restored.signatures[digest] == signature).all()
+    with pytest.raises(ValueError):
+        ConfigletSimilarity(num_perm=32).load(path)
+    with pytest.raises(ValueError):
+        engine.pairs(bands=5)
+
+
+def test_client_reports_names(make_sdk):
+    body = interfaces(10)
+    sdk = make_sdk({'getConfiglets.do': (200, {'data': [
+        {'key': 'c1', 'name': 'leaf1-intf', 'config': body}, {'key': 'c2', 'name': 'leaf2-intf', 'config': body + '\n'},
+        {'key': 'c3', 'name': 'ntp', 'config': 'ntp server 1.1.1.1'}], 'total': 3})})
+    assert sdk.find_similar_configlets() == {'pairs': [('leaf1-intf', 'leaf2-intf', 1.0)],
+                                             'clusters': [['leaf1-intf', 'leaf2-intf']]}
+
+
+def test_client_compares_configlets_from_every_listing_page(make_sdk):
+    body = interfaces(10)
+    tenant = FakeConfiglets({'leaf1-intf': body, 'ntp': 'ntp server 1.1.1.1', 'dns': 'ip name-server 1.1.1.1',
+                             'aaa': 'aaa root secret x', 'leaf2-intf': body + '\n'})
+    sdk = make_sdk(tenant.routes())
+    assert sdk.find_similar_configlets(page_size=2)['clusters'] == [['leaf1-intf', 'leaf2-intf']]
+    assert len(sdk.session.urls('getConfiglets.do')) == 3
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from arista_cvaas_sdk import TempActionQueue
+from arista_cvaas_sdk.staging import configlet_assignment_action, container_add_action
+
+
+class FakeTempActions:
+    """Records the actions sent to addTempAction.do and serves them back from getAllTempActions.do."""
+
+    def __init__(self, held=(), fail=False):
+        self.held = list(held)
+        self.sent = []
+        self.fail = fail
+
+    def add(self, url, kwargs):
+        batch = json.loads(kwargs['data'])['data']
+        self.sent.append(batch)
+        if self.fail:
+            return 200, {'errorCode': '1', 'errorMessage': 'rejected'}
+        self.held.extend(batch)
+        return 200, {'data': 'success'}
+
+    def routes(self):
+        return {'addTempAction.do': self.add,
+                'getAllTempActions.do': lambda url, kwargs: (200, {'data': self.held, 'total': len(self.held)})}
+
+
+def test_configlet_intents_merge_per_target(make_sdk):
+    queue = make_sdk({}).temp_action_queue()
+    queue.assign_configlets_to_device('mac1', '10.0.0.1', ['c1', 'c2'])
+    queue.assign_configlets_to_device('mac1', '10.0.0.1', ['c3'], ignore_list=['c1'])
+    queue.assign_configlets_to_container('dc1', ['c1'])
+    assert len(queue) == 2
+    device, container = queue.pending()
+    assert (device['configletList'], device['ignoreConfigletList']) == (['c2', 'c3'], ['c1'])
+    assert (container['toId'], container['configletList']) == ('dc1', ['c1'])
+
+    # The last intent for a configlet wins.
+    queue.assign_configlets_to_container('dc1', [], ignore_list=['c1'])
+    container = queue.pending()[1]
+    assert (container['configletList'], container['ignoreConfigletList']) == ([], ['c1'])
+    assert queue.merged == 2
+
+
+def test_names_stay_aligned_with_ids(make_sdk):
+    queue = make_sdk({}).temp_action_queue()
+    first = configlet_assignment_action('mac1', 'netelement', ['c1', 'c2'])
+    first['configletNamesList'] = ['one', 'two']
+    second = configlet_assignment_action('mac1', 'netelement', [], ignore_list=['c1'])
+    second['ignoreConfigletNamesList'] = ['one']
+    queue.stage(first).stage(second)
+    action = queue.pending()[0]
+    assert (action['configletList'], action['configletNamesList']) == (['c2'], ['two'])
+    assert (action['ignoreConfigletList'], action['ignoreConfigletNamesList']) == (['c1'], ['one'])
+
+
+def test_images_replace_and_adds_cancel_deletes(make_sdk):
+    queue = make_sdk({}).temp_action_queue()
+    queue.assign_image_to_device('mac1', {'key': 'img1', 'name': 'EOS-4.30'})
+    queue.stage(container_add_action('DC9', 'New_Container_1'))
+    queue.assign_image_to_device('mac1', {'key': 'img2', 'name': 'EOS-4.31'})
+    queue.stage(dict(container_add_action('DC9', 'New_Container_1'), action='delete'))
+    assert [action['nodeId'] for action in queue.pending()] == ['img2']
+    assert (queue.staged, queue.merged, queue.cancelled) == (4, 1, 2)
+
+
+def test_flush_batches_skips_held_actions_and_keeps_failures(make_sdk):
+    held = configlet_assignment_action('mac0', 'netelement', ['c1'])
+    tenant = FakeTempActions(held=[held])
+    queue = make_sdk(tenant.routes()).temp_action_queue(batch_size=2)
+    queue.stage(held)
+    for index in range(1, 6):
+        queue.assign_configlets_to_device(f'mac{index}', '10.0.0.1', ['c1'])
+
+    planned = queue.flush(dry_run=True)
+    assert (len(planned['actions']), planned['skipped_existing'], planned['requests']) == (5, 1, 0)
+    assert tenant.sent == []
+
+    summary = queue.flush()
+    assert summary['requests'] == 3 and [len(batch) for batch in tenant.sent] == [2, 2, 1]
+    assert [action['toId'] for batch in tenant.sent for action in batch] == [f'mac{i}' for i in range(1, 6)]
+    assert len(queue) == 0
+
+    tenant.fail = True
+    queue.assign_configlets_to_device('mac7', '10.0.0.1', ['c2'])
+    assert 'error' in queue.flush(skip_existing=False)['results'][0]
+    assert len(queue) == 1
+
+
+def test_batch_size_must_be_positive(make_sdk):
+    with pytest.raises(ValueError):
+        TempActionQueue(make_sdk({}), batch_size=0)
@@ -0,0 +1,121 @@
+import time
+
+import pytest
+
+from arista_cvaas_sdk import AristaCVAAS, ConfigletResolver, LocalResourceStream, ResourceSubscriber
+from arista_cvaas_sdk.subscriptions import device_record
+
+INVENTORY = ResourceSubscriber.DEFAULT_STREAMS['inventory']
+CONFIGLET = ResourceSubscriber.DEFAULT_STREAMS['configlet']
+ASSIGNMENT = ResourceSubscriber.DEFAULT_STREAMS['configlet_assignment']
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def devices():
+    return [{'serialNumber': 'SN1', 'hostname': 'leaf1', 'version': '4.30.1F', 'systemMacAddress': 'mac1'},
+            {'serialNumber': 'SN2', 'hostname': 'leaf2', 'version': '4.30.1F', 'systemMacAddress': 'mac2'}]
+
+
+def test_device_record_maps_resource_fields():
+    value = {'key': {'deviceId': 'SN1'}, 'hostname': 'leaf1', 'softwareVersion': '4.31.1F', 'unknown': 1}
+    assert device_record(value) == {'serialNumber': 'SN1', 'hostname': 'leaf1', 'version': '4.31.1F'}
+
+
+def test_inventory_deltas_are_applied_and_a_dropped_stream_resyncs(devices):
+    with LocalResourceStream(routes={'/cvpservice/inventory/devices': lambda: devices}) as server:
+        sdk = AristaCVAAS(server.url, 'token', cache=True)
+        snapshot = sdk.inventory_snapshot()
+        subscriber = sdk.subscribe(['inventory'], reconnect_delay=0.01)
+        try:
+            assert server.wait_for_subscribers(INVENTORY)
+            server.publish(INVENTORY, {'key': {'deviceId': 'SN2'}, 'softwareVersion': '4.31.0F'},
+                           {'key': {'deviceId': 'SN3'}, 'hostname': 'leaf3', 'softwareVersion': '4.31.0F'})
+            wait_until(lambda: len(snapshot.by_version('4.31.0F')) == 2)
+            assert list(snapshot.by_hostname('leaf2')['version']) == ['4.31.0F']
+
+            server.publish(INVENTORY, {'key': {'deviceId': 'SN1'}}, type='DELETED')
+            wait_until(lambda: snapshot.by_serial('SN1').empty)
+            assert sorted(snapshot.df['serialNumber']) == ['SN2', 'SN3']
+
+            # Changes made while the stream is down are picked up by the resync's full fetch.
+            devices.append({'serialNumber': 'SN9', 'hostname': 'leaf9', 'version': '4.32.0F'})
+            server.disconnect(INVENTORY)
+            assert server.wait_for_subscribers(INVENTORY, count=2)
+            wait_until(lambda: not snapshot.by_serial('SN9').empty)
+            assert sorted(snapshot.df['serialNumber']) == ['SN1', 'SN2', 'SN9']
+            assert subscriber.stats['inventory']['resyncs'] == 1
+        finally:
+            subscriber.stop()
+
+
+def test_configlet_changes_invalidate_cached_listings():
+    listings = []
+
+    def configlets():
+        listings.append(1)
+        return {'data': [], 'total': 0}
+
+    with LocalResourceStream(routes={'/cvpservice/configlet/getConfiglets.do': configlets}) as server:
+        sdk = AristaCVAAS(server.url, 'token', cache=True)
+        sdk.get_configlets()
+        sdk.get_configlets()
+        assert len(listings) == 1
+        batches = []
+        subscriber = sdk.subscribe(['configlet'])
+        subscriber.on('configlet', batches.append)
+        try:
+            assert server.wait_for_subscribers(CONFIGLET)
+            server.publish(CONFIGLET, {'key': {'configletId': 'c1'}, 'body': 'ntp server 1.1.1.1'})
+            wait_until(lambda: batches)
+            sdk.get_configlets()
+            assert len(listings) == 2
+            assert batches[0][0].key == {'configletId': 'c1'}
+        finally:
+            subscriber.stop()
+
+
+def test_assignment_changes_rebuild_the_applied_container_map():
+    applied = [{'containerName': 'Tenant'}]
+    routes = {'/cvpservice/configlet/getConfiglets.do': {'data': [{'name': 'ntp', 'key': 'c1'}], 'total': 1},
+              '/cvpservice/configlet/getAppliedContainers.do': lambda: {'data': list(applied), 'total': len(applied)}}
+    with LocalResourceStream(routes=routes) as server:
+        sdk = AristaCVAAS(server.url, 'token')
+        assert sdk.get_applied_configlets_per_container() == [['Tenant', ['ntp']]]
+        sdk._configlet_resolver = ConfigletResolver()
+        batches = []
+        subscriber = sdk.subscribe(['configlet_assignment'])
+        subscriber.on('configlet_assignment', batches.append)
+        try:
+            assert server.wait_for_subscribers(ASSIGNMENT)
+            applied.append({'containerName': 'Spines'})
+            server.publish(ASSIGNMENT, {'key': {'configletAssignmentId': 'a1'}, 'configletIds': ['c1']})
+            wait_until(lambda: batches)
+            assert sdk.get_applied_configlets_per_container() == [['Tenant', ['ntp']], ['Spines', ['ntp']]]
+            assert sdk._configlet_resolver.stale
+        finally:
+            subscriber.stop()
+
+
+def test_stream_errors_trigger_a_resync():
+    with LocalResourceStream() as server:
+        sdk = AristaCVAAS(server.url, 'token')
+        resyncs = []
+        subscriber = ResourceSubscriber(sdk, streams=['tag'], reconnect_delay=0.01)
+        subscriber.on('tag', lambda batch: None, resync=lambda: resyncs.append(1))
+        subscriber.start()
+        try:
+            path = ResourceSubscriber.DEFAULT_STREAMS['tag']
+            assert server.wait_for_subscribers(path)
+            server.publish_error(path)
+            assert server.wait_for_subscribers(path, count=2)
+            wait_until(lambda: resyncs)
+        finally:
+            subscriber.stop()
@@ -0,0 +1,59 @@
+from arista_cvaas_sdk import ConfigletDirectorySync, sync
+from conftest import FakeConfiglets
+
+
+def write(directory, files):
+    for name, body in files.items():
+        (directory / name).write_text(body, encoding='utf-8')
+
+
+def test_normalization_ignores_formatting():
+    assert sync.config_hash('a  \r\nb\r\n\n\n') == sync.config_hash('a\nb')
+    assert sync.config_hash('a\nb') != sync.config_hash('a\n b')
+
+
+def test_only_differing_configlets_are_written(make_sdk, tmp_path):
+    tenant = FakeConfiglets({'ntp': 'ntp server 1.1.1.1\n', 'dns': 'ip name-server 8.8.8.8', 'other': 'x'})
+    sdk = make_sdk(tenant.routes())
+    write(tmp_path, {'ntp.cfg': 'ntp server 1.1.1.1   \r\n\r\n', 'dns.cfg': 'ip name-server 1.1.1.1',
+                     'snmp.cfg': 'snmp-server community x ro', 'notes.txt': 'ignored', '.hidden.cfg': 'ignored'})
+    result = sdk.sync_configlet_directory(str(tmp_path), suffix='.cfg')
+    assert (result['create'], result['update'], result['delete'], result['unchanged']) == (['snmp'], ['dns'], [], 1)
+    assert [row['status'] for row in result['results']] == ['created', 'updated']
+    assert tenant.by_name('dns')['config'] == 'ip name-server 1.1.1.1'
+    assert tenant.by_name('ntp')['config'] == 'ntp server 1.1.1.1\n'
+    assert {c['name'] for c in tenant.configlets.values()} == {'ntp', 'dns', 'other', 'snmp'}
+
+    again = sdk.sync_configlet_directory(str(tmp_path), suffix='.cfg')
+    assert (again['create'], again['update'], again['unchanged']) == ([], [], 3)
+
+
+def test_dry_run_and_scoped_deletes(make_sdk, tmp_path):
+    tenant = FakeConfiglets({'dc1-ntp': 'x', 'dc1-old': 'y', 'dc2-ntp': 'z'})
+    sdk = make_sdk(tenant.routes())
+    write(tmp_path, {'dc1-ntp': 'x2'})
+    syncer = ConfigletDirectorySync(sdk, str(tmp_path), name_regex='^dc1-', delete=True)
+    planned = syncer.sync(dry_run=True)
+    assert (planned['update'], planned['delete'], planned['deleted']) == (['dc1-ntp'], ['dc1-old'], None)
+    assert [row['status'] for row in planned['results']] == ['planned']
+    assert tenant.by_name('dc1-ntp')['config'] == 'x'
+
+    syncer.sync()
+    assert sorted(c['name'] for c in tenant.configlets.values()) == ['dc1-ntp', 'dc2-ntp']
+    assert tenant.by_name('dc1-ntp')['config'] == 'x2'
+
+
+def test_unchanged_remote_versions_are_not_rehashed(make_sdk, tmp_path, monkeypatch):
+    tenant = FakeConfiglets({'a': 'one', 'b': 'two'})
+    sdk = make_sdk(tenant.routes())
+    write(tmp_path, {'a': 'one', 'b': 'two'})
+    index_path = str(tmp_path.parent / 'index.json')
+    ConfigletDirectorySync(sdk, str(tmp_path), index_path=index_path).sync()
+
+    hashed = []
+    original = sync.config_hash
+    monkeypatch.setattr(sync, 'config_hash', lambda config: hashed.append(config) or original(config))
+    tenant.by_name('b').update(config='changed', dateTimeInLongFormat=5000)
+    result = ConfigletDirectorySync(sdk, str(tmp_path), index_path=index_path).sync()
+    assert result['update'] == ['b']
+    assert sorted(hashed) == ['changed', 'one', 'two']  # both local files, but only the changed remote body
@@ -0,0 +1,121 @@
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from arista_cvaas_sdk import TaskWatcher
+from arista_cvaas_sdk.tasks import MISSING_STATUS, _WatchedTask, task_ids_from_response
+
+
+class FakeTasks:
+    """Task states served by getTaskById.do and getTasks.do; each task advances one step per fetch."""
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.fetches = {task_id: 0 for task_id in steps}
+
+    def task(self, task_id):
+        steps = self.steps[task_id]
+        status = steps[min(self.fetches[task_id], len(steps) - 1)]
+        self.fetches[task_id] += 1
+        return {'workOrderId': task_id, 'workOrderUserDefinedStatus': status}
+
+    def by_id(self, url, kwargs):
+        task_id = parse_qs(urlparse(url).query)['taskId'][0]
+        if task_id not in self.steps:
+            return 200, {'errorCode': '122401', 'errorMessage': 'Task not found'}
+        return 200, self.task(task_id)
+
+    def listing(self, url, kwargs):
+        return 200, {'data': [self.task(task_id) for task_id in self.steps], 'total': len(self.steps)}
+
+
+def routes(tasks):
+    return {'getTaskById.do': tasks.by_id, 'getTasks.do': tasks.listing}
+
+
+def test_task_ids_from_response():
+    assert task_ids_from_response({'data': {'status': 'success', 'taskIds': [12, '13']}}) == ['12', '13']
+    assert task_ids_from_response({'errorCode': '1'}) == []
+    assert task_ids_from_response(None) == []
+
+
+def test_few_due_tasks_are_fetched_by_id(make_sdk):
+    tasks = FakeTasks({'1': ['Pending', 'Completed'], '2': ['Pending', 'In-Progress', 'Failed']})
+    sdk = make_sdk(routes(tasks))
+    watcher = TaskWatcher(sdk, min_interval=0.01, max_interval=0.02)
+    events = []
+    watcher.add_callback(events.append)
+    try:
+        watcher.watch(['1', '2'])
+        final = watcher.wait(timeout=5)
+    finally:
+        watcher.stop()
+    assert {task_id: task['workOrderUserDefinedStatus'] for task_id, task in final.items()} == \
+        {'1': 'Completed', '2': 'Failed'}
+    assert [(e.task_id, e.previous_status, e.status) for e in events if e.task_id == '2'] == \
+        [('2', None, 'Pending'), ('2', 'Pending', 'In-Progress'), ('2', 'In-Progress', 'Failed')]
+    assert sdk.session.urls('getTasks.do') == []
+
+
+def test_many_due_tasks_share_one_listing(make_sdk):
+    tasks = FakeTasks({str(i): ['Pending', 'Completed'] for i in range(6)})
+    sdk = make_sdk(routes(tasks))
+    watcher = TaskWatcher(sdk, min_interval=0.01, max_individual=2)
+    try:
+        watcher.watch([str(i) for i in range(6)])
+        watcher.wait(timeout=5)
+    finally:
+        watcher.stop()
+    assert sdk.session.urls('getTaskById.do') == []
+    assert len(sdk.session.urls('getTasks.do')) == 2
+
+
+def test_only_due_tasks_advance_their_schedule(make_sdk):
+    tasks = FakeTasks({'1': ['Pending'], '2': ['Pending']})
+    watcher = TaskWatcher(make_sdk(routes(tasks)), min_interval=1, backoff=2, max_interval=100)
+    now = time.monotonic()
+    due, later = _WatchedTask(None, now), _WatchedTask(None, now)
+    later.next_poll = now + 50
+    watcher._tasks = {'1': due, '2': later}
+    for _ in range(3):
+        watcher._poll({'1': due})
+    assert due.polls == 2 and due.next_poll >= now + 4  # one state change, then two quiet polls
+    assert later.polls == 0 and later.next_poll == now + 50
+    assert tasks.fetches == {'1': 3, '2': 0}
+
+
+def test_task_missing_for_several_polls_is_terminal(make_sdk):
+    sdk = make_sdk(routes(FakeTasks({})))
+    watcher = TaskWatcher(sdk, min_interval=0.01, max_interval=0.01, missing_polls=3)
+    events = []
+    watcher.add_callback(events.append)
+    try:
+        future = watcher.watch(['404'])['404']
+        with pytest.raises(LookupError):
+            future.result(timeout=5)
+    finally:
+        watcher.stop()
+    assert [(e.task_id, e.status) for e in events] == [('404', MISSING_STATUS)]
+    assert len(sdk.session.urls('getTaskById.do')) == 3
+
+
+def test_failed_polls_do_not_count_as_missing(make_sdk):
+    sdk = make_sdk({'getTaskById.do': (500, b'')})
+    watcher = TaskWatcher(sdk, missing_polls=2)
+    watched = _WatchedTask(None, time.monotonic())
+    watcher._tasks = {'7': watched}
+    for _ in range(3):
+        watcher._poll({'7': watched})
+    assert watched.missing == 0 and watcher.polls == 3
+
+
+def test_timeout_fails_the_future(make_sdk):
+    sdk = make_sdk(routes(FakeTasks({'1': ['Pending']})))
+    watcher = TaskWatcher(sdk, min_interval=0.01, max_interval=0.01, timeout=0.05)
+    try:
+        future = watcher.watch(['1'])['1']
+        with pytest.raises(TimeoutError):
+            future.result(timeout=5)
+    finally:
+        watcher.stop()
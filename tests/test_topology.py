@@ -0,0 +1,75 @@
+import json
+
+import pandas as pd
+import pytest
+
+from arista_cvaas_sdk import TopologyImport
+
+RACKS = pd.DataFrame({'region': ['EMEA', 'EMEA', 'EMEA', 'AMER'], 'site': ['London', 'London', 'Paris', 'NYC'],
+                      'rack': ['Rack1', 'Rack2', 'Rack3', '']})
+
+
+def check_parents_precede_children(actions, known=('root',)):
+    known = set(known)
+    for action in actions:
+        assert action['toId'] in known
+        known.add(action['nodeId'])
+
+
+def test_shared_prefixes_become_one_container():
+    topology = TopologyImport(RACKS)
+    assert len(topology) == 8
+    actions = list(topology.iter_actions())
+    assert [action['nodeName'] for action in actions] == ['EMEA', 'AMER', 'London', 'Paris', 'NYC',
+                                                          'Rack1', 'Rack2', 'Rack3']
+    check_parents_precede_children(actions)
+    ids = topology.node_ids()
+    assert ids['EMEA/London/Rack2'].startswith('New_Container_') and len(ids['EMEA/London/Rack2']) == 27
+    london = next(action for action in actions if action['nodeName'] == 'London')
+    assert (london['toId'], london['toName']) == (ids['EMEA'], 'EMEA')
+    assert topology.ascii_tree().splitlines() == ['+-AMER', '| +-NYC', '+-EMEA', '| +-London', '| | +-Rack1',
+                                                  '| | +-Rack2', '| +-Paris', '| | +-Rack3']
+
+
+def test_path_column_csv_and_existing_containers(tmp_path):
+    path = tmp_path / 'racks.csv'
+    path.write_text('path,owner\n/EMEA/London/Rack1,a\nEMEA/London/Rack2/,b\n')
+    topology = TopologyImport(str(path), sep='/', parent_id='dc', parent_name='DC', existing={'London': 'key_london'})
+    actions = list(topology.iter_actions())
+    assert [(action['nodeName'], action['toId']) for action in actions] == [
+        ('EMEA', 'dc'), ('Rack1', 'key_london'), ('Rack2', 'key_london')]
+    assert actions[0]['toName'] == 'DC'
+    assert topology.node_ids()['EMEA/London'] == 'key_london'
+
+
+@pytest.mark.parametrize('frame, kwargs, message', [
+    (pd.DataFrame({'a': ['X', 'Y'], 'b': ['Shared', 'Shared']}), {}, 'more than one path'),
+    (pd.DataFrame({'a': ['', 'Y'], 'b': ['Z', 'W']}), {}, 'empty level'),
+    (RACKS, {'columns': ['region', 'pod']}, 'Missing hierarchy columns'),
+    (RACKS, {'columns': ['region', 'site'], 'sep': '/'}, 'exactly one path column'),
+])
+def test_invalid_tables_are_rejected(frame, kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        TopologyImport(frame, **kwargs)
+
+
+def test_batches_and_submission(make_sdk):
+    sent = []
+
+    def add(url, kwargs):
+        sent.append(json.loads(kwargs['data'])['data'])
+        return (200, {'errorCode': '1', 'errorMessage': 'rejected'}) if len(sent) == 2 else (200, {'data': 'success'})
+
+    sdk = make_sdk({'/inventory/containers': (200, [{'Key': 'key_amer', 'Name': 'AMER'}]), 'addTempAction.do': add})
+    planned = sdk.import_topology(RACKS, batch_size=3, dry_run=True)
+    assert (planned['containers'], planned['existing']) == (7, 1)
+    assert [len(payload['data']) for payload in planned['payloads']] == [3, 3, 1]
+    check_parents_precede_children([action for payload in planned['payloads'] for action in payload['data']],
+                                   known=('root', 'key_amer'))
+    assert sent == []
+
+    summary = sdk.import_topology(RACKS, batch_size=3)
+    assert (summary['requests'], summary['containers'], summary['existing']) == (2, 3, 1)
+    assert 'error' in summary['results'][-1]
+    with pytest.raises(ValueError):
+        next(TopologyImport(RACKS).iter_batches(0))
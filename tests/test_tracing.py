@@ -0,0 +1,87 @@
+import pytest
+
+from arista_cvaas_sdk import InMemorySpanExporter, Tracer
+from arista_cvaas_sdk.tracing import current_span
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+def by_name(spans):
+    return {span.name: span for span in spans}
+
+
+def test_spans_nest_and_record_exceptions(exporter):
+    tracer = Tracer(exporter)
+    with tracer.span('outer', {'a': 1}) as outer:
+        assert current_span() is outer
+        with pytest.raises(KeyError):
+            with tracer.span('inner'):
+                raise KeyError('x')
+    assert current_span() is None
+    inner, finished_outer = exporter.get_finished_spans()
+    assert finished_outer is outer and inner.parent_id == outer.span_id and inner.trace_id == outer.trace_id
+    assert inner.status == 'error' and inner.events[0]['exception.type'] == 'KeyError'
+    assert outer.status == 'unset' and outer.attributes == {'a': 1} and outer.duration >= inner.duration
+    exporter.clear()
+    assert exporter.get_finished_spans() == []
+
+
+def test_helper_spans_parent_their_requests_across_threads(make_sdk, exporter):
+    sdk = make_sdk({'getAppliedContainers.do': (200, {'data': [{'containerName': 'DC1'}], 'total': 1}),
+                    'getConfigletById.do': (404, b'')}, tracer=Tracer(exporter))
+    sdk.get_configlet_applied_containers(['aaa', 'ntp', 'dns'], max_workers=3)
+    spans = exporter.get_finished_spans()
+    helper = by_name(spans)['get_configlet_applied_containers']
+    requests = [span for span in spans if span.name == 'HTTP GET']
+    assert len(requests) == 3 and all(span.parent_id == helper.span_id for span in requests)
+    assert requests[0].kind == 'client' and requests[0].attributes['http.response.status_code'] == 200
+    assert requests[0].attributes['url.path'] == '/configlet/getAppliedContainers.do'
+    assert helper.attributes == {'code.function': 'get_configlet_applied_containers'} and helper.status == 'unset'
+
+    exporter.clear()
+    sdk.get_configlet_by_id('missing')
+    request, helper = exporter.get_finished_spans()
+    assert (request.status, helper.status) == ('error', 'error')
+    assert request.attributes['http.response.status_code'] == 404
+
+
+def test_nested_helpers_and_compute_spans(make_sdk, exporter):
+    sdk = make_sdk({'getConfiglets.do': (200, {'data': [{'name': 'ntp', 'key': 'c1'}], 'total': 1}),
+                    'getConfigletById.do': (200, {'name': 'ntp', 'key': 'c1', 'config': 'ntp server 1.1.1.1'}),
+                    'getAppliedDevices.do': (200, {'data': [], 'total': 0})}, tracer=Tracer(exporter))
+    sdk.get_configlets_by_regex_match(['ntp'])
+    spans = exporter.get_finished_spans()
+    root = by_name(spans)['get_configlets_by_regex_match']
+    children = {span.name for span in spans if span.parent_id == root.span_id}
+    assert {'get_configlet_names_ids', 'get_configlet_by_id', 'regex_scan', 'get_configlet_applied_devices'} <= children
+    assert all(span.trace_id == root.trace_id for span in spans)
+
+
+def test_tracing_is_off_by_default(make_sdk):
+    sdk = make_sdk({'getConfigletById.do': (200, {'key': 'c1'})})
+    assert sdk.tracer.enabled is False
+    with sdk.tracer.span('anything') as span:
+        span.set_attribute('ignored', True)
+    assert sdk.get_configlet_by_id('c1') == {'key': 'c1'}
+
+
+def test_open_telemetry_tracer(make_sdk):
+    pytest.importorskip('opentelemetry.sdk')
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter as OtelExporter
+
+    from arista_cvaas_sdk import OpenTelemetryTracer
+
+    otel_exporter = OtelExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(otel_exporter))
+    sdk = make_sdk({'getConfigletById.do': (200, {'key': 'c1'})},
+                   tracer=OpenTelemetryTracer(provider.get_tracer('tests')))
+    sdk.get_configlet_by_id('c1')
+    request, helper = otel_exporter.get_finished_spans()
+    assert (request.name, helper.name) == ('HTTP GET', 'get_configlet_by_id')
+    assert request.parent.span_id == helper.context.span_id
@@ -0,0 +1,47 @@
+import gzip
+import json
+
+from arista_cvaas_sdk import LatencyStats, TransferStats
+from arista_cvaas_sdk.transport import compress_json_body, endpoint_family
+
+
+def test_compress_json_body_threshold():
+    assert compress_json_body({'config': 'x'}) is None
+    body = {'config': 'ntp server 10.0.0.1\n' * 200}
+    compressed, size = compress_json_body(body)
+    assert size == len(json.dumps(body).encode())
+    assert json.loads(gzip.decompress(compressed)) == body
+
+
+def test_request_bodies_are_gzipped_only_when_enabled(make_sdk):
+    config = 'ntp server 10.0.0.1\n' * 200
+    for enabled in (False, True):
+        sdk = make_sdk({'addConfiglet.do': (200, {'data': 'ok'})}, compress_request_bodies=enabled)
+        assert sdk.post_create_configlet(config, 'ntp') == {'data': 'ok'}
+        (_, _, kwargs), = sdk.session.calls
+        if enabled:
+            assert json.loads(gzip.decompress(kwargs['data'])) == {'config': config, 'name': 'ntp'}
+        else:
+            assert kwargs['json'] == {'config': config, 'name': 'ntp'}
+
+
+def test_response_encoding_is_left_to_requests(make_sdk):
+    # requests already sends its default 'Accept-Encoding: gzip, deflate'; the SDK does not override it.
+    sdk = make_sdk({})
+    assert 'Accept-Encoding' not in sdk.headers
+
+
+def test_transfer_and_latency_stats(make_sdk):
+    sdk = make_sdk({'/inventory/devices': (200, [{'hostname': 'leaf1'}])})
+    sdk.get_inventory_devices()
+    stats = sdk.transfer_stats.stats()
+    assert stats['requests'] == 1 and stats['bytes_received_decoded'] == len(json.dumps([{'hostname': 'leaf1'}]))
+    assert sdk.latency_stats.stats()['/inventory/devices']['requests'] == 1
+    assert isinstance(TransferStats().stats()['encodings'], dict)
+
+    latency = LatencyStats(alpha=0.5)
+    latency.record('/a.do?x=1', 1.0)
+    latency.record('/a.do?x=2', 3.0)
+    assert latency.stats()['/a.do'] == {'requests': 2, 'mean': 2.0, 'recent': 2.0}
+    assert latency.latency('/a.do?y') == 2.0 and latency.latency('/b.do') is None
+    assert endpoint_family('/a.do?x=1') == '/a.do'